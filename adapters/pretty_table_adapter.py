@@ -22,7 +22,7 @@ class PrettyTableAdapter:
     def add_row(self, row: List[Any], color: Optional[AvailableTableRowColors]) -> None:
         """Add row to a table"""
         if color is None:
-            self._table.add_row(*row)
+            self._table.add_row(row)
         else:
             self._table.add_row(
                 [
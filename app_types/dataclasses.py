@@ -1,8 +1,14 @@
 """Application dataclasses"""
 
-from dataclasses import dataclass
-from typing import Optional
+import ast
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Callable, Sequence, TYPE_CHECKING
 from enums.table import SortingDirection, CliTableColumn
+from query_option_parser.nodes import WhereNode
+
+if TYPE_CHECKING:
+    from collectors.commit_stats_store import CommitStatsStore
+    from utils.table_data_calculator import TableDataCalculator
 
 
 @dataclass
@@ -14,6 +20,89 @@ class FileCommitStats:
     author: str
 
 
+@dataclass
+class AuthorStats:
+    """Dataclass for summed up stats of single author in a file"""
+
+    commit_count: int = 0
+    added_lines: int = 0
+    removed_lines: int = 0
+
+
+@dataclass
+class FileAggregate:
+    """
+    Dataclass for summed up stats of a file.
+    Authors are kept in order of their first appearance (newest commit first)
+    """
+
+    commit_count: int = 0
+    added_lines: int = 0
+    removed_lines: int = 0
+    ratio_sum: float = 0
+    authors: Dict[str, AuthorStats] = field(default_factory=dict)
+
+
+@dataclass
+class StatsCache:
+    """Dataclass for persisted file aggregates of a repository"""
+
+    last_commit: str
+    files: Dict[str, FileAggregate]
+
+
+@dataclass
+class FileStatsColumns:
+    """
+    Dataclass for column views of single file stats inside of commit stats store.
+    Author ids point into authors table, which is shared by all files
+    """
+
+    added_lines: Sequence[int]
+    removed_lines: Sequence[int]
+    author_ids: Sequence[int]
+    authors: List[str]
+
+
+@dataclass
+class NumstatEntry:
+    """Dataclass for single numstat entry, line counts are None for binary files"""
+
+    added_lines: Optional[int]
+    removed_lines: Optional[int]
+    old_path: Optional[str]
+    new_path: str
+
+
+@dataclass
+class NumstatCommit:
+    """Dataclass for single commit of numstat log"""
+
+    author: str
+    entries: List[NumstatEntry]
+
+
+@dataclass
+class RenameEvent:
+    """Dataclass for single file rename in git history"""
+
+    commit: str
+    old_path: str
+    new_path: str
+
+
+@dataclass
+class HistoryShard:
+    """
+    Dataclass for stats of commit range, which is scanned on its own.
+    Files are named as at the newest commit of range, aliases resolve
+    names of older commits to them, the same way RenameResolver does
+    """
+
+    store: "CommitStatsStore"
+    aliases: Dict[str, Optional[str]]
+
+
 @dataclass
 class SortingRule:
     """Dataclass for sorting rules"""
@@ -24,10 +113,53 @@ class SortingRule:
 
 @dataclass
 class GitLogOptions:
-    """Dataclass for storing git log options"""
+    """
+    Dataclass for storing git log options.
+    Line counts and authors can be skipped, when query does not need them.
+    Pathspecs limit history scan to some files, None scans all of them
+    """
 
     since: Optional[str]
     until: Optional[str]
+    line_counts: bool = True
+    authors: bool = True
+    pathspecs: Optional[List[str]] = None
+
+
+@dataclass
+class CollectionRequirements:
+    """Dataclass for raw git data, which is needed to calculate columns"""
+
+    commits: bool = False
+    line_counts: bool = False
+    authors: bool = False
+
+
+@dataclass
+class QueryPlan:
+    """
+    Dataclass for columns, which have to be calculated to execute query.
+    Conditions on file name only are taken out of where node,
+    to filter file list before collecting git stats.
+    File limit is set, when only first files of the list can reach the result
+    """
+
+    columns: List[CliTableColumn]
+    requirements: CollectionRequirements
+    where_node: Optional[WhereNode] = None
+    file_name_condition: Optional[ast.expr] = None
+    file_limit: Optional[int] = None
+
+
+@dataclass
+class CollectionOptions:
+    """Dataclass for storing options of git stats collection"""
+
+    collector: Callable[..., "CommitStatsStore"]
+    calculator: Callable[..., "TableDataCalculator"]
+    use_cache: bool
+    jobs: int
+    use_results_db: bool = False
 
 
 @dataclass
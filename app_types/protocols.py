@@ -1,8 +1,14 @@
 """Protocol classes for application"""
 
-from typing import Protocol, List, Any, Optional
+from typing import Protocol, List, Any, Optional, TYPE_CHECKING
 
-from enums.table import AvailableTableRowColors
+from app_types.dataclasses import GitLogOptions
+from collectors.commit_stats_store import CommitStatsStore
+from enums.table import AvailableTableRowColors, CliTableColumn
+from query_option_parser.nodes import StatementNode
+
+if TYPE_CHECKING:
+    from git import Git
 
 
 class CliTable(Protocol):
@@ -24,3 +30,30 @@ class CliTable(Protocol):
 
     def print(self) -> None:
         """Print table"""
+
+
+# pylint: disable = too-few-public-methods
+class StatsCollector(Protocol):
+    """Protocol for functions which collect git stats of files."""
+
+    def __call__(
+        self,
+        file_names: List[str],
+        git: "Git",
+        log_options: GitLogOptions,
+        jobs: int,
+    ) -> CommitStatsStore:
+        """Collect git stats for each file"""
+
+
+# pylint: disable = too-few-public-methods
+class QueryExecutor(Protocol):
+    """Protocol for functions which filter, sort and select calculated rows."""
+
+    def __call__(
+        self,
+        root_node: StatementNode,
+        column_names: List[CliTableColumn],
+        rows: List[List[Any]],
+    ) -> List[List[Any]]:
+        """Execute query over rows, which contain values of column names"""
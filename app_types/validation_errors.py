@@ -21,3 +21,30 @@ class InvalidTableLibraryError:
     user_input: str
     message: str
     severity: Severity
+
+
+@dataclass
+class InvalidCollectorError:
+    """Invalid git stats collector error"""
+
+    user_input: str
+    message: str
+    severity: Severity
+
+
+@dataclass
+class InvalidCalculatorError:
+    """Invalid table data calculator error"""
+
+    user_input: str
+    message: str
+    severity: Severity
+
+
+@dataclass
+class InvalidQueryBackendError:
+    """Invalid query backend error"""
+
+    user_input: str
+    message: str
+    severity: Severity
@@ -0,0 +1,204 @@
+"""Measuring, saving benchmark results and comparing them with baseline"""
+
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Any, Tuple, Type, Optional
+from click import option, Command
+
+from app_types.result import ResultOk
+from enums.application import CalculatorBackend
+from utils.calculator_factory import create_table_data_calculator
+from utils.table_data_calculator import TableDataCalculator
+
+DEFAULT_TOLERANCE = 0.2
+DEFAULT_REPEAT = 3
+MAIN_FILE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "main.py")
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """
+    Run function several times
+    :param func: Measured function
+    :param repeat: Amount of runs
+    :return: Fastest run time in seconds and result of last run
+    """
+    best_time = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best_time = min(best_time, time.perf_counter() - start)
+
+    return best_time, result
+
+
+def create_result(
+    seconds: float, items: int, unit: str, calls: int = 1
+) -> Dict[str, Any]:
+    """
+    Create benchmark result with throughput, cost of single call and single item
+    :param seconds: Time of all calls
+    :param items: Amount of processed items (files, commits, rows)
+    :param unit: Name of items
+    :param calls: Amount of calls
+    :return: Benchmark result
+    """
+    return {
+        "seconds": round(seconds, 6),
+        "items": items,
+        "unit": unit,
+        "items_per_second": round(items / seconds, 3) if seconds > 0 else None,
+        "calls": calls,
+        "per_call_seconds": seconds / calls,
+        "per_item_seconds": seconds / items if items > 0 else None,
+    }
+
+
+def get_available_calculators() -> List[Tuple[str, Type[TableDataCalculator]]]:
+    """Get table data calculators, optional ones are skipped if not installed"""
+    calculators: List[Tuple[str, Type[TableDataCalculator]]] = []
+    for calculator in CalculatorBackend:
+        calculator_result = create_table_data_calculator(calculator.value)
+        if isinstance(calculator_result, ResultOk):
+            calculators.append((calculator.value, calculator_result.value))
+
+    return calculators
+
+
+def compare_with_baseline(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float,
+) -> List[str]:
+    """
+    Find benchmarks, which throughput dropped below baseline more than tolerance
+    :param results: Current benchmark results by name
+    :param baseline: Baseline benchmark results by name
+    :param tolerance: Allowed drop of throughput, as fraction of baseline
+    :return: Description of each regression
+    """
+    regressions: List[str] = []
+    for name, baseline_result in baseline.items():
+        result = results.get(name)
+        if (
+            result is None
+            or result["items_per_second"] is None
+            or baseline_result["items_per_second"] is None
+        ):
+            continue
+
+        ratio = result["items_per_second"] / baseline_result["items_per_second"]
+        if ratio < 1 - tolerance:
+            regressions.append(
+                f"{name}: {result['items_per_second']} {result['unit']}/s, "
+                f"baseline {baseline_result['items_per_second']} "
+                f"{baseline_result['unit']}/s ({ratio - 1:+.1%})"
+            )
+
+    return regressions
+
+
+def save_results(
+    file_path: str, fixture: Dict[str, Any], results: Dict[str, Dict[str, Any]]
+) -> None:
+    """
+    Save benchmark results into JSON file
+    :param file_path: Path of JSON file
+    :param fixture: Parameters of data, which benchmarks were run on
+    :param results: Benchmark results by name
+    """
+    with open(file_path, "w", encoding="utf-8") as output_file:
+        json.dump(
+            {
+                "fixture": fixture,
+                "python": platform.python_version(),
+                "results": results,
+            },
+            output_file,
+            indent=2,
+        )
+
+
+def assert_no_regressions(
+    baseline_file_path: str,
+    fixture: Dict[str, Any],
+    results: Dict[str, Dict[str, Any]],
+    tolerance: float,
+) -> None:
+    """
+    Compare benchmark results with baseline JSON file, exit if there are regressions
+    :param baseline_file_path: Path of baseline JSON file
+    :param fixture: Parameters of data, which benchmarks were run on
+    :param results: Benchmark results by name
+    :param tolerance: Allowed drop of throughput, as fraction of baseline
+    """
+    with open(baseline_file_path, "r", encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline["fixture"] != fixture:
+        print("Baseline was recorded on other data")
+
+    regressions = compare_with_baseline(results, baseline["results"], tolerance)
+    if len(regressions) > 0:
+        print("Regressions against baseline:")
+        print("\n".join(regressions))
+        sys.exit(1)
+    print("No regressions against baseline")
+
+
+def print_results(results: Dict[str, Dict[str, Any]]) -> None:
+    """Print time, cost of single call, single item and throughput of each benchmark"""
+    for name, result in results.items():
+        per_item = (
+            f"{result['per_item_seconds'] * 1e9:>14.1f} ns/item"
+            f"{result['items_per_second']:>16.1f} {result['unit']}/s"
+            if result["per_item_seconds"] is not None
+            and result["items_per_second"] is not None
+            else ""
+        )
+        print(
+            f"{name:<40}{result['seconds']:>10.4f} s"
+            f"{result['per_call_seconds'] * 1e6:>16.1f} us/call{per_item}"
+        )
+
+
+def report_results(
+    results: Dict[str, Dict[str, Any]],
+    fixture: Dict[str, Any],
+    output: Optional[str],
+    baseline: Optional[str],
+    tolerance: float,
+) -> None:
+    """
+    Print benchmark results, save them and compare them with baseline if requested
+    :param results: Benchmark results by name
+    :param fixture: Parameters of data, which benchmarks were run on
+    :param output: Path of JSON file, where results are saved
+    :param baseline: Path of baseline JSON file
+    :param tolerance: Allowed drop of throughput, as fraction of baseline
+    """
+    print_results(results)
+    if output is not None:
+        save_results(output, fixture, results)
+    if baseline is not None:
+        assert_no_regressions(baseline, fixture, results, tolerance)
+
+
+def benchmark_options(func) -> Command:
+    """Options of repeating benchmarks, saving results and comparing with baseline"""
+    func = option(
+        "--tolerance",
+        default=DEFAULT_TOLERANCE,
+        help="Allowed throughput drop against baseline, as fraction",
+    )(func)
+    func = option("--baseline", default=None, help="Path of JSON file to compare with")(
+        func
+    )
+    func = option("--output", default=None, help="Path of JSON file with results")(func)
+    return option(
+        "--repeat",
+        default=DEFAULT_REPEAT,
+        help="Runs of each benchmark, fastest is kept",
+    )(func)
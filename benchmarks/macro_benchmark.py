@@ -0,0 +1,191 @@
+"""
+Macro benchmarks of git_hot pipeline and its stages over synthetic repositories.
+Run from repository root: python -m benchmarks.macro_benchmark --help
+"""
+
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict
+from typing import Dict, List, Optional, Any
+import click
+from git import Repo
+
+from app_types.dataclasses import GitLogOptions
+from benchmarks.benchmark_results import (
+    measure,
+    create_result,
+    get_available_calculators,
+    report_results,
+    benchmark_options,
+    MAIN_FILE_PATH,
+)
+from benchmarks.synthetic_repo import SyntheticRepoShape, create_synthetic_repo
+from collectors.collector_factory import create_stats_collector
+from defaults.command import DEFAULT_PATHNAME_LENGTH, DEFAULT_JOBS
+from enums.application import CollectorBackend, QueryBackend
+from repositories.query_backend_factory import create_query_executor
+from utils.command_option_parser import parse_option_query
+from utils.git_utils import get_flat_file_tree
+from utils.query_planner import plan_all_columns
+
+BENCHMARK_QUERY = (
+    "SHOW filename, commitcount, linecount, daratio, mfauthor FROM {path} "
+    "WHERE linecount > 10 ORDERBY daratio DESC"
+)
+
+
+def run_pipeline(repo_path: str, collector: str, query_backend: str) -> None:
+    """Run whole git_hot command in new process, same way as it is run by user"""
+    subprocess.run(
+        [
+            sys.executable,
+            MAIN_FILE_PATH,
+            f"--query={BENCHMARK_QUERY.format(path=repo_path)}",
+            f"--collector={collector}",
+            f"--query-backend={query_backend}",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+
+
+# pylint: disable = too-many-locals
+def run_benchmarks(
+    repo_path: str, shape: SyntheticRepoShape, repeat: int, jobs: int
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run whole pipeline and each of its stages on its own
+    :param repo_path: Path to synthetic repository
+    :param shape: Shape of synthetic repository
+    :param repeat: Amount of runs of each benchmark, fastest one is kept
+    :param jobs: Amount of jobs for parallel collectors
+    :return: Benchmark results by name
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    repo = Repo(repo_path)
+    query_plan = plan_all_columns()
+    log_options = GitLogOptions(None, None)
+
+    seconds, file_names = measure(
+        lambda: get_flat_file_tree(repo.head.commit.tree, repo_path), repeat
+    )
+    results["file_tree"] = create_result(seconds, len(file_names), "files")
+
+    stores = {}
+    for collector in CollectorBackend:
+        collect = create_stats_collector(collector.value).value
+        seconds, stores[collector] = measure(
+            lambda collect=collect: collect(file_names, repo.git, log_options, jobs),
+            repeat,
+        )
+        results[f"collect/{collector.value}"] = create_result(
+            seconds, shape.commits, "commits"
+        )
+
+    rows: List[List[Any]] = []
+    for calculator_name, calculator in get_available_calculators():
+        data_calculator = calculator(
+            file_names,
+            stores[CollectorBackend.HISTORY],
+            pathname_length=DEFAULT_PATHNAME_LENGTH,
+        )
+        seconds, rows = measure(
+            lambda data_calculator=data_calculator: data_calculator.calculate_data(
+                query_plan.columns
+            ),
+            repeat,
+        )
+        results[f"calculate/{calculator_name}"] = create_result(
+            seconds, len(rows), "rows"
+        )
+
+    root_node = parse_option_query(BENCHMARK_QUERY.format(path=repo_path)).value
+    for query_backend in QueryBackend:
+        execute_query = create_query_executor(query_backend.value).value
+        seconds, _ = measure(
+            lambda execute_query=execute_query: execute_query(
+                root_node, query_plan.columns, rows
+            ),
+            repeat,
+        )
+        results[f"query/{query_backend.value}"] = create_result(
+            seconds, len(rows), "rows"
+        )
+
+    for collector in CollectorBackend:
+        seconds, _ = measure(
+            lambda collector=collector: run_pipeline(
+                repo_path, collector.value, QueryBackend.MEMORY.value
+            ),
+            repeat,
+        )
+        results[f"pipeline/{collector.value}"] = create_result(
+            seconds, shape.commits, "commits"
+        )
+
+    return results
+
+
+def get_git_version() -> str:
+    """Get version of git, which is used by benchmarks"""
+    return subprocess.run(
+        ["git", "--version"], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@click.command()
+@click.option("--files", default=SyntheticRepoShape.files, help="Amount of files")
+@click.option("--commits", default=SyntheticRepoShape.commits, help="Amount of commits")
+@click.option("--authors", default=SyntheticRepoShape.authors, help="Amount of authors")
+@click.option(
+    "--rename-rate",
+    default=SyntheticRepoShape.rename_rate,
+    help="Share of commits, which rename a file",
+)
+@click.option(
+    "--binary-share",
+    default=SyntheticRepoShape.binary_share,
+    help="Share of binary files",
+)
+@click.option("--seed", default=SyntheticRepoShape.seed, help="Random seed")
+@click.option("--jobs", default=DEFAULT_JOBS, help="Jobs of parallel collectors")
+@click.option(
+    "--repo-dir",
+    default=f"{tempfile.gettempdir()}/git-gut-benchmarks",
+    help="Directory, where synthetic repositories are created and reused",
+)
+@benchmark_options
+# pylint: disable = too-many-arguments
+# pylint: disable = too-many-positional-arguments
+def macro_benchmark(
+    files: int,
+    commits: int,
+    authors: int,
+    rename_rate: float,
+    binary_share: float,
+    seed: int,
+    jobs: int,
+    repo_dir: str,
+    repeat: int,
+    output: Optional[str],
+    baseline: Optional[str],
+    tolerance: float,
+):
+    """Benchmark git_hot over deterministic synthetic repository"""
+    shape = SyntheticRepoShape(files, commits, authors, rename_rate, binary_share, seed)
+    repo_path = create_synthetic_repo(repo_dir, shape)
+    results = run_benchmarks(repo_path, shape, repeat, jobs)
+    report_results(
+        results,
+        {**asdict(shape), "git": get_git_version()},
+        output,
+        baseline,
+        tolerance,
+    )
+
+
+if __name__ == "__main__":
+    # pylint: disable = no-value-for-parameter
+    macro_benchmark()
@@ -0,0 +1,226 @@
+"""
+Microbenchmarks of CPU bound stages over large in memory fixtures, without git.
+Run from repository root: python -m benchmarks.micro_benchmark --help
+"""
+
+import contextlib
+import os
+import random
+from array import array
+from typing import Dict, List, Optional, Any, Callable
+import click
+
+from adapters.pretty_table_adapter import PrettyTableAdapter
+from adapters.rich_table_adapters import RichTableAdapter
+from app_types.protocols import CliTable
+from benchmarks.benchmark_results import (
+    measure,
+    create_result,
+    get_available_calculators,
+    report_results,
+    benchmark_options,
+)
+from collectors.commit_stats_store import (
+    CommitStatsStore,
+    STATS_ARRAY_TYPE,
+    OFFSETS_ARRAY_TYPE,
+)
+from defaults.command import DEFAULT_PATHNAME_LENGTH
+from enums.table import AvailableTableRowColors
+from query_option_parser.parser_utils import split_sort_rule_string
+from query_option_parser.transformers import transform_ast_bool_op_to_orm_filters
+from utils.cli_table import draw_flat_tree_table
+from utils.command_option_parser import parse_option_query
+from utils.query_planner import plan_all_columns
+
+BENCHMARK_QUERY = (
+    "SHOW filename, commitcount, linecount, daratio FROM ./ "
+    "WHERE linecount > 100 and (daratio < 0.5 or commitcount >= 10) "
+    "ORDERBY daratio DESC and linecount ASC LIMIT 100"
+)
+BENCHMARK_SORT_RULE = "daratio DESC"
+FILES_PER_DIRECTORY = 100
+
+
+# pylint: disable = too-few-public-methods
+class NullTable:
+    """Table, which keeps nothing, to measure cost of table drawing on its own"""
+
+    def __init__(self):
+        """Constructor"""
+        self.field_names: List[str] = []
+
+    def add_row(self, row: Any, color: Optional[AvailableTableRowColors]) -> None:
+        """Ignore row"""
+
+    def print(self) -> None:
+        """Print nothing"""
+
+
+def create_commit_stats_fixture(
+    files: int, records: int, authors: int, seed: int
+) -> CommitStatsStore:
+    """
+    Create store of random commit stats, records are spread evenly over files
+    :param files: Amount of files
+    :param records: Amount of commit records of all files
+    :param authors: Amount of authors, at most 256
+    :param seed: Random seed
+    :return: Commit stats store
+    """
+    rng = random.Random(seed)
+    records_per_file = max(1, records // files)
+    offsets = array(
+        OFFSETS_ARRAY_TYPE,
+        (index * records_per_file for index in range(files + 1)),
+    )
+    total_records = offsets[-1]
+    author_ids = array(
+        STATS_ARRAY_TYPE,
+        (author_id % authors for author_id in rng.randbytes(total_records)),
+    )
+
+    return CommitStatsStore(
+        [
+            f"src/module_{index // FILES_PER_DIRECTORY}/file_{index}.py"
+            for index in range(files)
+        ],
+        offsets,
+        (
+            array(STATS_ARRAY_TYPE, array("B", rng.randbytes(total_records))),
+            array(STATS_ARRAY_TYPE, array("B", rng.randbytes(total_records))),
+            author_ids,
+        ),
+        [f"Author {index}" for index in range(authors)],
+    )
+
+
+def repeat_calls(func: Callable[[], Any], calls: int) -> Callable[[], None]:
+    """Create function, which calls function several times"""
+
+    def call_several_times() -> None:
+        for _ in range(calls):
+            func()
+
+    return call_several_times
+
+
+def draw_table(
+    rows: List[List[Any]], table_factory: Callable[[], CliTable]
+) -> Callable[[], None]:
+    """Create function, which draws rows into new table, printed output is discarded"""
+    column_names = plan_all_columns().columns
+
+    def draw() -> None:
+        with open(os.devnull, "w", encoding="utf-8") as devnull:
+            with contextlib.redirect_stdout(devnull):
+                draw_flat_tree_table(column_names, rows, table_factory())
+
+    return draw
+
+
+# pylint: disable = too-many-locals
+def run_benchmarks(
+    store: CommitStatsStore, calls: int, render_rows: int, repeat: int
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run every microbenchmark
+    :param store: Commit stats store fixture
+    :param calls: Amount of calls of parser and transformers
+    :param render_rows: Amount of rows drawn into tables
+    :param repeat: Amount of runs of each benchmark, fastest one is kept
+    :return: Benchmark results by name
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+
+    seconds, _ = measure(
+        repeat_calls(lambda: parse_option_query(BENCHMARK_QUERY), calls), repeat
+    )
+    results["parse_option_query"] = create_result(seconds, calls, "calls", calls)
+
+    seconds, _ = measure(
+        repeat_calls(lambda: split_sort_rule_string(BENCHMARK_SORT_RULE), calls),
+        repeat,
+    )
+    results["split_sort_rule_string"] = create_result(seconds, calls, "calls", calls)
+
+    condition_node = parse_option_query(BENCHMARK_QUERY).value.where_node.condition_node
+    seconds, _ = measure(
+        repeat_calls(
+            lambda: transform_ast_bool_op_to_orm_filters(condition_node), calls
+        ),
+        repeat,
+    )
+    results["transform_ast_bool_op_to_orm_filters"] = create_result(
+        seconds, calls, "calls", calls
+    )
+
+    columns = plan_all_columns().columns
+    file_names = store.file_names
+    rows: List[List[Any]] = []
+    for calculator_name, calculator in get_available_calculators():
+        data_calculator = calculator(
+            file_names, store, pathname_length=DEFAULT_PATHNAME_LENGTH
+        )
+        seconds, rows = measure(
+            lambda data_calculator=data_calculator: data_calculator.calculate_data(
+                columns
+            ),
+            repeat,
+        )
+        results[f"calculate_data/{calculator_name}"] = create_result(
+            seconds, len(rows), "rows"
+        )
+        results[f"calculate_data/{calculator_name}/records"] = create_result(
+            seconds, store.offsets[-1], "records"
+        )
+
+    rendered_rows = rows[:render_rows]
+    for name, table_factory in [
+        ("draw_flat_tree_table", NullTable),
+        ("table/pretty", PrettyTableAdapter),
+        ("table/rich", RichTableAdapter),
+    ]:
+        seconds, _ = measure(draw_table(rendered_rows, table_factory), repeat)
+        results[name] = create_result(seconds, len(rendered_rows), "rows")
+
+    return results
+
+
+@click.command()
+@click.option("--files", default=100_000, help="Amount of files")
+@click.option("--records", default=10_000_000, help="Amount of commit records")
+@click.option("--authors", default=50, help="Amount of authors, at most 256")
+@click.option("--seed", default=0, help="Random seed")
+@click.option("--calls", default=10_000, help="Calls of parser and transformers")
+@click.option("--render-rows", default=10_000, help="Rows drawn into tables")
+@benchmark_options
+# pylint: disable = too-many-arguments
+# pylint: disable = too-many-positional-arguments
+def micro_benchmark(
+    files: int,
+    records: int,
+    authors: int,
+    seed: int,
+    calls: int,
+    render_rows: int,
+    repeat: int,
+    output: Optional[str],
+    baseline: Optional[str],
+    tolerance: float,
+):
+    """Benchmark CPU bound stages of git_hot over in memory fixtures"""
+    store = create_commit_stats_fixture(files, records, min(authors, 256), seed)
+    results = run_benchmarks(store, calls, render_rows, repeat)
+    report_results(
+        results,
+        {"files": files, "records": records, "authors": authors, "seed": seed},
+        output,
+        baseline,
+        tolerance,
+    )
+
+
+if __name__ == "__main__":
+    # pylint: disable = no-value-for-parameter
+    micro_benchmark()
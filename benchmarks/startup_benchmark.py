@@ -0,0 +1,107 @@
+"""
+Cold start benchmark of git_hot options, which do not execute queries.
+Run from repository root: python -m benchmarks.startup_benchmark --help
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Set
+import click
+
+from benchmarks.benchmark_results import (
+    measure,
+    create_result,
+    report_results,
+    benchmark_options,
+    MAIN_FILE_PATH,
+)
+
+STARTUP_COMMANDS = {
+    "help": ["--help"],
+    "list_queries": ["--list-queries"],
+    "remove_missing_query": ["--remove-query=startup-benchmark-missing-query"],
+}
+HEAVY_MODULES = {"git", "sqlalchemy", "rich", "prettytable", "halo", "pydash", "numpy"}
+
+
+def run_command(arguments: List[str], env: Optional[Dict[str, str]] = None) -> str:
+    """
+    Run git_hot in new Python process, while import time of every module is logged
+    :param arguments: Command line arguments of git_hot
+    :param env: Environment variables, current ones if omitted
+    :return: Import time log
+    """
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", MAIN_FILE_PATH, *arguments],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+        check=True,
+    ).stderr
+
+
+def get_imported_modules(
+    arguments: List[str], env: Optional[Dict[str, str]] = None
+) -> Set[str]:
+    """
+    Get top level packages, which are imported by git_hot with given arguments
+    :param arguments: Command line arguments of git_hot
+    :param env: Environment variables, current ones if omitted
+    :return: Names of top level packages and modules
+    """
+    modules: Set[str] = set()
+    for line in run_command(arguments, env).splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            module_name = line.rsplit("|", 1)[1].strip()
+            modules.add(module_name.split(".")[0])
+
+    return modules
+
+
+@click.command()
+@benchmark_options
+def startup_benchmark(
+    repeat: int,
+    output: Optional[str],
+    baseline: Optional[str],
+    tolerance: float,
+):
+    """Benchmark cold start of git_hot options, which do not need git or query libraries"""
+    results = {}
+    heavy_imports: Dict[str, Set[str]] = {}
+    for name, arguments in STARTUP_COMMANDS.items():
+        seconds, _ = measure(
+            lambda arguments=arguments: subprocess.run(
+                [sys.executable, MAIN_FILE_PATH, *arguments],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            ),
+            repeat,
+        )
+        results[name] = create_result(seconds, 1, "runs")
+        heavy_imports[name] = get_imported_modules(arguments) & HEAVY_MODULES
+
+    seconds, _ = measure(
+        lambda: subprocess.run([sys.executable, "-c", "pass"], check=True), repeat
+    )
+    results["python"] = create_result(seconds, 1, "runs")
+
+    report_results(
+        results,
+        {"commands": STARTUP_COMMANDS, "executable": os.path.basename(sys.executable)},
+        output,
+        baseline,
+        tolerance,
+    )
+    for name, modules in heavy_imports.items():
+        if len(modules) > 0:
+            print(f"{name} imports heavy libraries: {', '.join(sorted(modules))}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    # pylint: disable = no-value-for-parameter
+    startup_benchmark()
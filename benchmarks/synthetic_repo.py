@@ -0,0 +1,190 @@
+"""Deterministic synthetic git repositories, which are used by benchmarks"""
+
+import os
+import random
+import shutil
+import subprocess
+from dataclasses import dataclass
+from typing import List, Dict, Iterator
+
+FILES_PER_DIRECTORY = 50
+LINES_PER_FILE = 20
+MAX_FILES_PER_COMMIT = 5
+START_TIMESTAMP = 1_600_000_000
+COMMIT_INTERVAL_SECONDS = 3600
+
+
+@dataclass(frozen=True)
+class SyntheticRepoShape:
+    """Dataclass for shape of synthetic repository"""
+
+    files: int = 1000
+    commits: int = 2000
+    authors: int = 20
+    rename_rate: float = 0.05
+    binary_share: float = 0.05
+    seed: int = 0
+
+    @property
+    def key(self) -> str:
+        """Unique name of repository with this shape"""
+        return (
+            f"f{self.files}-c{self.commits}-a{self.authors}"
+            f"-r{self.rename_rate}-b{self.binary_share}-s{self.seed}"
+        )
+
+
+def _format_data(content: bytes) -> bytes:
+    """
+    Format content as fast-import data command
+    This function should not be called directly
+    """
+    return b"data %d\n%s\n" % (len(content), content)
+
+
+def _create_text_content(rng: random.Random, line_amount: int) -> List[bytes]:
+    """
+    Create lines of text file
+    This function should not be called directly
+    """
+    return [b"line %d" % rng.randrange(1_000_000) for _ in range(line_amount)]
+
+
+def _create_binary_content(rng: random.Random) -> bytes:
+    """
+    Create content of binary file, NUL bytes make git treat it as binary
+    This function should not be called directly
+    """
+    return b"\0" + bytes(rng.randrange(256) for _ in range(64))
+
+
+def _modify_text_content(rng: random.Random, lines: List[bytes]) -> None:
+    """
+    Remove few random lines of text file and append few new ones
+    This function should not be called directly
+    """
+    for _ in range(min(len(lines), rng.randint(0, 2))):
+        lines.pop(rng.randrange(len(lines)))
+    lines.extend(_create_text_content(rng, rng.randint(0, 3)))
+
+
+def _get_file_name(index: int, binary: bool, rename_count: int = 0) -> str:
+    """
+    Get path of file, renamed file gets suffix of its rename count
+    This function should not be called directly
+    """
+    suffix = f"_r{rename_count}" if rename_count > 0 else ""
+    extension = "bin" if binary else "txt"
+    return f"src/module_{index // FILES_PER_DIRECTORY}/file_{index}{suffix}.{extension}"
+
+
+def _create_identity(author: int, commit_index: int) -> bytes:
+    """
+    Create author identity with commit time, commits are one interval apart
+    This function should not be called directly
+    """
+    timestamp = START_TIMESTAMP + commit_index * COMMIT_INTERVAL_SECONDS
+    return b"Author %d <author%d@example.com> %d +0000" % (author, author, timestamp)
+
+
+def generate_fast_import_stream(shape: SyntheticRepoShape) -> Iterator[bytes]:
+    """
+    Generate git fast-import commands of synthetic repository.
+    First commit adds all files, every next one modifies few files
+    of random author, part of commits also rename a text file
+    :param shape: Shape of repository
+    :return: Iterator of fast-import command chunks
+    """
+    rng = random.Random(shape.seed)
+    binary_files = {
+        index for index in range(shape.files) if rng.random() < shape.binary_share
+    }
+    names = [
+        _get_file_name(index, index in binary_files) for index in range(shape.files)
+    ]
+    rename_counts = [0] * shape.files
+    text_contents: Dict[int, List[bytes]] = {
+        index: _create_text_content(rng, LINES_PER_FILE)
+        for index in range(shape.files)
+        if index not in binary_files
+    }
+    text_files = sorted(text_contents)
+
+    for commit_index in range(shape.commits):
+        identity = _create_identity(rng.randrange(shape.authors), commit_index)
+        commands = [
+            b"commit refs/heads/main\n",
+            b"mark :%d\n" % (commit_index + 1),
+            b"author %s\n" % identity,
+            b"committer %s\n" % identity,
+            _format_data(b"Commit %d" % commit_index),
+        ]
+        if commit_index > 0:
+            commands.append(b"from :%d\n" % commit_index)
+
+        if commit_index == 0:
+            changed_files = list(range(shape.files))
+        else:
+            changed_files = rng.sample(
+                range(shape.files),
+                min(shape.files, rng.randint(1, MAX_FILES_PER_COMMIT)),
+            )
+            if text_files and rng.random() < shape.rename_rate:
+                renamed_file = rng.choice(text_files)
+                rename_counts[renamed_file] += 1
+                new_name = _get_file_name(
+                    renamed_file, False, rename_counts[renamed_file]
+                )
+                commands.append(f"R {names[renamed_file]} {new_name}\n".encode())
+                names[renamed_file] = new_name
+                changed_files = [
+                    index for index in changed_files if index != renamed_file
+                ]
+
+        for index in changed_files:
+            if index in binary_files:
+                content = _create_binary_content(rng)
+            else:
+                if commit_index > 0:
+                    _modify_text_content(rng, text_contents[index])
+                content = b"\n".join(text_contents[index]) + b"\n"
+            commands.append(f"M 100644 inline {names[index]}\n".encode())
+            commands.append(_format_data(content))
+
+        commands.append(b"\n")
+        yield b"".join(commands)
+
+
+def create_synthetic_repo(path: str, shape: SyntheticRepoShape) -> str:
+    """
+    Create synthetic repository, existing repository of same shape is reused,
+    as repository is always created same for same shape
+    :param path: Directory, where repositories are kept
+    :param shape: Shape of repository
+    :return: Path to the repository
+    """
+    repo_path = os.path.join(path, shape.key)
+    if os.path.isdir(os.path.join(repo_path, ".git")):
+        return repo_path
+
+    temporary_path = f"{repo_path}.tmp"
+    shutil.rmtree(temporary_path, ignore_errors=True)
+    subprocess.run(
+        ["git", "init", "--quiet", "--initial-branch=main", temporary_path], check=True
+    )
+    with subprocess.Popen(
+        ["git", "fast-import", "--quiet"], cwd=temporary_path, stdin=subprocess.PIPE
+    ) as process:
+        for chunk in generate_fast_import_stream(shape):
+            process.stdin.write(chunk)
+        process.stdin.close()
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(process.returncode, "git fast-import")
+    subprocess.run(
+        ["git", "checkout", "--quiet", "--force", "main"],
+        cwd=temporary_path,
+        check=True,
+    )
+    os.replace(temporary_path, repo_path)
+
+    return repo_path
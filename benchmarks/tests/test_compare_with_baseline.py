@@ -0,0 +1,24 @@
+"""Test compare_with_baseline"""
+
+from benchmarks.benchmark_results import compare_with_baseline, create_result
+
+
+def test_no_regressions() -> None:
+    """Throughput within tolerance is not a regression."""
+    baseline = {"collect/history": create_result(1.0, 100, "commits")}
+    results = {"collect/history": create_result(1.1, 100, "commits")}
+    assert not compare_with_baseline(results, baseline, 0.2)
+
+
+def test_regression() -> None:
+    """Throughput drop over tolerance is reported."""
+    baseline = {"collect/history": create_result(1.0, 100, "commits")}
+    results = {"collect/history": create_result(2.0, 100, "commits")}
+    regressions = compare_with_baseline(results, baseline, 0.2)
+    assert len(regressions) == 1 and regressions[0].startswith("collect/history")
+
+
+def test_missing_benchmarks_are_skipped() -> None:
+    """Benchmarks, which are missing in current results, are not compared."""
+    baseline = {"calculate/numpy": create_result(1.0, 100, "rows")}
+    assert not compare_with_baseline({}, baseline, 0.2)
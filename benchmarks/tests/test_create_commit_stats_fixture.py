@@ -0,0 +1,18 @@
+"""Test create_commit_stats_fixture"""
+
+from benchmarks.micro_benchmark import create_commit_stats_fixture
+
+
+def test_fixture_shape() -> None:
+    """Records are spread evenly over files, author ids are inside of authors table."""
+    store = create_commit_stats_fixture(files=10, records=100, authors=3, seed=0)
+    assert len(store) == 10
+    assert all(len(store.get_file_range(name)) == 10 for name in store.file_names)
+    assert len(store.authors) == 3 and max(store.columns[2]) < 3
+
+
+def test_fixture_is_deterministic() -> None:
+    """Same seed produces same commit stats."""
+    first = create_commit_stats_fixture(files=5, records=50, authors=4, seed=1)
+    second = create_commit_stats_fixture(files=5, records=50, authors=4, seed=1)
+    assert first.columns == second.columns
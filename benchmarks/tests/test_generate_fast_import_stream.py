@@ -0,0 +1,31 @@
+"""Test generate_fast_import_stream"""
+
+from benchmarks.synthetic_repo import SyntheticRepoShape, generate_fast_import_stream
+
+
+def test_stream_is_deterministic() -> None:
+    """Same shape always produces same repository."""
+    shape = SyntheticRepoShape(files=20, commits=30, rename_rate=0.5)
+    assert list(generate_fast_import_stream(shape)) == list(
+        generate_fast_import_stream(shape)
+    )
+
+
+def test_seed_changes_stream() -> None:
+    """Other seed produces other repository."""
+    first = list(generate_fast_import_stream(SyntheticRepoShape(20, 30, seed=1)))
+    second = list(generate_fast_import_stream(SyntheticRepoShape(20, 30, seed=2)))
+    assert first != second
+
+
+def test_commit_amount_and_renames() -> None:
+    """Every commit is generated, renames happen only when rename rate is set."""
+    without_renames = list(
+        generate_fast_import_stream(SyntheticRepoShape(20, 30, rename_rate=0))
+    )
+    with_renames = list(
+        generate_fast_import_stream(SyntheticRepoShape(20, 30, rename_rate=1))
+    )
+    assert len(without_renames) == len(with_renames) == 30
+    assert not any(b"\nR " in commit for commit in without_renames)
+    assert all(b"\nR " in commit for commit in with_renames[1:])
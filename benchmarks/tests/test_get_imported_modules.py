@@ -0,0 +1,17 @@
+"""Test get_imported_modules"""
+
+import os
+import pytest
+from benchmarks.startup_benchmark import (
+    get_imported_modules,
+    STARTUP_COMMANDS,
+    HEAVY_MODULES,
+)
+
+
+@pytest.mark.parametrize("arguments", STARTUP_COMMANDS.values())
+def test_terminating_options_skip_heavy_libraries(arguments, tmp_path) -> None:
+    """Help and stored query options do not import git, database or table libraries."""
+    modules = get_imported_modules(arguments, {**os.environ, "HOME": str(tmp_path)})
+    assert "click" in modules
+    assert not modules & HEAVY_MODULES
@@ -0,0 +1,129 @@
+"""Collector which streams git output of asyncio subprocesses, one per file"""
+
+import asyncio
+from asyncio.subprocess import PIPE, DEVNULL
+from typing import List, Iterable
+from git import Git
+from app_types.dataclasses import GitLogOptions, NumstatCommit
+from collectors.commit_stats_store import CommitStatsStore, CommitStatsStoreBuilder
+from collectors.numstat_parser import (
+    READ_CHUNK_SIZE,
+    NumstatStreamParser,
+    get_numstat_log_arguments,
+    iter_numstat_entries,
+)
+from collectors.rename_graph import (
+    RenameResolver,
+    build_rename_graph,
+    get_files_history_names,
+)
+from defaults.command import DEFAULT_JOBS
+from utils.git_utils import get_renamed_file_log_arguments
+from utils.profiler import record_git_process, record_git_output
+
+
+async def _read_file_stats(
+    repo_path: str,
+    file_name: str,
+    history_names: List[str],
+    log_options: GitLogOptions,
+    builder: CommitStatsStoreBuilder,
+) -> None:
+    """
+    Run git log of single file and parse its output while it is streamed
+    This function should not be called directly
+    :param repo_path: Path to the repository
+    :param file_name: File name
+    :param history_names: All names file had in history
+    :param log_options: Git log options
+    :param builder: Commit stats store builder, which receives stats of the file
+    :return: Explicitly return None
+    """
+    process = await asyncio.create_subprocess_exec(
+        "git",
+        "log",
+        *get_numstat_log_arguments(
+            *get_renamed_file_log_arguments(log_options, history_names),
+            line_counts=log_options.line_counts,
+            authors=log_options.authors,
+        ),
+        cwd=repo_path,
+        stdout=PIPE,
+        stderr=DEVNULL,
+    )
+    record_git_process()
+
+    builder.add_file(file_name)
+    resolver = RenameResolver()
+    parser = NumstatStreamParser(log_options.line_counts)
+
+    def add_commits(commits: Iterable[NumstatCommit]) -> None:
+        """Keep stats of commits, which belong to the file"""
+        for author, added_lines, removed_lines, path in iter_numstat_entries(
+            commits, resolver
+        ):
+            if path == file_name:
+                builder.add_stat(file_name, added_lines, removed_lines, author)
+
+    while chunk := await process.stdout.read(READ_CHUNK_SIZE):
+        record_git_output(len(chunk))
+        add_commits(parser.feed(chunk))
+    add_commits(parser.close())
+
+    await process.wait()
+    return None
+
+
+async def _collect_stats_all_files(
+    repo_path: str, file_names: List[str], log_options: GitLogOptions, jobs: int
+) -> CommitStatsStore:
+    """
+    Start git process for each file, while keeping at most jobs processes running.
+    Producer waits for free slot before starting next process
+    This function should not be called directly
+    :param repo_path: Path to the repository
+    :param file_names: List of all file names
+    :param log_options: Git log options
+    :param jobs: Amount of concurrent git processes
+    :return: Commit stats store of all files
+    """
+    semaphore = asyncio.Semaphore(jobs)
+    builder = CommitStatsStoreBuilder()
+    history_names = get_files_history_names(
+        build_rename_graph(Git(repo_path)), file_names
+    )
+
+    async def consume(file_name: str) -> None:
+        """Collect stats of single file and free the slot"""
+        try:
+            await _read_file_stats(
+                repo_path, file_name, history_names[file_name], log_options, builder
+            )
+        finally:
+            semaphore.release()
+
+    async with asyncio.TaskGroup() as task_group:
+        for file_name in file_names:
+            await semaphore.acquire()
+            task_group.create_task(consume(file_name))
+
+    return builder.build()
+
+
+def get_async_subprocess_files_stats(
+    file_names: List[str],
+    git: Git,
+    log_options: GitLogOptions,
+    jobs: int = DEFAULT_JOBS,
+) -> CommitStatsStore:
+    """
+    Return git stats for all specified files, collected by asyncio subprocesses
+    :param file_names: All specified file names for which we need to collect stats
+    :param git: Git instance
+    :param log_options: Git log options
+    :param jobs: Amount of concurrent git processes
+    :return: Commit stats store of all files
+    """
+    return asyncio.run(
+        _collect_stats_all_files(str(git.working_dir), file_names, log_options, jobs)
+    )
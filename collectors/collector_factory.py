@@ -0,0 +1,40 @@
+"""Factory of git stats collectors"""
+
+from app_types.protocols import StatsCollector
+from app_types.result import ResultOk, ResultUnion, ResultValidationError
+from app_types.validation_errors import InvalidCollectorError
+from collectors.async_subprocess_collector import get_async_subprocess_files_stats
+from collectors.history_collector import get_history_files_stats
+from collectors.process_pool_collector import get_process_pool_files_stats
+from collectors.sharded_history_collector import get_sharded_history_files_stats
+from command_interface.help_text import AVAILABLE_COLLECTORS_TEXT
+from enums.application import CollectorBackend, Severity
+from utils.git_utils import get_all_files_stats
+
+
+def create_stats_collector(
+    collector_option: str,
+) -> ResultUnion[StatsCollector, InvalidCollectorError]:
+    """Create requested git stats collector"""
+    match collector_option:
+        case CollectorBackend.PER_FILE.value:
+            return ResultOk(get_all_files_stats)
+        case CollectorBackend.HISTORY.value:
+            return ResultOk(get_history_files_stats)
+        case CollectorBackend.PROCESS_POOL.value:
+            return ResultOk(get_process_pool_files_stats)
+        case CollectorBackend.ASYNC_SUBPROCESS.value:
+            return ResultOk(get_async_subprocess_files_stats)
+        case CollectorBackend.SHARDED_HISTORY.value:
+            return ResultOk(get_sharded_history_files_stats)
+
+    return ResultValidationError(
+        collector_option,
+        [
+            InvalidCollectorError(
+                collector_option,
+                f"Please specify correct collector, one of: {AVAILABLE_COLLECTORS_TEXT}",
+                Severity.CRITICAL,
+            )
+        ],
+    )
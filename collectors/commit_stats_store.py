@@ -0,0 +1,206 @@
+"""Columnar store of files commit stats, backed by typed arrays"""
+
+from array import array
+from typing import Callable, Dict, List, Iterable, Tuple, Optional
+from app_types.dataclasses import FileCommitStats, FileStatsColumns
+
+STATS_ARRAY_TYPE = "I"
+OFFSETS_ARRAY_TYPE = "Q"
+
+
+class CommitStatsStore:
+    """
+    Read only store of commit stats of files.
+    Stats of each file occupy continuous range of columns, newest commit first.
+    Authors are stored as ids in authors table, which is shared by all files
+    """
+
+    def __init__(
+        self,
+        file_names: List[str],
+        offsets: array,
+        columns: Tuple[array, array, array],
+        authors: List[str],
+    ):
+        """
+        Constructor, use CommitStatsStoreBuilder to create store
+        :param file_names: File names, in order of their ranges
+        :param offsets: Start offset of each file range, followed by total length
+        :param columns: Added lines, removed lines and author id columns
+        :param authors: Authors table
+        """
+        self._file_indexes = {name: index for index, name in enumerate(file_names)}
+        self._offsets = offsets
+        self._added_lines, self._removed_lines, self._author_ids = columns
+        self._authors = authors
+
+    @property
+    def file_names(self) -> List[str]:
+        """File names, which have stats in store"""
+        return list(self._file_indexes)
+
+    @property
+    def authors(self) -> List[str]:
+        """Authors table"""
+        return self._authors
+
+    @property
+    def offsets(self) -> array:
+        """Start offset of each file range, followed by total length of columns"""
+        return self._offsets
+
+    @property
+    def columns(self) -> Tuple[array, array, array]:
+        """Added lines, removed lines and author id columns of all files"""
+        return self._added_lines, self._removed_lines, self._author_ids
+
+    def __contains__(self, file_name: object) -> bool:
+        """Check if file has stats in store"""
+        return file_name in self._file_indexes
+
+    def __len__(self) -> int:
+        """Amount of files in store"""
+        return len(self._file_indexes)
+
+    def get_file_index(self, file_name: str) -> Optional[int]:
+        """Get index of file range, None if file is not in store"""
+        return self._file_indexes.get(file_name)
+
+    def get_file_range(self, file_name: str) -> range:
+        """Get range of file stats inside of columns, empty if file is not in store"""
+        index = self._file_indexes.get(file_name)
+        if index is None:
+            return range(0)
+
+        return range(self._offsets[index], self._offsets[index + 1])
+
+    def get_file_columns(self, file_name: str) -> FileStatsColumns:
+        """
+        Get stats of single file as column views, columns are not copied
+        :param file_name: File name
+        :return: Column views of file stats, empty if file is not in store
+        """
+        file_range = self.get_file_range(file_name)
+        file_slice = slice(file_range.start, file_range.stop)
+        return FileStatsColumns(
+            added_lines=memoryview(self._added_lines)[file_slice],
+            removed_lines=memoryview(self._removed_lines)[file_slice],
+            author_ids=memoryview(self._author_ids)[file_slice],
+            authors=self._authors,
+        )
+
+    def get_file_stats(self, file_name: str) -> List[FileCommitStats]:
+        """Get stats of single file as list of commit stats"""
+        return [
+            FileCommitStats(
+                added_lines=self._added_lines[index],
+                removed_lines=self._removed_lines[index],
+                author=self._authors[self._author_ids[index]],
+            )
+            for index in self.get_file_range(file_name)
+        ]
+
+    def to_files_stats(self) -> Dict[str, List[FileCommitStats]]:
+        """Transform store into dictionary of file name and its list of stats"""
+        return {
+            file_name: self.get_file_stats(file_name)
+            for file_name in self._file_indexes
+        }
+
+
+class CommitStatsStoreBuilder:
+    """Builder of commit stats store, stats of each file must be added newest first"""
+
+    def __init__(self):
+        """Constructor"""
+        self._author_ids: Dict[str, int] = {}
+        self._files: Dict[str, Tuple[array, array, array]] = {}
+
+    def add_file(self, file_name: str) -> Tuple[array, array, array]:
+        """
+        Add file to store, even if it will not have any stats
+        :param file_name: File name
+        :return: Added lines, removed lines and author id columns of the file
+        """
+        columns = self._files.get(file_name)
+        if columns is None:
+            columns = self._files[file_name] = (
+                array(STATS_ARRAY_TYPE),
+                array(STATS_ARRAY_TYPE),
+                array(STATS_ARRAY_TYPE),
+            )
+        return columns
+
+    def add_stat(
+        self, file_name: str, added_lines: int, removed_lines: int, author: str
+    ) -> None:
+        """Add single commit stats of file, commit must be older than already added"""
+        added_column, removed_column, author_column = self.add_file(file_name)
+        added_column.append(added_lines)
+        removed_column.append(removed_lines)
+        author_column.append(self._author_ids.setdefault(author, len(self._author_ids)))
+
+    def add_file_stats(self, file_name: str, stats: Iterable[FileCommitStats]) -> None:
+        """Add list of commit stats of file, newest commit first"""
+        self.add_file(file_name)
+        for stat in stats:
+            self.add_stat(file_name, stat.added_lines, stat.removed_lines, stat.author)
+
+    def add_store(
+        self,
+        store: CommitStatsStore,
+        resolve_file_name: Optional[Callable[[str], Optional[str]]] = None,
+    ) -> None:
+        """
+        Add all files of another store, for example store built by worker process
+        :param store: Store, which stats are older than already added ones
+        :param resolve_file_name: Optional renaming of files, files resolved to None are skipped
+        """
+        author_ids = array(
+            STATS_ARRAY_TYPE,
+            (
+                self._author_ids.setdefault(author, len(self._author_ids))
+                for author in store.authors
+            ),
+        )
+        for file_name in store.file_names:
+            target_name = (
+                file_name if resolve_file_name is None else resolve_file_name(file_name)
+            )
+            if target_name is None:
+                continue
+            added_column, removed_column, author_column = self.add_file(target_name)
+            file_columns = store.get_file_columns(file_name)
+            added_column.extend(file_columns.added_lines)
+            removed_column.extend(file_columns.removed_lines)
+            author_column.extend(author_ids[index] for index in file_columns.author_ids)
+
+    def build(self) -> CommitStatsStore:
+        """Concatenate stats of all files into continuous columns"""
+        offsets = array(OFFSETS_ARRAY_TYPE, [0])
+        added_lines = array(STATS_ARRAY_TYPE)
+        removed_lines = array(STATS_ARRAY_TYPE)
+        author_ids = array(STATS_ARRAY_TYPE)
+        for added_column, removed_column, author_column in self._files.values():
+            added_lines.extend(added_column)
+            removed_lines.extend(removed_column)
+            author_ids.extend(author_column)
+            offsets.append(len(added_lines))
+
+        return CommitStatsStore(
+            list(self._files),
+            offsets,
+            (added_lines, removed_lines, author_ids),
+            list(self._author_ids),
+        )
+
+
+def create_commit_stats_store(
+    files_stats: Dict[str, List[FileCommitStats]]
+) -> CommitStatsStore:
+    """Create commit stats store out of dictionary of file name and its list of stats"""
+    builder = CommitStatsStoreBuilder()
+    for file_name, stats in files_stats.items():
+        builder.add_file_stats(file_name, stats)
+
+    return builder.build()
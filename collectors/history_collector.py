@@ -0,0 +1,92 @@
+"""Collector which gathers stats of all files in a single pass over git history"""
+
+from typing import List, Dict, Optional
+from git import Git
+from app_types.dataclasses import GitLogOptions, FileAggregate
+from collectors.commit_stats_store import CommitStatsStore
+from collectors.numstat_parser import (
+    iter_numstat_commits,
+    read_numstat_log,
+    spread_numstat_commits,
+    aggregate_numstat_commits,
+)
+from collectors.rename_graph import (
+    RenameResolver,
+    build_rename_graph,
+    get_files_history_names,
+)
+from defaults.command import DEFAULT_JOBS
+from utils.git_utils import get_log_interval_options, get_literal_pathspecs
+
+
+def get_history_pathspec_arguments(git: Git, log_options: GitLogOptions) -> List[str]:
+    """
+    Prepare pathspec arguments, which limit history scan to requested files.
+    All names files had in history are included, so renames are still detected,
+    and history is not simplified by them, so pathspecs do not change stats
+    :param git: Git instance
+    :param log_options: Git log options
+    :return: List of git log arguments, empty if all files are scanned
+    """
+    if log_options.pathspecs is None:
+        return []
+
+    history_names = get_files_history_names(
+        build_rename_graph(git), log_options.pathspecs
+    )
+    return [
+        "--full-history",
+        "--",
+        *get_literal_pathspecs(
+            dict.fromkeys(name for names in history_names.values() for name in names)
+        ),
+    ]
+
+
+# pylint: disable = unused-argument
+def get_history_files_stats(
+    file_names: List[str],
+    git: Git,
+    log_options: GitLogOptions,
+    jobs: int = DEFAULT_JOBS,
+) -> CommitStatsStore:
+    """
+    Return git stats for all specified files, by scanning whole history only once
+    :param file_names: All specified file names for which we need to collect stats
+    :param git: Git instance
+    :param log_options: Git log options
+    :param jobs: Unused, history is scanned by single git process
+    :return: Commit stats store of all files
+    """
+    return spread_numstat_commits(
+        iter_numstat_commits(
+            read_numstat_log(
+                git,
+                "-M",
+                *get_log_interval_options(log_options),
+                *get_history_pathspec_arguments(git, log_options),
+                line_counts=log_options.line_counts,
+                authors=log_options.authors,
+            ),
+            log_options.line_counts,
+        ),
+        file_names,
+    )
+
+
+def get_history_files_aggregates(
+    git: Git,
+    revision_range: Optional[str] = None,
+    resolver: Optional[RenameResolver] = None,
+) -> Dict[str, FileAggregate]:
+    """
+    Return aggregates of every file changed in revision range
+    :param git: Git instance
+    :param revision_range: Git revision range, omit for whole history of HEAD
+    :param resolver: Rename resolver, which will contain renames of revision range
+    :return: Aggregate for each file, by file name at the end of revision range
+    """
+    options = [revision_range] if revision_range is not None else []
+    return aggregate_numstat_commits(
+        iter_numstat_commits(read_numstat_log(git, "-M", *options)), resolver
+    )
@@ -0,0 +1,275 @@
+"""Streaming parser of "git log -z --numstat" output"""
+
+from typing import IO, List, Dict, Iterable, Iterator, Tuple, Optional
+from git import Git
+from app_types.dataclasses import FileAggregate, NumstatCommit, NumstatEntry
+from collectors.commit_stats_store import CommitStatsStore, CommitStatsStoreBuilder
+from collectors.rename_graph import RenameResolver
+from features.file_aggregates import add_commit_stats_to_aggregate
+from utils.numbers import is_number
+from utils.profiler import record_git_process, record_git_output
+
+AUTHOR_LINE_MARKER = "\x1f"
+READ_CHUNK_SIZE = 64 * 1024
+
+_RECORD_MARKER = AUTHOR_LINE_MARKER.encode()
+_RECORD_MARKER_FORMAT = "%x1f"
+PATH_ENCODING = "utf-8"
+PATH_ERRORS = "surrogateescape"
+
+
+def is_stat_trackable(split_stat: List[str]) -> bool:
+    """Check if commit stats can be tracked, that is - they are integers"""
+    return (
+        len(split_stat) >= 2 and is_number(split_stat[0]) and is_number(split_stat[1])
+    )
+
+
+def _parse_line_count(raw_count: bytes) -> Optional[int]:
+    """
+    Parse added/removed line count, binary files have "-" instead of number
+    This function should not be called directly
+    """
+    return int(raw_count) if raw_count.isdigit() else None
+
+
+class NumstatStreamParser:
+    """
+    Push parser of "git log -z --numstat --format=<marker>%an" output,
+    or of "--name-status" output, when line counts are not needed.
+    Output can be fed in chunks of any size, commits are yielded as soon as they end
+    """
+
+    def __init__(self, line_counts: bool = True):
+        """
+        Constructor
+        :param line_counts: Whether output is numstat, otherwise name status is expected
+        """
+        self._line_counts = line_counts
+        self._buffer = b""
+        self._commit: Optional[NumstatCommit] = None
+        self._pending_stat: Tuple[Optional[int], Optional[int]] = (0, 0)
+        self._pending_path_amount = 0
+        self._pending_paths: List[str] = []
+
+    def feed(self, chunk: bytes) -> Iterator[NumstatCommit]:
+        """
+        Feed next chunk of git output
+        :param chunk: Bytes of git output
+        :return: Iterator of commits which were completed by this chunk
+        """
+        buffer = self._buffer + chunk if self._buffer else chunk
+        start = 0
+        while (end := buffer.find(b"\0", start)) != -1:
+            if (commit := self._consume_token(buffer[start:end])) is not None:
+                yield commit
+            start = end + 1
+        self._buffer = buffer[start:]
+
+    def close(self) -> Iterator[NumstatCommit]:
+        """
+        Finish parsing, when whole output was fed
+        :return: Iterator of last commit
+        """
+        if self._buffer:
+            if (commit := self._consume_token(self._buffer)) is not None:
+                yield commit
+            self._buffer = b""
+
+        if self._commit is not None:
+            yield self._commit
+            self._commit = None
+
+    def _consume_token(self, token: bytes) -> Optional[NumstatCommit]:
+        """
+        Consume single NUL separated token
+        This method should not be called directly
+        :param token: Token bytes
+        :return: Previous commit, if token starts new one
+        """
+        if self._pending_path_amount > 0:
+            self._pending_paths.append(token.decode(PATH_ENCODING, PATH_ERRORS))
+            self._pending_path_amount -= 1
+            if self._pending_path_amount == 0:
+                new_path = self._pending_paths.pop()
+                old_path = self._pending_paths.pop() if self._pending_paths else None
+                self._append_entry(*self._pending_stat, old_path, new_path)
+            return None
+
+        token = token.lstrip(b"\n")
+        if token.startswith(_RECORD_MARKER):
+            finished_commit = self._commit
+            self._commit = NumstatCommit(
+                token[len(_RECORD_MARKER) :].decode("utf-8", "replace"), []
+            )
+            return finished_commit
+
+        if not self._line_counts:
+            self._pending_stat = (0, 0)
+            self._pending_path_amount = 2 if token[:1] in (b"R", b"C") else 1
+            return None
+
+        split_stat = token.split(b"\t", 2)
+        if len(split_stat) != 3:
+            return None
+
+        self._pending_stat = (
+            _parse_line_count(split_stat[0]),
+            _parse_line_count(split_stat[1]),
+        )
+        if split_stat[2] == b"":
+            self._pending_path_amount = 2
+        else:
+            self._append_entry(
+                *self._pending_stat,
+                None,
+                split_stat[2].decode(PATH_ENCODING, PATH_ERRORS),
+            )
+        return None
+
+    def _append_entry(
+        self,
+        added_lines: Optional[int],
+        removed_lines: Optional[int],
+        old_path: Optional[str],
+        new_path: str,
+    ) -> None:
+        """
+        Append numstat entry to current commit
+        This method should not be called directly
+        """
+        if self._commit is None:
+            self._commit = NumstatCommit("", [])
+        self._commit.entries.append(
+            NumstatEntry(added_lines, removed_lines, old_path, new_path)
+        )
+
+
+def iter_numstat_commits(
+    chunks: Iterable[bytes], line_counts: bool = True
+) -> Iterator[NumstatCommit]:
+    """
+    Parse chunks of git output into commits, one at a time
+    :param chunks: Chunks of "git log -z --numstat --format=<marker>%an" output
+    :param line_counts: Whether output is numstat, otherwise name status is expected
+    :return: Iterator of commits
+    """
+    parser = NumstatStreamParser(line_counts)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def get_numstat_log_arguments(
+    *options: str, line_counts: bool = True, authors: bool = True
+) -> List[str]:
+    """
+    Prepare git log arguments, which produce output for NumstatStreamParser
+    :param options: Additional git log options (revisions, pathspecs)
+    :param line_counts: Whether added/removed lines are needed, name status is cheaper
+    :param authors: Whether commit authors are needed
+    :return: List of git log arguments
+    """
+    return [
+        "-z",
+        # Renames are resolved from newest commit to oldest one, commit dates may tie
+        "--topo-order",
+        "--numstat" if line_counts else "--name-status",
+        f"--format={_RECORD_MARKER_FORMAT}{'%an' if authors else ''}",
+        *options,
+    ]
+
+
+def read_numstat_log(
+    git: Git,
+    *options: str,
+    line_counts: bool = True,
+    authors: bool = True,
+    istream: Optional[IO[bytes]] = None,
+) -> Iterator[bytes]:
+    """
+    Run git log with numstat and stream its output
+    :param git: Git instance
+    :param options: Additional git log options (revisions, pathspecs)
+    :param line_counts: Whether added/removed lines are needed, name status is cheaper
+    :param authors: Whether commit authors are needed
+    :param istream: Optional input of git log, e.g. revisions for --stdin option
+    :return: Iterator of output chunks
+    """
+    process = git.log(
+        *get_numstat_log_arguments(*options, line_counts=line_counts, authors=authors),
+        as_process=True,
+        istream=istream,
+    )
+    record_git_process()
+    while chunk := process.stdout.read(READ_CHUNK_SIZE):
+        record_git_output(len(chunk))
+        yield chunk
+    process.wait()
+
+
+def iter_numstat_entries(
+    commits: Iterable[NumstatCommit], resolver: Optional[RenameResolver] = None
+) -> Iterator[Tuple[str, int, int, str]]:
+    """
+    Iterate numstat entries of commits, binary files count as commits without lines
+    :param commits: Parsed commits, newest first
+    :param resolver: Rename resolver, which is updated while log is walked
+    :return: Iterator of author, added lines, removed lines and current file name
+    """
+    resolver = resolver if resolver is not None else RenameResolver()
+    for commit in commits:
+        for entry in commit.entries:
+            current_path = resolver.resolve(entry.new_path)
+            if entry.old_path is not None:
+                resolver.record_rename(entry.old_path, entry.new_path)
+
+            if current_path is not None:
+                yield (
+                    commit.author,
+                    entry.added_lines or 0,
+                    entry.removed_lines or 0,
+                    current_path,
+                )
+
+
+def spread_numstat_commits(
+    commits: Iterable[NumstatCommit], tracked_files: Iterable[str]
+) -> CommitStatsStore:
+    """
+    Spread numstat entries of commits across per file accumulators
+    :param commits: Parsed commits, newest first
+    :param tracked_files: File names for which stats should be accumulated
+    :return: Commit stats store of tracked files
+    """
+    builder = CommitStatsStoreBuilder()
+    tracked = set(tracked_files)
+    for file_name in tracked:
+        builder.add_file(file_name)
+
+    for author, added_lines, removed_lines, file_name in iter_numstat_entries(commits):
+        if file_name in tracked:
+            builder.add_stat(file_name, added_lines, removed_lines, author)
+
+    return builder.build()
+
+
+def aggregate_numstat_commits(
+    commits: Iterable[NumstatCommit], resolver: Optional[RenameResolver] = None
+) -> Dict[str, FileAggregate]:
+    """
+    Sum up numstat entries of commits into aggregate of each file
+    :param commits: Parsed commits, newest first
+    :param resolver: Rename resolver, which is updated while log is walked
+    :return: Dictionary of file name and its aggregate
+    """
+    result: Dict[str, FileAggregate] = {}
+    for author, added_lines, removed_lines, file_name in iter_numstat_entries(
+        commits, resolver
+    ):
+        aggregate = result.get(file_name)
+        if aggregate is None:
+            aggregate = result[file_name] = FileAggregate()
+        add_commit_stats_to_aggregate(aggregate, added_lines, removed_lines, author)
+
+    return result
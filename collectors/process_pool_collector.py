@@ -0,0 +1,81 @@
+"""Collector which runs git and parses its output in a pool of worker processes"""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import batched
+from typing import List, Dict, Tuple
+from git import Git
+from app_types.dataclasses import GitLogOptions
+from collectors.commit_stats_store import CommitStatsStore, CommitStatsStoreBuilder
+from collectors.rename_graph import build_rename_graph, get_files_history_names
+from defaults.command import DEFAULT_JOBS
+from utils.git_utils import get_file_stats
+from utils.profiler import (
+    GitIoCounters,
+    get_git_io_counters,
+    get_git_io_counters_since,
+    add_git_io_counters,
+)
+
+MAX_FILES_PER_TASK = 64
+TASKS_PER_WORKER = 4
+
+
+def _collect_files_chunk_stats(
+    repo_path: str, history_names: Dict[str, List[str]], log_options: GitLogOptions
+) -> Tuple[CommitStatsStore, GitIoCounters]:
+    """
+    Collect git stats of files chunk inside of worker process
+    This function should not be called directly
+    :param repo_path: Path to the repository
+    :param history_names: Chunk of file names, with all names each file had in history
+    :param log_options: Git log options
+    :return: Commit stats store of files chunk, which is compact to send back,
+        and git usage of worker process, which is not visible to parent otherwise
+    """
+    git_io_before = get_git_io_counters()
+    git_instance = Git(repo_path)
+    builder = CommitStatsStoreBuilder()
+    for file_name, names in history_names.items():
+        builder.add_file_stats(
+            file_name, get_file_stats(git_instance, file_name, log_options, names)
+        )
+
+    return builder.build(), get_git_io_counters_since(git_io_before)
+
+
+def get_files_chunk_size(file_amount: int, jobs: int) -> int:
+    """Calculate amount of files sent to worker at once"""
+    return max(1, min(MAX_FILES_PER_TASK, file_amount // (jobs * TASKS_PER_WORKER)))
+
+
+def get_process_pool_files_stats(
+    file_names: List[str],
+    git: Git,
+    log_options: GitLogOptions,
+    jobs: int = DEFAULT_JOBS,
+) -> CommitStatsStore:
+    """
+    Return git stats for all specified files, collected by pool of worker processes
+    :param file_names: All specified file names for which we need to collect stats
+    :param git: Git instance
+    :param log_options: Git log options
+    :param jobs: Amount of worker processes
+    :return: Commit stats store of all files
+    """
+    builder = CommitStatsStoreBuilder()
+    if len(file_names) == 0:
+        return builder.build()
+
+    history_names = get_files_history_names(build_rename_graph(git), file_names)
+    chunks = list(batched(file_names, get_files_chunk_size(len(file_names), jobs)))
+    with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as executor:
+        for chunk_store, chunk_git_io in executor.map(
+            _collect_files_chunk_stats,
+            [str(git.working_dir)] * len(chunks),
+            [{name: history_names[name] for name in chunk} for chunk in chunks],
+            [log_options] * len(chunks),
+        ):
+            builder.add_store(chunk_store)
+            add_git_io_counters(chunk_git_io)
+
+    return builder.build()
@@ -0,0 +1,139 @@
+"""Rename graph of repository, built from single pass over git history"""
+
+from typing import List, Dict, Iterable, Optional, Set
+from git import Git
+from app_types.dataclasses import RenameEvent
+from utils.profiler import record_git_process, record_git_output
+
+COMMIT_LINE_MARKER = "\x1f"
+
+
+class RenameResolver:
+    """
+    Resolves historical file names to current ones, while history is walked
+    from newest commit to oldest one
+    """
+
+    def __init__(self):
+        """Constructor"""
+        self._aliases: Dict[str, Optional[str]] = {}
+
+    def resolve(self, path: str) -> Optional[str]:
+        """
+        Resolve path, as it was named at current point of history, to its current name
+        :param path: Historical path
+        :return: Current path, None if path belongs to file which was later replaced
+        """
+        return self._aliases.get(path, path)
+
+    def record_rename(self, old_path: str, new_path: str) -> None:
+        """Record that file, older than this point of history, was named old_path"""
+        self._aliases[old_path] = self.resolve(new_path)
+        if old_path != new_path:
+            self._aliases[new_path] = None
+
+    @property
+    def aliases(self) -> Dict[str, Optional[str]]:
+        """Historical names, which are resolved to other than themselves"""
+        return self._aliases
+
+
+def parse_name_status_log(log_tokens: Iterable[str]) -> List[RenameEvent]:
+    """
+    Parse renames out of name status log
+    :param log_tokens: NUL separated tokens of git log -z --name-status,
+        each commit starts with marker token
+    :return: Rename events, newest first
+    """
+    commit = ""
+    result: List[RenameEvent] = []
+    tokens = iter(log_tokens)
+    for token in tokens:
+        token = token.lstrip("\n")
+        if token.startswith(COMMIT_LINE_MARKER):
+            commit = token[len(COMMIT_LINE_MARKER) :]
+        elif token.startswith(("R", "C")):
+            old_path, new_path = next(tokens), next(tokens)
+            if token.startswith("R"):
+                result.append(RenameEvent(commit, old_path, new_path))
+        elif token != "":
+            next(tokens)
+
+    return result
+
+
+def build_rename_graph(git: Git) -> List[RenameEvent]:
+    """
+    Collect every rename of HEAD history with single git log pass.
+    Topological order keeps each rename before renames of older commits,
+    even when commits have the same timestamps
+    :param git: Git instance
+    :return: Rename events, newest first
+    """
+    raw_result: str = git.log(
+        "-z",
+        "--topo-order",
+        "-M",
+        "--name-status",
+        "--diff-filter=R",
+        f"--format={COMMIT_LINE_MARKER}%H",
+    )
+    record_git_process()
+    record_git_output(len(raw_result.encode()))
+    return parse_name_status_log(raw_result.split("\0"))
+
+
+def get_history_names(rename_events: List[RenameEvent], path: str) -> List[str]:
+    """
+    Get chain of names which file had throughout history.
+    Chain ends at rename of older file, which had the same name before it was reused
+    :param rename_events: Rename events, newest first
+    :param path: Current path of the file
+    :return: Current path followed by older names, newest first
+    """
+    names = [path]
+    for event in rename_events:
+        if event.old_path == names[-1] and event.new_path != names[-1]:
+            break
+        if event.new_path == names[-1] and event.old_path not in names:
+            names.append(event.old_path)
+
+    return names
+
+
+def get_history_pathspec_names(
+    rename_events: List[RenameEvent], path: str
+) -> List[str]:
+    """
+    Get names, which git log has to be limited to, to read history of single file.
+    Names, which history names were renamed to, are included, so renames of older
+    files with reused names are detected and their commits are not mixed in
+    :param rename_events: Rename events, newest first
+    :param path: Current path of the file
+    :return: History names of the file, followed by names they were renamed to
+    """
+    names = get_history_names(rename_events, path)
+    history_names = set(names)
+    for event in rename_events:
+        if event.old_path in history_names and event.new_path not in history_names:
+            history_names.add(event.new_path)
+            names.append(event.new_path)
+
+    return names
+
+
+def get_files_history_names(
+    rename_events: List[RenameEvent], file_names: Iterable[str]
+) -> Dict[str, List[str]]:
+    """Get names, which git log has to be limited to, for each file"""
+    renamed_paths: Set[str] = {
+        path for event in rename_events for path in (event.old_path, event.new_path)
+    }
+    return {
+        file_name: (
+            get_history_pathspec_names(rename_events, file_name)
+            if file_name in renamed_paths
+            else [file_name]
+        )
+        for file_name in file_names
+    }
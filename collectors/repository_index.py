@@ -0,0 +1,45 @@
+"""Warm in memory index of repository, which is kept by long running processes"""
+
+from typing import Dict, List, Optional
+from git import Repo
+from app_types.dataclasses import StatsCache, FileAggregate
+from collectors.stats_cache import advance_stats_cache
+from utils.git_utils import get_flat_file_tree
+
+
+class RepositoryIndex:
+    """
+    File aggregates of whole HEAD history and file lists of repository paths.
+    When HEAD moves, only new commits are scanned and file lists are listed again
+    """
+
+    def __init__(self, repo: Repo):
+        """
+        Constructor
+        :param repo: Repo instance, which is reused by every query
+        """
+        self.repo = repo
+        self._stats_cache: Optional[StatsCache] = None
+        self._file_lists_commit: Optional[str] = None
+        self._file_lists: Dict[str, List[str]] = {}
+
+    def get_files_aggregates(self) -> Dict[str, FileAggregate]:
+        """Get aggregates of files at HEAD commit, history is scanned only when HEAD moves"""
+        self._stats_cache = advance_stats_cache(self.repo, self._stats_cache)
+        return self._stats_cache.files
+
+    def get_file_names(self, path: str) -> List[str]:
+        """
+        Get files of repository path at HEAD commit, tree is listed once for each commit
+        :param path: Directory or file path, inside of repository
+        :return: Flat list of file names
+        """
+        head_commit = self.repo.head.commit
+        if self._file_lists_commit != head_commit.hexsha:
+            self._file_lists_commit = head_commit.hexsha
+            self._file_lists = {}
+
+        if path not in self._file_lists:
+            self._file_lists[path] = get_flat_file_tree(head_commit.tree, path)
+
+        return self._file_lists[path]
@@ -0,0 +1,212 @@
+"""
+Collector which splits history into contiguous parts of commit list, in order
+of serial scan, scans each part in worker process and merges partial stats of parts
+"""
+
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import IO, List, Tuple, Optional
+from git import Git
+from app_types.dataclasses import GitLogOptions, HistoryShard
+from collectors.commit_stats_store import CommitStatsStore, CommitStatsStoreBuilder
+from collectors.history_collector import get_history_pathspec_arguments
+from collectors.numstat_parser import (
+    iter_numstat_commits,
+    iter_numstat_entries,
+    read_numstat_log,
+)
+from collectors.rename_graph import RenameResolver
+from defaults.command import DEFAULT_JOBS
+from utils.git_utils import get_log_interval_options
+from utils.profiler import (
+    GitIoCounters,
+    get_git_io_counters,
+    get_git_io_counters_since,
+    add_git_io_counters,
+    record_git_process,
+    record_git_output,
+)
+
+# Shorter parts are not worth cost of worker process
+MIN_COMMITS_PER_SHARD = 1000
+
+
+def get_history_commit_parts(
+    git: Git, log_arguments: List[str], shards: int
+) -> List[bytes]:
+    """
+    Split commits, which serial scan walks, into contiguous and evenly long parts.
+    Commits are listed by single rev-list in the same topological order as serial scan,
+    so scanned parts add up to exactly the serial walk, merged branches included.
+    Short histories are split into fewer parts
+    :param git: Git instance
+    :param log_arguments: Interval and pathspec arguments of git log
+    :param shards: Maximal amount of parts
+    :return: Newline separated commit SHAs of each part, newest first
+    """
+    process = git.rev_list("--topo-order", "HEAD", *log_arguments, as_process=True)
+    record_git_process()
+    commits: bytes = process.stdout.read()
+    process.wait()
+    record_git_output(len(commits))
+    if len(commits) == 0:
+        return []
+
+    # Every line holds commit SHA of the same length
+    line_length = commits.index(b"\n") + 1
+    commit_count = len(commits) // line_length
+    shards = max(1, min(shards, commit_count // MIN_COMMITS_PER_SHARD))
+    step = -(-commit_count // shards) * line_length
+    return [commits[start : start + step] for start in range(0, len(commits), step)]
+
+
+def scan_history_shard(
+    git: Git,
+    revisions: List[str],
+    log_arguments: List[str],
+    log_options: GitLogOptions,
+    istream: Optional[IO[bytes]] = None,
+) -> HistoryShard:
+    """
+    Scan part of commits with single git process, renames are resolved within part only
+    :param git: Git instance
+    :param revisions: Revisions of part
+    :param log_arguments: Interval and pathspec arguments of git log, shared by all parts
+    :param log_options: Git log options
+    :param istream: Optional input of git log, e.g. commits for --stdin option
+    :return: Stats of files, named as at the newest commit of part
+    """
+    resolver = RenameResolver()
+    builder = CommitStatsStoreBuilder()
+    for author, added_lines, removed_lines, file_name in iter_numstat_entries(
+        iter_numstat_commits(
+            read_numstat_log(
+                git,
+                "-M",
+                *revisions,
+                *log_arguments,
+                line_counts=log_options.line_counts,
+                authors=log_options.authors,
+                istream=istream,
+            ),
+            log_options.line_counts,
+        ),
+        resolver,
+    ):
+        builder.add_stat(file_name, added_lines, removed_lines, author)
+
+    return HistoryShard(builder.build(), dict(resolver.aliases))
+
+
+def _scan_history_shard_in_worker(
+    repo_path: str,
+    commits: bytes,
+    log_arguments: List[str],
+    log_options: GitLogOptions,
+) -> Tuple[HistoryShard, GitIoCounters]:
+    """
+    Scan part of commits inside of worker process
+    This function should not be called directly
+    :return: Stats of part and git usage of worker process
+    """
+    git_io_before = get_git_io_counters()
+    with tempfile.TemporaryFile() as commits_file:
+        commits_file.write(commits)
+        commits_file.seek(0)
+        shard = scan_history_shard(
+            Git(repo_path),
+            # Commits are walked in the order they are listed
+            ["--no-walk=unsorted", "--stdin"],
+            log_arguments,
+            log_options,
+            commits_file,
+        )
+    return shard, get_git_io_counters_since(git_io_before)
+
+
+def merge_history_shards(newer: HistoryShard, older: HistoryShard) -> HistoryShard:
+    """
+    Merge stats of two adjacent parts of commits, merge is associative,
+    so parts can be merged in any grouping, as long as their order is kept
+    :param newer: Stats of newer part
+    :param older: Stats of part, which directly follows newer one in serial walk
+    :return: Stats of both parts, named as at the newest commit of newer part
+    """
+
+    def resolve(path: str) -> Optional[str]:
+        return newer.aliases.get(path, path)
+
+    builder = CommitStatsStoreBuilder()
+    builder.add_store(newer.store)
+    builder.add_store(older.store, resolve)
+    return HistoryShard(
+        builder.build(),
+        {
+            **newer.aliases,
+            **{
+                path: resolve(current_path) if current_path is not None else None
+                for path, current_path in older.aliases.items()
+            },
+        },
+    )
+
+
+def collect_history_shards(
+    git: Git, log_options: GitLogOptions, shards: int
+) -> HistoryShard:
+    """
+    Scan history in parts of commits and merge their stats
+    :param git: Git instance
+    :param log_options: Git log options
+    :param shards: Maximal amount of parts, each one is scanned by worker process
+    :return: Stats of whole history, named as at HEAD commit
+    """
+    log_arguments = [
+        *get_log_interval_options(log_options),
+        *get_history_pathspec_arguments(git, log_options),
+    ]
+    commit_parts = get_history_commit_parts(git, log_arguments, shards)
+    if len(commit_parts) <= 1:
+        return scan_history_shard(git, ["HEAD"], log_arguments, log_options)
+
+    history_shards: List[HistoryShard] = []
+    with ProcessPoolExecutor(max_workers=len(commit_parts)) as executor:
+        for shard, shard_git_io in executor.map(
+            _scan_history_shard_in_worker,
+            [str(git.working_dir)] * len(commit_parts),
+            commit_parts,
+            [log_arguments] * len(commit_parts),
+            [log_options] * len(commit_parts),
+        ):
+            history_shards.append(shard)
+            add_git_io_counters(shard_git_io)
+
+    return reduce(merge_history_shards, history_shards)
+
+
+def get_sharded_history_files_stats(
+    file_names: List[str],
+    git: Git,
+    log_options: GitLogOptions,
+    jobs: int = DEFAULT_JOBS,
+) -> CommitStatsStore:
+    """
+    Return git stats for all specified files, history is scanned in parallel
+    by parts of commits, short histories are scanned by single git process
+    :param file_names: All specified file names for which we need to collect stats
+    :param git: Git instance
+    :param log_options: Git log options
+    :param jobs: Amount of worker processes
+    :return: Commit stats store of all files
+    """
+    history = collect_history_shards(git, log_options, jobs)
+
+    tracked = set(file_names)
+    builder = CommitStatsStoreBuilder()
+    for file_name in file_names:
+        builder.add_file(file_name)
+    builder.add_store(
+        history.store, lambda file_name: file_name if file_name in tracked else None
+    )
+    return builder.build()
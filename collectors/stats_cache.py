@@ -0,0 +1,152 @@
+"""Persistent cache of file aggregates, which is updated incrementally by commit SHA"""
+
+from typing import Dict, Any, Optional
+from git import Repo, exc
+from app_types.dataclasses import StatsCache, FileAggregate, AuthorStats
+from collectors.history_collector import get_history_files_aggregates
+from collectors.rename_graph import RenameResolver
+from features.file_aggregates import merge_file_aggregates
+from utils.filesystem import get_stats_cache_from_file, save_stats_cache_to_file
+
+STATS_CACHE_VERSION = 3
+
+
+def serialize_stats_cache(stats_cache: StatsCache) -> Dict[str, Any]:
+    """Transform stats cache into JSON serializable dictionary"""
+    return {
+        "version": STATS_CACHE_VERSION,
+        "last_commit": stats_cache.last_commit,
+        "files": {
+            file_name: [
+                aggregate.commit_count,
+                aggregate.added_lines,
+                aggregate.removed_lines,
+                aggregate.ratio_sum,
+                [
+                    [author, stats.commit_count, stats.added_lines, stats.removed_lines]
+                    for author, stats in aggregate.authors.items()
+                ],
+            ]
+            for file_name, aggregate in stats_cache.files.items()
+        },
+    }
+
+
+def deserialize_stats_cache(data: Optional[Dict[str, Any]]) -> Optional[StatsCache]:
+    """Transform JSON dictionary into stats cache, None if data is missing or outdated"""
+    if data is None or data.get("version") != STATS_CACHE_VERSION:
+        return None
+
+    return StatsCache(
+        last_commit=data["last_commit"],
+        files={
+            file_name: FileAggregate(
+                commit_count=commit_count,
+                added_lines=added_lines,
+                removed_lines=removed_lines,
+                ratio_sum=ratio_sum,
+                authors={
+                    author: AuthorStats(*author_stats)
+                    for author, *author_stats in authors
+                },
+            )
+            for file_name, (
+                commit_count,
+                added_lines,
+                removed_lines,
+                ratio_sum,
+                authors,
+            ) in data["files"].items()
+        },
+    )
+
+
+def merge_files_aggregates(
+    newer: Dict[str, FileAggregate], older: Dict[str, FileAggregate]
+) -> Dict[str, FileAggregate]:
+    """Merge aggregates of newer commits into aggregates of older commits"""
+    result = dict(older)
+    for file_name, aggregate in newer.items():
+        result[file_name] = (
+            merge_file_aggregates(aggregate, older[file_name])
+            if file_name in older
+            else aggregate
+        )
+
+    return result
+
+
+def rename_files_aggregates(
+    files: Dict[str, FileAggregate], resolver: RenameResolver
+) -> Dict[str, FileAggregate]:
+    """
+    Rename aggregates of older commits according to renames in newer commits
+    :param files: Aggregates by file names of older commits
+    :param resolver: Rename resolver, which contains renames of newer commits
+    :return: Aggregates by current file names
+    """
+    result: Dict[str, FileAggregate] = {}
+    for file_name, aggregate in files.items():
+        current_name = resolver.resolve(file_name)
+        if current_name is None:
+            continue
+
+        result[current_name] = (
+            merge_file_aggregates(result[current_name], aggregate)
+            if current_name in result
+            else aggregate
+        )
+
+    return result
+
+
+def is_cache_reusable(repo: Repo, stats_cache: Optional[StatsCache]) -> bool:
+    """Check if cached commit is still part of HEAD history"""
+    if stats_cache is None:
+        return False
+
+    try:
+        return repo.is_ancestor(stats_cache.last_commit, repo.head.commit.hexsha)
+    except (exc.GitCommandError, ValueError):
+        return False
+
+
+def advance_stats_cache(repo: Repo, stats_cache: Optional[StatsCache]) -> StatsCache:
+    """
+    Bring stats cache to HEAD commit, only commits after cached one are scanned
+    :param repo: Repo instance
+    :param stats_cache: Previous stats cache, None if there is none
+    :return: Up-to-date stats cache
+    """
+    head_commit = repo.head.commit.hexsha
+    if stats_cache is not None and stats_cache.last_commit == head_commit:
+        return stats_cache
+
+    if stats_cache is not None and is_cache_reusable(repo, stats_cache):
+        resolver = RenameResolver()
+        new_files = get_history_files_aggregates(
+            repo.git, f"{stats_cache.last_commit}..{head_commit}", resolver
+        )
+        return StatsCache(
+            head_commit,
+            merge_files_aggregates(
+                new_files, rename_files_aggregates(stats_cache.files, resolver)
+            ),
+        )
+
+    return StatsCache(head_commit, get_history_files_aggregates(repo.git, head_commit))
+
+
+def update_stats_cache(repo: Repo) -> StatsCache:
+    """
+    Load stats cache of repository, scan only commits after cached one and store it back
+    :param repo: Repo instance
+    :return: Up-to-date stats cache
+    """
+    repo_path = str(repo.working_dir)
+    stored_stats_cache = deserialize_stats_cache(get_stats_cache_from_file(repo_path))
+    stats_cache = advance_stats_cache(repo, stored_stats_cache)
+    if stats_cache is not stored_stats_cache:
+        save_stats_cache_to_file(repo_path, serialize_stats_cache(stats_cache))
+
+    return stats_cache
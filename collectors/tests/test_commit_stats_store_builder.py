@@ -0,0 +1,59 @@
+"""Test CommitStatsStoreBuilder"""
+
+import pickle
+from app_types.dataclasses import FileCommitStats
+from collectors.commit_stats_store import (
+    CommitStatsStoreBuilder,
+    create_commit_stats_store,
+)
+
+FILES_STATS = {
+    "a.py": [FileCommitStats(1, 2, "x"), FileCommitStats(3, 4, "y")],
+    "b.py": [],
+    "c.py": [FileCommitStats(5, 6, "x")],
+}
+
+
+def test_empty_store() -> None:
+    """Test store without files"""
+    store = CommitStatsStoreBuilder().build()
+    assert len(store) == 0
+    assert not store.get_file_stats("a.py")
+    assert len(store.get_file_columns("a.py").added_lines) == 0
+
+
+def test_round_trip() -> None:
+    """Test that stored stats are returned the same, including files without stats"""
+    assert create_commit_stats_store(FILES_STATS).to_files_stats() == FILES_STATS
+
+
+def test_interleaved_stats() -> None:
+    """Test that stats of different files can be added in any order"""
+    builder = CommitStatsStoreBuilder()
+    builder.add_stat("a.py", 1, 2, "x")
+    builder.add_stat("c.py", 5, 6, "x")
+    builder.add_file("b.py")
+    builder.add_stat("a.py", 3, 4, "y")
+    assert builder.build().to_files_stats() == FILES_STATS
+
+
+def test_file_columns() -> None:
+    """Test that file columns cover only its range and authors table is shared"""
+    columns = create_commit_stats_store(FILES_STATS).get_file_columns("c.py")
+    assert list(columns.added_lines) == [5]
+    assert list(columns.removed_lines) == [6]
+    assert [columns.authors[author_id] for author_id in columns.author_ids] == ["x"]
+    assert columns.authors == ["x", "y"]
+
+
+def test_add_pickled_store() -> None:
+    """Test merging of stores, as they are sent back by worker processes"""
+    builder = CommitStatsStoreBuilder()
+    builder.add_stat("d.py", 1, 1, "y")
+    builder.add_store(
+        pickle.loads(pickle.dumps(create_commit_stats_store(FILES_STATS)))
+    )
+    assert builder.build().to_files_stats() == {
+        "d.py": [FileCommitStats(1, 1, "y")],
+        **FILES_STATS,
+    }
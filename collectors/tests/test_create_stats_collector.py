@@ -0,0 +1,90 @@
+"""Test that every collector created by create_stats_collector gathers the same stats"""
+
+from typing import List
+import pytest
+from git import Git
+from app_types.dataclasses import GitLogOptions
+from collectors.collector_factory import create_stats_collector
+from enums.application import CollectorBackend
+from conftest import GitTestRepo
+
+
+def _collect_line_counts(
+    git_repo: GitTestRepo, collector: CollectorBackend, file_names: List[str]
+) -> dict:
+    """Collect commit amount and line count of each file"""
+    store = create_stats_collector(collector.value).value(
+        file_names, Git(git_repo.path), GitLogOptions(None, None), 2
+    )
+    return {
+        file_name: (
+            len(stats),
+            sum(stat.added_lines - stat.removed_lines for stat in stats),
+        )
+        for file_name, stats in store.to_files_stats().items()
+    }
+
+
+@pytest.mark.parametrize("collector", list(CollectorBackend))
+def test_reused_path(git_repo: GitTestRepo, collector: CollectorBackend) -> None:
+    """Test that commits of file, which was renamed away, do not count for new file"""
+    git_repo.append_lines("src/f1.py", 20)
+    git_repo.commit("create")
+    git_repo.append_lines("src/f1.py", 1)
+    git_repo.commit("change")
+    git_repo.git("mv", "src/f1.py", "g1.py")
+    git_repo.commit("first rename")
+    git_repo.git("mv", "g1.py", "h1.py")
+    git_repo.commit("second rename")
+    git_repo.append_lines("src/f1.py", 3)
+    git_repo.commit("reuse")
+
+    assert _collect_line_counts(git_repo, collector, ["src/f1.py", "h1.py"]) == {
+        "src/f1.py": (1, 3),
+        "h1.py": (4, 21),
+    }
+
+
+@pytest.mark.parametrize("collector", list(CollectorBackend))
+def test_rename_on_merged_branch(
+    git_repo: GitTestRepo, collector: CollectorBackend
+) -> None:
+    """Test that rename is found before older commits of the file are read"""
+    git_repo.append_lines("a.py", 15)
+    git_repo.commit("create")
+    git_repo.git("checkout", "-q", "-b", "side")
+    git_repo.git("mv", "a.py", "b.py")
+    git_repo.commit("rename")
+    git_repo.append_lines("y.py", 1)
+    git_repo.commit("side change")
+    git_repo.git("checkout", "-q", "main")
+    git_repo.append_lines("x.py", 1)
+    git_repo.commit("main change")
+    git_repo.git("merge", "-q", "--no-edit", "side")
+    git_repo.append_lines("b.py", 5)
+    git_repo.commit("change")
+
+    assert _collect_line_counts(git_repo, collector, ["b.py"]) == {"b.py": (3, 20)}
+
+
+@pytest.mark.parametrize("collector", list(CollectorBackend))
+def test_change_discarded_by_merge(
+    git_repo: GitTestRepo, collector: CollectorBackend
+) -> None:
+    """Test that commit of merged branch counts, even when merge discards its change"""
+    git_repo.append_lines("a.py", 15)
+    git_repo.commit("create")
+    git_repo.git("checkout", "-q", "-b", "side")
+    git_repo.append_lines("a.py", 3)
+    git_repo.commit("side change")
+    git_repo.git("checkout", "-q", "main")
+    git_repo.append_lines("x.py", 1)
+    git_repo.commit("main change")
+    git_repo.git("merge", "-q", "--no-edit", "-s", "ours", "side")
+    git_repo.append_lines("a.py", 2)
+    git_repo.commit("change")
+
+    assert _collect_line_counts(git_repo, collector, ["a.py", "x.py"]) == {
+        "a.py": (3, 20),
+        "x.py": (1, 1),
+    }
@@ -0,0 +1,37 @@
+"""Test deserialize_stats_cache"""
+
+from app_types.dataclasses import StatsCache, FileCommitStats
+from collectors.stats_cache import (
+    deserialize_stats_cache,
+    serialize_stats_cache,
+    STATS_CACHE_VERSION,
+)
+from features.file_aggregates import aggregate_commit_stats
+
+
+def test_missing_cache() -> None:
+    """Test missing cache data"""
+    assert deserialize_stats_cache(None) is None
+
+
+def test_outdated_cache_version() -> None:
+    """Test cache of other version is ignored"""
+    assert (
+        deserialize_stats_cache(
+            {"version": STATS_CACHE_VERSION + 1, "last_commit": "", "files": {}}
+        )
+        is None
+    )
+
+
+def test_serialized_cache_round_trip() -> None:
+    """Test that serialized cache is restored the same"""
+    stats_cache = StatsCache(
+        "abc",
+        {
+            "a.py": aggregate_commit_stats(
+                [FileCommitStats(1, 2, "x"), FileCommitStats(3, 4, "y")]
+            )
+        },
+    )
+    assert deserialize_stats_cache(serialize_stats_cache(stats_cache)) == stats_cache
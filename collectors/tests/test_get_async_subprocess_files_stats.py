@@ -0,0 +1,39 @@
+"""Test get_async_subprocess_files_stats"""
+
+from git import Git
+from app_types.dataclasses import GitLogOptions, FileCommitStats
+from collectors.async_subprocess_collector import get_async_subprocess_files_stats
+from utils.git_utils import get_all_files_stats
+from utils.text import trim_side_quotes
+from conftest import GitTestRepo
+
+
+def test_same_stats_as_thread_collector(git_repo: GitTestRepo) -> None:
+    """Test that asyncio subprocess collector matches GitPython based collector"""
+    for file_name, content, author in [
+        ("a.txt", "1\n2\n", "first"),
+        ("b.txt", "1\n", "first"),
+        ("a.txt", "1\n3\n4\n", "second"),
+    ]:
+        git_repo.write_file(file_name, content)
+        git_repo.commit(file_name, author)
+    git = Git(git_repo.path)
+    log_options = GitLogOptions(None, None)
+
+    result = get_async_subprocess_files_stats(
+        ["a.txt", "b.txt"], git, log_options, 1
+    ).to_files_stats()
+
+    expected = get_all_files_stats(
+        ["a.txt", "b.txt"], git, log_options, 2
+    ).to_files_stats()
+    assert result == {
+        file_name: [
+            FileCommitStats(
+                stat.added_lines, stat.removed_lines, trim_side_quotes(stat.author)
+            )
+            for stat in stats
+        ]
+        for file_name, stats in expected.items()
+    }
+    assert [stat.author for stat in result["a.txt"]] == ["second", "first"]
@@ -0,0 +1,18 @@
+"""Test get_files_chunk_size"""
+
+from collectors.process_pool_collector import get_files_chunk_size, MAX_FILES_PER_TASK
+
+
+def test_few_files() -> None:
+    """Test that chunk always has at least one file"""
+    assert get_files_chunk_size(3, 64) == 1
+
+
+def test_many_files() -> None:
+    """Test that chunk size is limited"""
+    assert get_files_chunk_size(1_000_000, 4) == MAX_FILES_PER_TASK
+
+
+def test_files_spread_across_workers() -> None:
+    """Test that every worker receives several chunks"""
+    assert get_files_chunk_size(160, 4) == 10
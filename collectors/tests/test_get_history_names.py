@@ -0,0 +1,53 @@
+"""Test get_history_names"""
+
+from app_types.dataclasses import RenameEvent
+from collectors.rename_graph import (
+    get_history_names,
+    get_history_pathspec_names,
+    parse_name_status_log,
+)
+
+
+def test_not_renamed_file() -> None:
+    """Test file without renames"""
+    assert get_history_names([RenameEvent("c1", "a.py", "b.py")], "c.py") == ["c.py"]
+
+
+def test_chain_of_renames() -> None:
+    """Test that chain of renames is followed from newest to oldest"""
+    events = [
+        RenameEvent("c3", "b.py", "c.py"),
+        RenameEvent("c2", "x.py", "y.py"),
+        RenameEvent("c1", "a.py", "b.py"),
+    ]
+    assert get_history_names(events, "c.py") == ["c.py", "b.py", "a.py"]
+
+
+def test_older_rename_of_same_name_is_ignored() -> None:
+    """Test rename into old name, which happened before file got its current name"""
+    events = [
+        RenameEvent("c2", "b.py", "c.py"),
+        RenameEvent("c1", "x.py", "c.py"),
+    ]
+    assert get_history_names(events, "c.py") == ["c.py", "b.py"]
+
+
+def test_parse_name_status_log() -> None:
+    """Test renames are parsed from name status log"""
+    assert parse_name_status_log(
+        "\x1fc2\0\nR100\0b.py\0c\tx.py\0M\0d.py\0\x1fc1\0\nR087\0a.py\0b.py\0".split(
+            "\0"
+        )
+    ) == [RenameEvent("c2", "b.py", "c\tx.py"), RenameEvent("c1", "a.py", "b.py")]
+
+
+def test_reused_name() -> None:
+    """Test that chain ends, where older file with the same name was renamed away"""
+    events = [
+        RenameEvent("c4", "g1.py", "h1.py"),
+        RenameEvent("c3", "f1.py", "g1.py"),
+        RenameEvent("c1", "e1.py", "f1.py"),
+    ]
+    assert get_history_names(events, "f1.py") == ["f1.py"]
+    assert get_history_pathspec_names(events, "f1.py") == ["f1.py", "g1.py"]
+    assert get_history_names(events, "h1.py") == ["h1.py", "g1.py", "f1.py", "e1.py"]
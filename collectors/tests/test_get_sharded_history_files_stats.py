@@ -0,0 +1,63 @@
+"""Test get_sharded_history_files_stats"""
+
+from pathlib import Path
+import pytest
+from git import Repo
+from app_types.dataclasses import GitLogOptions
+from benchmarks.synthetic_repo import SyntheticRepoShape, create_synthetic_repo
+from collectors import sharded_history_collector
+from collectors.history_collector import get_history_files_stats
+from collectors.sharded_history_collector import get_sharded_history_files_stats
+from utils.git_utils import get_flat_file_tree
+from conftest import GitTestRepo
+
+
+@pytest.mark.parametrize("jobs", [1, 2, 3])
+def test_same_stats_as_serial_scan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, jobs: int
+) -> None:
+    """Test that merged stats of commit ranges match single pass over history"""
+    monkeypatch.setattr(sharded_history_collector, "MIN_COMMITS_PER_SHARD", 1)
+    repo = Repo(
+        create_synthetic_repo(
+            str(tmp_path), SyntheticRepoShape(files=20, commits=60, rename_rate=0.3)
+        )
+    )
+    file_names = get_flat_file_tree(repo.head.commit.tree)
+    log_options = GitLogOptions(None, None)
+
+    result = get_sharded_history_files_stats(file_names, repo.git, log_options, jobs)
+
+    expected = get_history_files_stats(file_names, repo.git, log_options)
+    assert result.to_files_stats() == expected.to_files_stats()
+    assert result.file_names == file_names
+
+
+@pytest.mark.parametrize("jobs", [2, 3, 6])
+def test_merged_rename_with_tied_dates(
+    git_repo: GitTestRepo, monkeypatch: pytest.MonkeyPatch, jobs: int
+) -> None:
+    """Test that parts of history, which are split across merge, keep serial order"""
+    monkeypatch.setattr(sharded_history_collector, "MIN_COMMITS_PER_SHARD", 1)
+    git_repo.append_lines("a.py", 15)
+    git_repo.commit("create")
+    git_repo.append_lines("a.py", 2)
+    git_repo.commit("main change")
+    git_repo.git("checkout", "-q", "-b", "side", "HEAD~1")
+    git_repo.git("mv", "a.py", "b.py")
+    git_repo.commit("rename")
+    git_repo.append_lines("side.py", 3)
+    git_repo.commit("add side file")
+    git_repo.git("checkout", "-q", "main")
+    git_repo.git("merge", "-q", "--no-edit", "side")
+    git_repo.append_lines("b.py", 5)
+    git_repo.commit("change")
+    repo = Repo(git_repo.path)
+    file_names = get_flat_file_tree(repo.head.commit.tree)
+    log_options = GitLogOptions(None, None)
+
+    result = get_sharded_history_files_stats(file_names, repo.git, log_options, jobs)
+
+    expected = get_history_files_stats(file_names, repo.git, log_options)
+    assert result.to_files_stats() == expected.to_files_stats()
+    assert len(result.to_files_stats()["b.py"]) == 4
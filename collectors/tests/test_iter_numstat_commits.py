@@ -0,0 +1,66 @@
+"""Test iter_numstat_commits"""
+
+from app_types.dataclasses import NumstatCommit, NumstatEntry
+from collectors.numstat_parser import iter_numstat_commits
+
+LOG_OUTPUT = (
+    b"\x1fauthor3\0\n2\t0\t\0old dir/a.py\0new dir/a.py\0"
+    b"\x1fmerger\0"
+    b"\x1fauthor2\0\n-\t-\timage.png\0"
+    b"1\t1\tb.py\0"
+    b"\x1fauthor1\0\n10\t0\told dir/a.py\0"
+)
+
+EXPECTED_COMMITS = [
+    NumstatCommit("author3", [NumstatEntry(2, 0, "old dir/a.py", "new dir/a.py")]),
+    NumstatCommit("merger", []),
+    NumstatCommit(
+        "author2",
+        [NumstatEntry(None, None, None, "image.png"), NumstatEntry(1, 1, None, "b.py")],
+    ),
+    NumstatCommit("author1", [NumstatEntry(10, 0, None, "old dir/a.py")]),
+]
+
+
+def test_empty_output() -> None:
+    """Test that empty output has no commits"""
+    assert not list(iter_numstat_commits([]))
+
+
+def test_whole_output() -> None:
+    """Test renames, binary entries and commits without entries"""
+    assert list(iter_numstat_commits([LOG_OUTPUT])) == EXPECTED_COMMITS
+
+
+def test_every_chunk_boundary() -> None:
+    """Test that result does not depend on where output is split into chunks"""
+    for split_index in range(len(LOG_OUTPUT) + 1):
+        chunks = [LOG_OUTPUT[:split_index], LOG_OUTPUT[split_index:]]
+        assert list(iter_numstat_commits(chunks)) == EXPECTED_COMMITS
+
+
+def test_single_byte_chunks() -> None:
+    """Test output fed one byte at a time"""
+    chunks = [LOG_OUTPUT[index : index + 1] for index in range(len(LOG_OUTPUT))]
+    assert list(iter_numstat_commits(chunks)) == EXPECTED_COMMITS
+
+
+def test_output_without_trailing_separator() -> None:
+    """Test that last token is parsed when output does not end with separator"""
+    assert list(iter_numstat_commits([LOG_OUTPUT[:-1]])) == EXPECTED_COMMITS
+
+
+def test_name_status_output() -> None:
+    """Test output without line counts, renames have both paths"""
+    output = (
+        b"\x1f\0\nR100\0old.py\0new.py\0M\0a.py\0\x1f\0\nD\0b.py\0"
+        b"\x1fauthor\0\nA\0old.py\0"
+    )
+    assert list(iter_numstat_commits([output], line_counts=False)) == [
+        NumstatCommit(
+            "",
+            [NumstatEntry(0, 0, "old.py", "new.py"), NumstatEntry(0, 0, None, "a.py")],
+        ),
+        NumstatCommit("", [NumstatEntry(0, 0, None, "b.py")]),
+        NumstatCommit("author", [NumstatEntry(0, 0, None, "old.py")]),
+    ]
@@ -0,0 +1,76 @@
+"""Test merge_history_shards"""
+
+from app_types.dataclasses import FileCommitStats, HistoryShard
+from collectors.commit_stats_store import create_commit_stats_store
+from collectors.sharded_history_collector import merge_history_shards
+
+# Newest range: b.py was renamed to c.py
+NEWEST_SHARD = HistoryShard(
+    create_commit_stats_store(
+        {
+            "a.py": [FileCommitStats(1, 0, "x")],
+            "c.py": [FileCommitStats(2, 1, "y")],
+        }
+    ),
+    {"b.py": "c.py", "c.py": None},
+)
+# Middle range: z.py was renamed to a.py
+MIDDLE_SHARD = HistoryShard(
+    create_commit_stats_store(
+        {
+            "a.py": [FileCommitStats(3, 0, "x")],
+            "b.py": [FileCommitStats(4, 2, "x")],
+        }
+    ),
+    {"z.py": "a.py", "a.py": None},
+)
+OLDEST_SHARD = HistoryShard(
+    create_commit_stats_store(
+        {
+            "b.py": [FileCommitStats(5, 0, "y")],
+            "z.py": [FileCommitStats(6, 0, "y")],
+        }
+    ),
+    {},
+)
+
+
+def test_renames_of_newer_range_are_applied() -> None:
+    """Test that files of older range are named as at the newest commit"""
+    merged = merge_history_shards(NEWEST_SHARD, MIDDLE_SHARD)
+
+    assert merged.store.to_files_stats() == {
+        "a.py": [FileCommitStats(1, 0, "x"), FileCommitStats(3, 0, "x")],
+        "c.py": [FileCommitStats(2, 1, "y"), FileCommitStats(4, 2, "x")],
+    }
+    assert merged.aliases == {
+        "b.py": "c.py",
+        "c.py": None,
+        "z.py": "a.py",
+        "a.py": None,
+    }
+
+
+def test_merge_is_associative() -> None:
+    """Test that ranges can be grouped in any way"""
+    left_merged = merge_history_shards(
+        merge_history_shards(NEWEST_SHARD, MIDDLE_SHARD), OLDEST_SHARD
+    )
+    right_merged = merge_history_shards(
+        NEWEST_SHARD, merge_history_shards(MIDDLE_SHARD, OLDEST_SHARD)
+    )
+
+    assert left_merged.store.to_files_stats() == right_merged.store.to_files_stats()
+    assert left_merged.aliases == right_merged.aliases
+    assert left_merged.store.to_files_stats() == {
+        "a.py": [
+            FileCommitStats(1, 0, "x"),
+            FileCommitStats(3, 0, "x"),
+            FileCommitStats(6, 0, "y"),
+        ],
+        "c.py": [
+            FileCommitStats(2, 1, "y"),
+            FileCommitStats(4, 2, "x"),
+            FileCommitStats(5, 0, "y"),
+        ],
+    }
@@ -0,0 +1,60 @@
+"""Test spread_numstat_commits"""
+
+from app_types.dataclasses import NumstatCommit, NumstatEntry, FileCommitStats
+from collectors.numstat_parser import spread_numstat_commits
+
+
+def test_empty_log() -> None:
+    """Test empty log - every tracked file has empty stats"""
+    assert spread_numstat_commits([], {"a.py"}).to_files_stats() == {"a.py": []}
+
+
+def test_stats_spread_across_files() -> None:
+    """Test each numstat entry is attributed to its file and commit author"""
+    result = spread_numstat_commits(
+        [
+            NumstatCommit(
+                "author1",
+                [NumstatEntry(1, 2, None, "a.py"), NumstatEntry(3, 4, None, "b.py")],
+            ),
+            NumstatCommit("author2", [NumstatEntry(5, 6, None, "a.py")]),
+        ],
+        {"a.py", "b.py"},
+    ).to_files_stats()
+    assert [(s.added_lines, s.removed_lines, s.author) for s in result["a.py"]] == [
+        (1, 2, "author1"),
+        (5, 6, "author2"),
+    ]
+    assert [(s.added_lines, s.removed_lines, s.author) for s in result["b.py"]] == [
+        (3, 4, "author1"),
+    ]
+
+
+def test_untracked_files_skipped_and_binary_without_lines() -> None:
+    """Test that not requested files are skipped and binary files have no lines"""
+    result = spread_numstat_commits(
+        [
+            NumstatCommit(
+                "author",
+                [
+                    NumstatEntry(1, 1, None, "other.py"),
+                    NumstatEntry(None, None, None, "image.png"),
+                ],
+            )
+        ],
+        {"image.png"},
+    ).to_files_stats()
+    assert result == {"image.png": [FileCommitStats(0, 0, "author")]}
+
+
+def test_renamed_file_history_attributed_to_current_name() -> None:
+    """Test that stats of older file names are attributed to its current name"""
+    result = spread_numstat_commits(
+        [
+            NumstatCommit("author3", [NumstatEntry(2, 0, "dir/old.py", "dir/new.py")]),
+            NumstatCommit("author2", [NumstatEntry(1, 0, None, "dir/new.py")]),
+            NumstatCommit("author1", [NumstatEntry(3, 0, None, "dir/old.py")]),
+        ],
+        {"dir/new.py"},
+    ).to_files_stats()
+    assert [stat.author for stat in result["dir/new.py"]] == ["author3", "author1"]
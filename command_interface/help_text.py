@@ -5,10 +5,12 @@ from command_interface.parameter_lists import (
     AVAILABLE_SORT,
     AVAILABLE_SIGNS,
     AVAILABLE_TABLE_LIBS,
+    AVAILABLE_COLLECTORS,
+    AVAILABLE_CALCULATORS,
+    AVAILABLE_QUERY_BACKENDS,
 )
 from enums.table import CliTableColumn
 
-
 COLUMN_OPTION_EXAMPLE = (
     f"{CliTableColumn.FILE_NAME.value},{CliTableColumn.LINE_COUNT.value}"
 )
@@ -19,3 +21,6 @@ COMMAND_OPTION_COLUMN_NAMES_TEXT = ", ".join(COMMAND_OPTION_COLUMN_NAMES)
 AVAILABLE_SORT_TEXT = ", ".join(AVAILABLE_SORT)
 AVAILABLE_SIGNS_TEXT = ", ".join(AVAILABLE_SIGNS)
 AVAILABLE_TABLE_LIBS_TEXT = ", ".join(AVAILABLE_TABLE_LIBS)
+AVAILABLE_COLLECTORS_TEXT = ", ".join(AVAILABLE_COLLECTORS)
+AVAILABLE_CALCULATORS_TEXT = ", ".join(AVAILABLE_CALCULATORS)
+AVAILABLE_QUERY_BACKENDS_TEXT = ", ".join(AVAILABLE_QUERY_BACKENDS)
@@ -1,181 +1,388 @@
 """Option processors"""
 
+import os
+from dataclasses import replace
 from typing import Optional, Tuple, List, Dict
-from sqlalchemy.orm import Session
-from sqlalchemy import Engine
-from git import Repo, Git
+from git import Repo
 from halo import Halo
 
+from app_types.protocols import QueryExecutor
 from app_types.result import ResultUnion
-from app_types.dataclasses import FileCommitStats, GitLogOptions
+from app_types.dataclasses import GitLogOptions, CollectionOptions, QueryPlan
+from collectors.commit_stats_store import CommitStatsStoreBuilder
+from collectors.stats_cache import update_stats_cache
+from defaults.command import DEFAULT_PATHNAME_LENGTH
 from enums.table import CliTableColumn
-from repositories.git_stat_repo import prepare_query_statement, prepare_all_rows
+from query_option_parser.nodes import StatementNode
 from utils.command_option_parser import parse_option_query
-from utils.filesystem import get_stored_queries_from_file, save_queries_to_file
+from utils.filesystem import get_results_db_file_path
 from utils.git_utils import (
     get_repo_instance,
     get_flat_file_tree,
-    get_all_files_stats,
-    get_non_text_files,
 )
-from utils.table_data_calculator import TableDataCalculator
-from validators.command_option_validators import (
-    assert_query_exists_for_execution,
-    assert_only_single_terminating_option_provided,
+from utils.profiler import QueryProfiler
+from utils.query_planner import (
+    plan_query,
+    create_file_name_filter,
+    get_pushed_down_pathspecs,
+    plan_all_columns,
+    plan_queries,
+)
+from utils.table_data_calculator import (
+    TableDataCalculator,
+    AggregateTableDataCalculator,
 )
 from validators.repo_validators import assert_repo_result_is_valid
 from validators.root_node_validators import assert_root_node_result_is_valid
 
 
-def process_query(
-    query: Optional[str],
-    engine: Engine,
-    spinner: Halo,
-) -> Tuple[List[CliTableColumn], List[List[str | float | int]]]:
-    """Process query option provided"""
-    spinner.start("Gathering Git information")
-    all_files_stats: Dict[str, List[FileCommitStats]]
-    root_node_result = parse_option_query(query)
-
-    assert_root_node_result_is_valid(root_node_result)
-    root_node = root_node_result.value
+def get_log_options(
+    root_node: StatementNode, query_plan: QueryPlan, file_names: List[str]
+) -> GitLogOptions:
+    """Prepare git log options for query plan"""
+    return GitLogOptions(
+        (
+            root_node.interval_node.since
+            if root_node.interval_node is not None
+            else None
+        ),
+        (
+            root_node.interval_node.until
+            if root_node.interval_node is not None
+            else None
+        ),
+        line_counts=query_plan.requirements.line_counts,
+        authors=query_plan.requirements.authors,
+        pathspecs=get_pushed_down_pathspecs(query_plan, file_names),
+    )
 
-    repo_result: ResultUnion[Repo] = get_repo_instance(root_node.from_node.path)
-    assert_repo_result_is_valid(repo_result)
-    repo: Repo = repo_result.value
 
-    flat_file_tree = get_flat_file_tree(
-        repo.head.commit.tree,
-        root_node.from_node.path,
+def collect_table_data(
+    repo: Repo,
+    file_names: List[str],
+    log_options: GitLogOptions,
+    query_plan: QueryPlan,
+    collection_options: CollectionOptions,
+) -> TableDataCalculator:
+    """
+    Collect git data needed by query plan
+    :param repo: Repository instance
+    :param file_names: Files, for which data is collected
+    :param log_options: Git log options
+    :param query_plan: Query plan
+    :param collection_options: Options of git stats collection
+    :return: Calculator of table data over collected stats
+    """
+    if not query_plan.requirements.commits:
+        return collection_options.calculator(
+            file_names,
+            CommitStatsStoreBuilder().build(),
+            pathname_length=DEFAULT_PATHNAME_LENGTH,
+        )
+
+    if (
+        collection_options.use_cache
+        and log_options.since is None
+        and log_options.until is None
+    ):
+        return AggregateTableDataCalculator(
+            file_names,
+            update_stats_cache(repo).files,
+            pathname_length=DEFAULT_PATHNAME_LENGTH,
+        )
+
+    return collection_options.calculator(
+        file_names,
+        collection_options.collector(
+            file_names, repo.git, log_options, collection_options.jobs
+        ),
+        pathname_length=DEFAULT_PATHNAME_LENGTH,
     )
-    all_files_stats = get_all_files_stats(
-        flat_file_tree,
-        repo.git,
-        GitLogOptions(
-            (
-                root_node.interval_node.since
-                if root_node.interval_node is not None
-                else None
-            ),
+
+
+# pylint: disable = too-many-arguments, too-many-positional-arguments
+def calculate_plan_data_rows(
+    root_node: StatementNode,
+    repo: Repo,
+    query_plan: QueryPlan,
+    spinner: Halo,
+    collection_options: CollectionOptions,
+    profiler: QueryProfiler,
+    information_name: str = "Git information",
+) -> List[List[str | float | int]]:
+    """
+    Gather git data of files of query FROM path and calculate rows of plan columns,
+    files are narrowed down by file name condition and file limit of plan
+    :param root_node: Query, which FROM path and interval are used
+    :param repo: Repository instance
+    :param query_plan: Query plan
+    :param spinner: Spinner
+    :param collection_options: Options of git stats collection
+    :param profiler: Profiler of processing stages
+    :param information_name: Name of gathered data in stage and spinner messages
+    :return: Data rows of plan columns
+    """
+    with profiler.stage(f"Gathering {information_name}") as stage_profile:
+        flat_file_tree = get_flat_file_tree(
+            repo.head.commit.tree,
+            root_node.from_node.path,
             (
-                root_node.interval_node.until
-                if root_node.interval_node is not None
+                create_file_name_filter(
+                    query_plan.file_name_condition, DEFAULT_PATHNAME_LENGTH
+                )
+                if query_plan.file_name_condition is not None
                 else None
             ),
-        ),
-    )
-    spinner.succeed("Git information gathered")
+        )[: query_plan.file_limit]
+        table_data_builder = collect_table_data(
+            repo,
+            flat_file_tree,
+            get_log_options(root_node, query_plan, flat_file_tree),
+            query_plan,
+            collection_options,
+        )
+        stage_profile.rows = len(flat_file_tree)
+    spinner.succeed(f"{information_name} gathered")
 
     spinner.start("Calculating data")
-    table_data_builder = TableDataCalculator(
-        flat_file_tree,
-        all_files_stats,
-        pathname_length=2,
-    )
-    select = prepare_query_statement(root_node)
-    data_rows = table_data_builder.calculate_data(root_node.show_node.column_names)
+    with profiler.stage("Calculating data") as stage_profile:
+        data_rows = table_data_builder.calculate_data(query_plan.columns)
+        stage_profile.rows = len(data_rows)
     spinner.succeed("Data calculated")
 
-    spinner.start("Processing sorting/filtering of data")
-    with Session(engine) as session:
-        git_stat_list = prepare_all_rows(root_node.show_node.column_names, data_rows)
-        session.add_all(git_stat_list)
-        session.commit()
-        rows = [[*row] for row in session.execute(select)]
-    spinner.succeed("Data sorted and filtered")
-
-    return root_node.show_node.column_names, rows
-
-
-def process_list_non_text_option(repo_path: str | None, non_text: bool) -> bool:
-    """Process options, after which all other options are ignored"""
-    if non_text:
-        non_text_files = get_non_text_files(Git(repo_path))
-        if len(non_text_files) > 0:
-            print("Non-text files:")
-            print("\n".join(non_text_files))
-        else:
-            print("No non-text files have been found!")
-        return True
-
-    return False
-
+    return data_rows
+
+
+def execute_query_stage(
+    stage_name: str,
+    root_node: StatementNode,
+    columns: List[CliTableColumn],
+    data_rows: List[List[str | float | int]],
+    query_executor: QueryExecutor,
+    profiler: QueryProfiler,
+) -> List[List[str | float | int]]:
+    """
+    Filter and sort data rows by query, as profiled stage
+    :param stage_name: Name of profiled stage
+    :param root_node: Query
+    :param columns: Columns of data rows
+    :param data_rows: Data rows
+    :param query_executor: Executor of filtering and sorting
+    :param profiler: Profiler of processing stages
+    :return: Result rows of query
+    """
+    with profiler.stage(stage_name) as stage_profile:
+        rows = query_executor(root_node, columns, data_rows)
+        stage_profile.rows = len(rows)
+    return rows
+
+
+def process_query_in_results_db(
+    root_node: StatementNode,
+    repo: Repo,
+    spinner: Halo,
+    collection_options: CollectionOptions,
+    profiler: QueryProfiler,
+) -> List[List[str | float | int]]:
+    """
+    Execute query in results database, every column of every file is calculated
+    and saved there only when HEAD commit has changed since previous run
+    """
+    # pylint: disable = import-outside-toplevel
+    from repositories.results_db_repo import (
+        get_results_db_head_commit,
+        save_results_db,
+        execute_query_in_results_db,
+    )
 
-def process_save_query(query: Optional[str], save_query_name: Optional[str]) -> None:
-    """Save currently executing query to the file"""
-    if query is None or query.strip() == "":
-        if save_query_name is not None and save_query_name.strip() != "":
-            print(
-                "You have provided the query name for saving, but query argument is empty!"
+    results_db_file_path = os.path.join(
+        *get_results_db_file_path(str(repo.working_dir), root_node.from_node.path)
+    )
+    head_commit = repo.head.commit.hexsha
+    if get_results_db_head_commit(results_db_file_path) == head_commit:
+        spinner.succeed("Data loaded from results database")
+    else:
+        query_plan = plan_all_columns()
+        data_rows = calculate_plan_data_rows(
+            root_node, repo, query_plan, spinner, collection_options, profiler
+        )
+        spinner.start("Saving results database")
+        with profiler.stage("Saving results database") as stage_profile:
+            save_results_db(
+                results_db_file_path, head_commit, query_plan.columns, data_rows
             )
-        return
+            stage_profile.rows = len(data_rows)
+        spinner.succeed("Data saved to results database")
 
-    if save_query_name is None or save_query_name.strip() == "":
-        return
+    spinner.start("Processing sorting/filtering of data")
+    with profiler.stage("Processing sorting/filtering of data") as stage_profile:
+        rows = execute_query_in_results_db(results_db_file_path, root_node)
+        stage_profile.rows = len(rows)
+    spinner.succeed("Data sorted and filtered")
 
-    queries = get_stored_queries_from_file()
-    queries[save_query_name] = query
-    save_queries_to_file(queries)
-    print("Query is stored successfully!")
+    return rows
 
 
-def process_execute_stored_query(query_name: Optional[str]) -> str | None:
-    """Execute stored query"""
-    if query_name is None or query_name.strip() == "":
-        return None
+def parse_query_root_node(query: Optional[str]) -> StatementNode:
+    """Parse query, exit if it is not valid"""
+    root_node_result = parse_option_query(query)
+    assert_root_node_result_is_valid(root_node_result)
+    return root_node_result.value
 
-    queries = get_stored_queries_from_file()
-    assert_query_exists_for_execution(query_name, queries)
 
-    return queries[query_name]
+def can_use_results_db(
+    root_node: StatementNode, collection_options: CollectionOptions
+) -> bool:
+    """
+    Check if query can be executed in results database.
+    Relative interval dates move with time, while rows are kept until HEAD moves
+    """
+    return collection_options.use_results_db and root_node.interval_node is None
 
 
-def process_list_stored_queries(list_queries: Optional[bool]) -> bool:
-    """List all the queries if requested"""
-    if list_queries:
-        queries = get_stored_queries_from_file()
+def get_query_repo(root_node: StatementNode) -> Repo:
+    """Get repository of query FROM path, exit if it is not a repository"""
+    repo_result: ResultUnion[Repo] = get_repo_instance(root_node.from_node.path)
+    assert_repo_result_is_valid(repo_result)
+    return repo_result.value
 
-        print("Stored queries")
-        for query in queries:
-            print(f"{query}: {queries[query]}")
 
-        return True
+def process_query(
+    query: Optional[str],
+    spinner: Halo,
+    collection_options: CollectionOptions,
+    query_executor: QueryExecutor,
+    profiler: QueryProfiler,
+) -> Tuple[List[CliTableColumn], List[List[str | float | int]]]:
+    """Process query option provided"""
+    spinner.start("Gathering Git information")
+    root_node = parse_query_root_node(query)
+    repo = get_query_repo(root_node)
 
-    return False
+    if can_use_results_db(root_node, collection_options):
+        return root_node.show_node.column_names, process_query_in_results_db(
+            root_node, repo, spinner, collection_options, profiler
+        )
 
+    query_plan = plan_query(root_node)
+    data_rows = calculate_plan_data_rows(
+        root_node, repo, query_plan, spinner, collection_options, profiler
+    )
 
-def process_remove_stored_query(query_name: Optional[str]) -> bool:
-    """Remove previously stored query if requested"""
-    if query_name is not None and query_name.strip() != "":
-        queries = get_stored_queries_from_file()
+    spinner.start("Processing sorting/filtering of data")
+    rows = execute_query_stage(
+        "Processing sorting/filtering of data",
+        replace(root_node, where_node=query_plan.where_node),
+        query_plan.columns,
+        data_rows,
+        query_executor,
+        profiler,
+    )
+    spinner.succeed("Data sorted and filtered")
 
-        if query_name in queries.keys():
-            queries.pop(query_name)
-            save_queries_to_file(queries)
-            print("Stored query removed successfully")
-        else:
-            print(
-                f"Cannot delete query. There is no stored query with name: {query_name}"
-            )
+    return root_node.show_node.column_names, rows
 
-        return True
 
-    return False
+def get_collection_group_key(
+    root_node: StatementNode,
+) -> Tuple[str, Optional[str], Optional[str]]:
+    """Get key of queries, which can share collected git data: FROM path and interval"""
+    return (
+        os.path.abspath(root_node.from_node.path),
+        root_node.interval_node.since if root_node.interval_node is not None else None,
+        root_node.interval_node.until if root_node.interval_node is not None else None,
+    )
 
 
-def process_terminating_options(
-    file_path: str,
-    **kwargs,
-) -> bool:
-    """Process terminating options"""
-    assert_only_single_terminating_option_provided(**kwargs)
-    if process_list_stored_queries(kwargs.get("list_queries", None)):
-        return True
+def process_query_group(
+    root_nodes: Dict[str, StatementNode],
+    spinner: Halo,
+    collection_options: CollectionOptions,
+    query_executor: QueryExecutor,
+    profiler: QueryProfiler,
+) -> Dict[str, List[List[str | float | int]]]:
+    """
+    Process queries with same FROM path and interval over git data collected once
+    :param root_nodes: Queries of group by their names
+    :param spinner: Spinner
+    :param collection_options: Options of git stats collection
+    :param query_executor: Executor of filtering and sorting
+    :param profiler: Profiler of processing stages
+    :return: Result rows of each query, by query name
+    """
+    group_root_node = next(iter(root_nodes.values()))
+    information_name = (
+        f"Git information of {os.path.abspath(group_root_node.from_node.path)}"
+    )
+    spinner.start(f"Gathering {information_name}")
+    repo = get_query_repo(group_root_node)
+    if can_use_results_db(group_root_node, collection_options):
+        return {
+            name: process_query_in_results_db(
+                root_node, repo, spinner, collection_options, profiler
+            )
+            for name, root_node in root_nodes.items()
+        }
+
+    query_plan = plan_queries(list(root_nodes.values()))
+    data_rows = calculate_plan_data_rows(
+        group_root_node,
+        repo,
+        query_plan,
+        spinner,
+        collection_options,
+        profiler,
+        information_name,
+    )
 
-    if process_remove_stored_query(kwargs.get("remove_query", None)):
-        return True
+    spinner.start("Processing sorting/filtering of data")
+    rows = {
+        name: execute_query_stage(
+            f"Processing query {name}",
+            root_node,
+            query_plan.columns,
+            data_rows,
+            query_executor,
+            profiler,
+        )
+        for name, root_node in root_nodes.items()
+    }
+    spinner.succeed("Data sorted and filtered")
+    return rows
 
-    if process_list_non_text_option(file_path, kwargs.get("list_non_text", False)):
-        return True
 
-    return False
+def process_queries(
+    queries: Dict[str, str],
+    spinner: Halo,
+    collection_options: CollectionOptions,
+    query_executor: QueryExecutor,
+    profiler: QueryProfiler,
+) -> Dict[str, Tuple[List[CliTableColumn], List[List[str | float | int]]]]:
+    """
+    Process several queries, git data is collected once for queries
+    with same FROM path and interval, and every query is executed over it
+    :param queries: Queries by their names
+    :param spinner: Spinner
+    :param collection_options: Options of git stats collection
+    :param query_executor: Executor of filtering and sorting
+    :param profiler: Profiler of processing stages
+    :return: Shown columns and rows of each query, by query name
+    """
+    root_nodes = {name: parse_query_root_node(query) for name, query in queries.items()}
+    groups: Dict[Tuple[str, Optional[str], Optional[str]], List[str]] = {}
+    for name, root_node in root_nodes.items():
+        groups.setdefault(get_collection_group_key(root_node), []).append(name)
+
+    results: Dict[str, Tuple[List[CliTableColumn], List[List[str | float | int]]]] = {}
+    for names in groups.values():
+        group_rows = process_query_group(
+            {name: root_nodes[name] for name in names},
+            spinner,
+            collection_options,
+            query_executor,
+            profiler,
+        )
+        for name, rows in group_rows.items():
+            results[name] = root_nodes[name].show_node.column_names, rows
+
+    return {name: results[name] for name in queries}
@@ -1,6 +1,6 @@
 """Command options decorators"""
 
-from click import option, Command
+from click import option, Command, IntRange
 
 from command_interface.help_text import (
     COMMAND_OPTION_COLUMN_NAMES_TEXT,
@@ -9,12 +9,22 @@ from command_interface.help_text import (
     AVAILABLE_SORT_TEXT,
     AVAILABLE_SIGNS_TEXT,
     AVAILABLE_TABLE_LIBS_TEXT,
+    AVAILABLE_COLLECTORS_TEXT,
+    AVAILABLE_CALCULATORS_TEXT,
+    AVAILABLE_QUERY_BACKENDS_TEXT,
 )
 from defaults.command import (
     DEFAULT_COLUMNS,
     DEFAULT_SORT,
+    DEFAULT_JOBS,
+    DEFAULT_WATCH_INTERVAL,
+)
+from enums.application import (
+    TableLibrary,
+    CollectorBackend,
+    CalculatorBackend,
+    QueryBackend,
 )
-from enums.application import TableLibrary
 
 
 def columns_option(func) -> Command:
@@ -122,6 +132,121 @@ def table_option(func) -> Command:
     )(func)
 
 
+def collector_option(func) -> Command:
+    """Git stats collector choice option"""
+    return option(
+        "--collector",
+        default=CollectorBackend.HISTORY.value,
+        help=f"""
+            Specify how git stats are collected: {AVAILABLE_COLLECTORS_TEXT}\n
+            history - scans whole git history once\n
+            per-file - runs separate git log for each file\n
+            process - runs separate git log for each file in pool of worker processes\n
+            async - streams separate git log for each file from asyncio subprocesses,
+            suitable for high --jobs values on slow (network) file systems\n
+            sharded - splits history into commit ranges, which are scanned
+            in pool of worker processes, suitable for very deep histories
+        """,
+    )(func)
+
+
+def calculator_option(func) -> Command:
+    """Table data calculator choice option"""
+    return option(
+        "--calculator",
+        default=CalculatorBackend.PYTHON.value,
+        help=f"""
+            Specify how column values are calculated: {AVAILABLE_CALCULATORS_TEXT}\n
+            python - calculates each column of each file separately\n
+            numpy - calculates each column for all files at once,
+            requires numpy package to be installed
+        """,
+    )(func)
+
+
+def query_backend_option(func) -> Command:
+    """Backend, which filters and sorts calculated rows, choice option"""
+    return option(
+        "--query-backend",
+        default=QueryBackend.MEMORY.value,
+        help=f"""
+            Specify how WHERE and ORDERBY are executed: {AVAILABLE_QUERY_BACKENDS_TEXT}\n
+            memory - filters and sorts rows in process, without database\n
+            sqlite - inserts rows into in memory SQLite database and queries them there
+        """,
+    )(func)
+
+
+def jobs_option(func) -> Command:
+    """Amount of concurrent git processes option"""
+    return option(
+        "--jobs",
+        "-j",
+        type=IntRange(min=1),
+        default=DEFAULT_JOBS,
+        show_default=True,
+        help="""
+            Amount of git processes (or worker processes) run at once
+            while collecting git stats. Defaults to CPU count.
+        """,
+    )(func)
+
+
+def cache_option(func) -> Command:
+    """Persistent stats cache option"""
+    return option(
+        "--cache",
+        is_flag=True,
+        default=False,
+        help="""
+            Keep summed up file stats in cache (~/.git-gut/cache) and on next run
+            scan only commits added since previous run.
+            Cache is not used when INTERVAL (since/until) is provided.
+        """,
+    )(func)
+
+
+def results_db_option(func) -> Command:
+    """Persistent database of calculated rows option"""
+    return option(
+        "--results-db",
+        is_flag=True,
+        default=False,
+        help="""
+            Keep calculated rows of all columns in SQLite database (~/.git-gut/results)
+            for each repository path, they are recalculated when HEAD commit changes.
+            Next queries against the same HEAD commit are executed in the database,
+            without reading git history. Queries with INTERVAL are not saved there,
+            as relative dates like "2 weeks ago" move over time.
+        """,
+    )(func)
+
+
+def profile_option(func) -> Command:
+    """Profile of query processing stages option"""
+    return option(
+        "--profile",
+        is_flag=True,
+        default=False,
+        help="""
+            After the table, print wall and CPU time, amount of spawned git processes,
+            bytes read from git, produced rows and peak RSS of each processing stage.
+        """,
+    )(func)
+
+
+def profile_output_option(func) -> Command:
+    """cProfile stats output option"""
+    return option(
+        "--profile-output",
+        default=None,
+        help="""
+            Path, where cProfile stats of processing stages are written,
+            they can be read with pstats module. Used together with --profile.
+        """,
+    )(func)
+
+
 def save_query_option(func) -> Command:
     """Save currently executing query"""
     return option(
@@ -147,6 +272,35 @@ def execute_stored_query_option(func) -> Command:
     )(func)
 
 
+def execute_stored_queries_option(func) -> Command:
+    """Execute several previously stored queries"""
+    return option(
+        "--execute-queries",
+        "--eqs",
+        default=None,
+        help="""
+            Execute previously stored queries with provided comma separated names.
+            Git data is collected once for queries with same FROM path and interval.
+            All other options, except collection ones, are ignored.
+        """,
+    )(func)
+
+
+def execute_all_stored_queries_option(func) -> Command:
+    """Execute all previously stored queries"""
+    return option(
+        "--execute-all-queries",
+        "--eaq",
+        is_flag=True,
+        default=False,
+        help="""
+            Execute all previously stored queries.
+            Git data is collected once for queries with same FROM path and interval.
+            All other options, except collection ones, are ignored.
+        """,
+    )(func)
+
+
 def show_stored_queries_option(func) -> Command:
     """Show all stored queries"""
     return option(
@@ -172,3 +326,52 @@ def remove_stored_query(func) -> Command:
             This is terminating option - all other options are ignored.
         """,
     )(func)
+
+
+def serve_option(func) -> Command:
+    """Query server option"""
+    return option(
+        "--serve",
+        is_flag=True,
+        default=False,
+        help="""
+            Run query server, which keeps stats of queried repositories in memory
+            and updates them incrementally, when HEAD moves. Server listens on Unix
+            socket from --socket option, or on socket in application directory.
+        """,
+    )(func)
+
+
+def socket_option(func) -> Command:
+    """Query server socket option"""
+    return option(
+        "--socket",
+        default=None,
+        help="""
+            Path of query server Unix socket. Without --serve, query is sent
+            to running server and its result rows are drawn.
+        """,
+    )(func)
+
+
+def watch_option(func) -> Command:
+    """Watch mode option"""
+    return option(
+        "--watch",
+        is_flag=True,
+        default=False,
+        help="""
+            Keep running and redraw the table whenever HEAD or refs of repository change.
+            Only new commits are scanned on each redraw.
+        """,
+    )(func)
+
+
+def watch_interval_option(func) -> Command:
+    """Watch mode interval option"""
+    return option(
+        "--watch-interval",
+        default=DEFAULT_WATCH_INTERVAL,
+        type=float,
+        help="Seconds between checks of HEAD and refs in --watch mode.",
+    )(func)
@@ -2,7 +2,12 @@
 
 from enums.table import CliTableColumn, SortingDirection
 
-from enums.application import TableLibrary
+from enums.application import (
+    TableLibrary,
+    CollectorBackend,
+    CalculatorBackend,
+    QueryBackend,
+)
 from query_option_parser.string_tokens import ALLOWED_SIGNS
 
 COMMAND_OPTION_COLUMN_NAMES = list(
@@ -21,3 +26,18 @@ AVAILABLE_SIGNS = list(ALLOWED_SIGNS)
 AVAILABLE_TABLE_LIBS = [
     TableLibrary[lib].value for lib in dir(TableLibrary) if not lib.startswith("_")
 ]
+AVAILABLE_COLLECTORS = [
+    CollectorBackend[backend].value
+    for backend in dir(CollectorBackend)
+    if not backend.startswith("_")
+]
+AVAILABLE_CALCULATORS = [
+    CalculatorBackend[backend].value
+    for backend in dir(CalculatorBackend)
+    if not backend.startswith("_")
+]
+AVAILABLE_QUERY_BACKENDS = [
+    QueryBackend[backend].value
+    for backend in dir(QueryBackend)
+    if not backend.startswith("_")
+]
@@ -0,0 +1,42 @@
+"""Client of query server, which imports nothing but standard library"""
+
+import json
+import os
+import socket
+import sys
+from typing import Any, List, Tuple
+
+from enums.table import CliTableColumn
+
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+
+def send_query(
+    socket_path: str, query: str
+) -> Tuple[List[CliTableColumn], List[List[Any]]]:
+    """
+    Execute query in query server, exit if server is not running or query has failed
+    :param socket_path: Path of Unix socket, where server listens
+    :param query: Query, relative FROM path is resolved from current directory
+    :return: Shown columns and rows with their values
+    """
+    request = json.dumps({"query": query, "cwd": os.getcwd()}).encode("utf-8")
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(socket_path)
+            connection.sendall(request + b"\n")
+            chunks: List[bytes] = []
+            while chunk := connection.recv(RESPONSE_CHUNK_SIZE):
+                chunks.append(chunk)
+    except OSError as error:
+        print(f"Cannot connect to query server on {socket_path}: {error.strerror}")
+        sys.exit()
+
+    response = json.loads(b"".join(chunks))
+    if "error" in response:
+        print(response["error"])
+        sys.exit()
+
+    return [
+        CliTableColumn(column_name) for column_name in response["columns"]
+    ], response["rows"]
@@ -0,0 +1,181 @@
+"""
+Long running query server, which keeps warm index of each queried repository.
+Clients send single JSON line with query over Unix socket and receive rows back
+"""
+
+import contextlib
+import io
+import json
+import os
+import socketserver
+from dataclasses import replace
+from typing import Dict, Any, List, Tuple
+
+from app_types.dataclasses import CollectionOptions
+from collectors.history_collector import get_history_files_stats
+from collectors.repository_index import RepositoryIndex
+from command_interface.option_processors import (
+    parse_query_root_node,
+    get_query_repo,
+    get_log_options,
+    collect_table_data,
+)
+from defaults.command import DEFAULT_JOBS, DEFAULT_PATHNAME_LENGTH
+from enums.table import CliTableColumn
+from query_option_parser.nodes import StatementNode
+from repositories.row_repo import execute_query_on_rows
+from utils.query_planner import plan_queries
+from utils.table_data_calculator import (
+    TableDataCalculator,
+    AggregateTableDataCalculator,
+)
+
+# Queries with interval can not use aggregates of whole history
+INTERVAL_COLLECTION_OPTIONS = CollectionOptions(
+    get_history_files_stats, TableDataCalculator, False, DEFAULT_JOBS
+)
+
+
+class QueryServer:
+    """Executes queries over warm indexes of repositories"""
+
+    def __init__(self):
+        """Constructor"""
+        self._indexes: Dict[str, RepositoryIndex] = {}
+
+    def get_index(self, root_node: StatementNode) -> RepositoryIndex:
+        """Get index of repository, which contains FROM path of query"""
+        repo = get_query_repo(root_node)
+        repo_path = str(repo.working_dir)
+        if repo_path not in self._indexes:
+            self._indexes[repo_path] = RepositoryIndex(repo)
+
+        return self._indexes[repo_path]
+
+    def execute_query(
+        self, query: str, cwd: str
+    ) -> Tuple[List[CliTableColumn], List[List[Any]]]:
+        """
+        Execute query, exits like command line does, if query is not valid
+        :param query: Query
+        :param cwd: Working directory of client, relative FROM path is resolved from it
+        :return: Shown columns and rows with their values
+        """
+        root_node = parse_query_root_node(query)
+        return self.execute_root_node(
+            replace(
+                root_node,
+                from_node=replace(
+                    root_node.from_node,
+                    path=os.path.join(cwd, root_node.from_node.path),
+                ),
+            )
+        )
+
+    def execute_root_node(
+        self, root_node: StatementNode
+    ) -> Tuple[List[CliTableColumn], List[List[Any]]]:
+        """
+        Execute parsed query over warm index of its repository
+        :param root_node: Root node of query, relative FROM path is resolved from current directory
+        :return: Shown columns and rows with their values
+        """
+        index = self.get_index(root_node)
+        query_plan = plan_queries([root_node])
+        file_names = index.get_file_names(root_node.from_node.path)
+        if query_plan.requirements.commits and root_node.interval_node is None:
+            table_data_builder: TableDataCalculator = AggregateTableDataCalculator(
+                file_names,
+                index.get_files_aggregates(),
+                pathname_length=DEFAULT_PATHNAME_LENGTH,
+            )
+        else:
+            table_data_builder = collect_table_data(
+                index.repo,
+                file_names,
+                get_log_options(root_node, query_plan, file_names),
+                query_plan,
+                INTERVAL_COLLECTION_OPTIONS,
+            )
+
+        return root_node.show_node.column_names, execute_query_on_rows(
+            root_node,
+            query_plan.columns,
+            table_data_builder.calculate_data(query_plan.columns),
+        )
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute query of request, messages of invalid query are sent back as error
+        :param request: Query and working directory of client
+        :return: Shown columns and rows, or error message
+        """
+        output = io.StringIO()
+        # Server keeps running for other clients, whatever has failed
+        # pylint: disable = broad-exception-caught
+        try:
+            with contextlib.redirect_stdout(output):
+                column_names, rows = self.execute_query(
+                    request["query"], request["cwd"]
+                )
+        except SystemExit:
+            return {"error": output.getvalue().strip() or "Query has failed"}
+        except Exception as error:
+            return {"error": f"Query has failed: {error}"}
+
+        return {
+            "columns": [column_name.value for column_name in column_names],
+            "rows": rows,
+        }
+
+
+class QueryRequestHandler(socketserver.StreamRequestHandler):
+    """Handler of single client connection"""
+
+    server: "QueryUnixServer"
+
+    def handle(self) -> None:
+        """Read request line, write response line"""
+        try:
+            request = json.loads(self.rfile.readline())
+        except json.JSONDecodeError:
+            response: Dict[str, Any] = {"error": "Request is not valid JSON"}
+        else:
+            response = self.server.query_server.handle_request(request)
+
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class QueryUnixServer(socketserver.UnixStreamServer):
+    """
+    Unix socket server, which handles clients one by one,
+    so repository indexes are never updated concurrently
+    """
+
+    def __init__(self, socket_path: str, query_server: QueryServer):
+        """
+        Constructor
+        :param socket_path: Path of Unix socket
+        :param query_server: Query server, which executes queries
+        """
+        self.query_server = query_server
+        super().__init__(socket_path, QueryRequestHandler)
+
+
+def serve_queries(socket_path: str) -> None:
+    """
+    Listen for queries on Unix socket until interrupted
+    :param socket_path: Path of Unix socket, stale socket file is replaced
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(socket_path)), exist_ok=True)
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+
+    with QueryUnixServer(socket_path, QueryServer()) as server:
+        print(f"Serving queries on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(socket_path)
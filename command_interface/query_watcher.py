@@ -0,0 +1,73 @@
+"""Watch mode, which redraws query result whenever HEAD or refs of repository change"""
+
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+from command_interface.option_processors import parse_query_root_node
+from command_interface.query_server import QueryServer
+from enums.table import CliTableColumn
+
+CLEAR_SCREEN = "\033[2J\033[H"
+
+
+def get_refs_state(git_dir: str, common_dir: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Get modification time and inode of HEAD and of every ref file.
+    Git replaces ref files on update, so inode changes even if time resolution is coarse
+    :param git_dir: Git directory of working tree, which contains its HEAD
+    :param common_dir: Git directory, which contains refs shared by working trees
+    :return: Modification time and inode by file path
+    """
+    file_paths = [
+        os.path.join(git_dir, "HEAD"),
+        os.path.join(common_dir, "packed-refs"),
+    ]
+    for directory, _, file_names in os.walk(os.path.join(common_dir, "refs")):
+        file_paths.extend(
+            os.path.join(directory, file_name) for file_name in file_names
+        )
+
+    refs_state: Dict[str, Tuple[int, int]] = {}
+    for file_path in file_paths:
+        try:
+            file_stat = os.stat(file_path)
+        except FileNotFoundError:
+            continue
+        refs_state[file_path] = (file_stat.st_mtime_ns, file_stat.st_ino)
+
+    return refs_state
+
+
+def watch_query(
+    query: str,
+    draw: Callable[[List[CliTableColumn], List[List[Any]]], None],
+    interval: float,
+) -> None:
+    """
+    Draw query result, then redraw it after every change of HEAD or refs until interrupted.
+    Only commits, which were added since previous drawing, are scanned
+    :param query: Query
+    :param draw: Function, which draws shown columns and rows
+    :param interval: Seconds between checks of refs
+    """
+    root_node = parse_query_root_node(query)
+    query_server = QueryServer()
+    repo = query_server.get_index(root_node).repo
+    refs_state: Dict[str, Tuple[int, int]] = {}
+    try:
+        while True:
+            current_refs_state = get_refs_state(repo.git_dir, repo.common_dir)
+            if current_refs_state != refs_state:
+                refs_state = current_refs_state
+                column_names, rows = query_server.execute_root_node(root_node)
+                print(CLEAR_SCREEN, end="")
+                draw(column_names, rows)
+                print(
+                    f"Updated at {datetime.now():%H:%M:%S}, "
+                    f"HEAD {repo.head.commit.hexsha[:8]}. Press Ctrl+C to stop watching"
+                )
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,55 @@
+"""Processors of options, which save and execute stored queries"""
+
+from typing import Optional, Dict
+
+from utils.filesystem import get_stored_queries_from_file, save_queries_to_file
+from validators.command_option_validators import assert_query_exists_for_execution
+
+
+def process_save_query(query: Optional[str], save_query_name: Optional[str]) -> None:
+    """Save currently executing query to the file"""
+    if query is None or query.strip() == "":
+        if save_query_name is not None and save_query_name.strip() != "":
+            print(
+                "You have provided the query name for saving, but query argument is empty!"
+            )
+        return
+
+    if save_query_name is None or save_query_name.strip() == "":
+        return
+
+    queries = get_stored_queries_from_file()
+    queries[save_query_name] = query
+    save_queries_to_file(queries)
+    print("Query is stored successfully!")
+
+
+def process_execute_stored_query(query_name: Optional[str]) -> str | None:
+    """Execute stored query"""
+    if query_name is None or query_name.strip() == "":
+        return None
+
+    queries = get_stored_queries_from_file()
+    assert_query_exists_for_execution(query_name, queries)
+
+    return queries[query_name]
+
+
+def process_execute_stored_queries(
+    query_names: Optional[str], execute_all_queries: bool
+) -> Dict[str, str] | None:
+    """Get stored queries, which are executed together"""
+    if execute_all_queries:
+        return get_stored_queries_from_file()
+
+    if query_names is None or query_names.strip() == "":
+        return None
+
+    queries = get_stored_queries_from_file()
+    selected_names = [
+        name.strip() for name in query_names.split(",") if name.strip() != ""
+    ]
+    for query_name in selected_names:
+        assert_query_exists_for_execution(query_name, queries)
+
+    return {query_name: queries[query_name] for query_name in selected_names}
@@ -0,0 +1,90 @@
+"""
+Processors of terminating options, after which all other options are ignored.
+Module is imported before heavy libraries, which are needed only to execute queries
+"""
+
+from typing import Optional
+
+from utils.filesystem import (
+    get_stored_queries_from_file,
+    save_queries_to_file,
+    get_non_text_cache_from_file,
+    save_non_text_cache_to_file,
+)
+from validators.command_option_validators import (
+    assert_only_single_terminating_option_provided,
+)
+
+
+def process_list_non_text_option(repo_path: str, non_text: bool) -> bool:
+    """Process options, after which all other options are ignored"""
+    if non_text:
+        # pylint: disable = import-outside-toplevel
+        from git import Git
+        from utils.git_utils import get_non_text_files, get_attributes_state
+
+        git = Git(repo_path)
+        attributes_state = get_attributes_state(git)
+        blobs_cache = get_non_text_cache_from_file(repo_path, attributes_state)
+        non_text_files, head_blobs_cache = get_non_text_files(git, blobs_cache)
+        if head_blobs_cache != blobs_cache:
+            save_non_text_cache_to_file(repo_path, attributes_state, head_blobs_cache)
+        if len(non_text_files) > 0:
+            print("Non-text files:")
+            print("\n".join(non_text_files))
+        else:
+            print("No non-text files have been found!")
+        return True
+
+    return False
+
+
+def process_list_stored_queries(list_queries: Optional[bool]) -> bool:
+    """List all the queries if requested"""
+    if list_queries:
+        queries = get_stored_queries_from_file()
+
+        print("Stored queries")
+        for query in queries:
+            print(f"{query}: {queries[query]}")
+
+        return True
+
+    return False
+
+
+def process_remove_stored_query(query_name: Optional[str]) -> bool:
+    """Remove previously stored query if requested"""
+    if query_name is not None and query_name.strip() != "":
+        queries = get_stored_queries_from_file()
+
+        if query_name in queries.keys():
+            queries.pop(query_name)
+            save_queries_to_file(queries)
+            print("Stored query removed successfully")
+        else:
+            print(
+                f"Cannot delete query. There is no stored query with name: {query_name}"
+            )
+
+        return True
+
+    return False
+
+
+def process_terminating_options(
+    file_path: str,
+    **kwargs,
+) -> bool:
+    """Process terminating options"""
+    assert_only_single_terminating_option_provided(**kwargs)
+    if process_list_stored_queries(kwargs.get("list_queries", None)):
+        return True
+
+    if process_remove_stored_query(kwargs.get("remove_query", None)):
+        return True
+
+    if process_list_non_text_option(file_path, kwargs.get("list_non_text", False)):
+        return True
+
+    return False
@@ -0,0 +1,22 @@
+"""Test get_refs_state"""
+
+from command_interface.query_watcher import get_refs_state
+from conftest import GitTestRepo
+
+
+def test_changes_with_commits_and_branches(git_repo: GitTestRepo) -> None:
+    """Test that state changes after commit and checkout, but not without them"""
+    git_repo.commit("first")
+    git_dir = str(git_repo.path / ".git")
+    first_state = get_refs_state(git_dir, git_dir)
+
+    assert get_refs_state(git_dir, git_dir) == first_state
+
+    git_repo.commit("second")
+    second_state = get_refs_state(git_dir, git_dir)
+
+    assert second_state != first_state
+
+    git_repo.git("checkout", "-q", "-b", "other")
+
+    assert get_refs_state(git_dir, git_dir) != second_state
@@ -0,0 +1,39 @@
+"""Test QueryServer.handle_request"""
+
+from pathlib import Path
+from command_interface.query_server import QueryServer
+from conftest import GitTestRepo
+
+QUERY = "SHOW filename, commitcount, linecount FROM ./ ORDERBY filename ASC"
+
+
+def test_rows_follow_moved_head(git_repo: GitTestRepo) -> None:
+    """Test that rows of warm index include commits, added after first query"""
+    git_repo.write_file("a.txt", "1\n2\n")
+    git_repo.commit("a.txt")
+    query_server = QueryServer()
+
+    response = query_server.handle_request({"query": QUERY, "cwd": str(git_repo.path)})
+
+    assert response == {
+        "columns": ["filename", "commitcount", "linecount"],
+        "rows": [["a.txt", 1, 2]],
+    }
+
+    git_repo.write_file("a.txt", "1\n2\n3\n")
+    git_repo.commit("a.txt")
+    git_repo.write_file("b.txt", "1\n")
+    git_repo.commit("b.txt")
+
+    response = query_server.handle_request({"query": QUERY, "cwd": str(git_repo.path)})
+
+    assert response["rows"] == [["a.txt", 2, 3], ["b.txt", 1, 1]]
+
+
+def test_invalid_query_error(tmp_path: Path) -> None:
+    """Test that messages of invalid query are sent back as error"""
+    response = QueryServer().handle_request(
+        {"query": "SHOW unknown FROM ./", "cwd": str(tmp_path)}
+    )
+
+    assert "Incorrect column name" in response["error"]
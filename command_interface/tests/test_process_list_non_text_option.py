@@ -0,0 +1,30 @@
+"""Test process_list_non_text_option"""
+
+import pytest
+from command_interface.terminating_option_processors import (
+    process_list_non_text_option,
+)
+from conftest import GitTestRepo
+
+
+def test_attributes_change_invalidates_cache(
+    git_repo: GitTestRepo, capsys: pytest.CaptureFixture
+) -> None:
+    """Test that cached binary checks are not used after gitattributes are edited"""
+    git_repo.write_file("text.txt", "1\n2\n")
+    git_repo.write_file("image.bin", b"\x00\x01\x02")
+    git_repo.commit("files")
+
+    assert process_list_non_text_option(str(git_repo.path), True)
+    assert capsys.readouterr().out == "Non-text files:\nimage.bin\n"
+
+    git_repo.write_file(".gitattributes", "*.txt binary\n")
+    git_repo.commit("attributes")
+
+    assert process_list_non_text_option(str(git_repo.path), True)
+    assert capsys.readouterr().out == "Non-text files:\nimage.bin\ntext.txt\n"
+
+    git_repo.write_file(".gitattributes", "*.bin diff\n")
+
+    assert process_list_non_text_option(str(git_repo.path), True)
+    assert capsys.readouterr().out == "No non-text files have been found!\n"
@@ -0,0 +1,126 @@
+"""Test process_query"""
+
+from pathlib import Path
+from halo import Halo
+from app_types.dataclasses import CollectionOptions
+from collectors.history_collector import get_history_files_stats
+from command_interface.option_processors import process_query
+from repositories.row_repo import execute_query_on_rows
+from utils.profiler import QueryProfiler
+from utils.table_data_calculator import TableDataCalculator
+from conftest import GitTestRepo
+
+
+def _create_reused_path_repo(git_repo: GitTestRepo) -> None:
+    """Create repository, where src/f1.py is renamed away and created again"""
+    for file_name in ["a.py", "src/f1.py", "src/f2.py"]:
+        git_repo.write_file(file_name, "1\n2\n")
+    git_repo.commit("create")
+    git_repo.git("mv", "src/f1.py", "g1.py")
+    git_repo.commit("first rename")
+    git_repo.git("mv", "g1.py", "y1.py")
+    git_repo.commit("second rename")
+    git_repo.write_file("src/f1.py", "1\n")
+    git_repo.commit("reuse")
+
+
+def _create_discarding_merge_repo(git_repo: GitTestRepo) -> None:
+    """Create repository, where merge discards change of src/f1.py on merged branch"""
+    for file_name in ["a.py", "src/f1.py", "src/f2.py", "y1.py"]:
+        git_repo.write_file(file_name, "1\n2\n")
+    git_repo.commit("create")
+    git_repo.git("checkout", "-q", "-b", "side")
+    git_repo.write_file("src/f1.py", "1\n2\n3\n")
+    git_repo.commit("side change")
+    git_repo.git("checkout", "-q", "main")
+    git_repo.write_file("y1.py", "1\n")
+    git_repo.commit("main change")
+    git_repo.git("merge", "-q", "--no-edit", "-s", "ours", "side")
+
+
+def _process_query(repo_path: Path, query: str, use_results_db: bool = False) -> list:
+    """Process query with history collector, return result rows"""
+    return process_query(
+        query.replace("<path>", str(repo_path)),
+        Halo(enabled=False),
+        CollectionOptions(
+            get_history_files_stats, TableDataCalculator, False, 1, use_results_db
+        ),
+        execute_query_on_rows,
+        QueryProfiler(),
+    )[1]
+
+
+def test_file_name_condition_on_reused_path(git_repo: GitTestRepo) -> None:
+    """Test that pushed down file name condition gives same rows as full scan"""
+    _create_reused_path_repo(git_repo)
+
+    pushed_down_rows = _process_query(
+        git_repo.path,
+        'SHOW filename, commitcount FROM <path> WHERE filename == "src/f1.py"',
+    )
+    full_scan_rows = _process_query(
+        git_repo.path,
+        "SHOW filename, commitcount FROM <path> "
+        'WHERE filename == "src/f1.py" or commitcount > 100',
+    )
+
+    assert pushed_down_rows == full_scan_rows == [["src/f1.py", 1]]
+
+
+def test_file_name_condition_on_discarding_merge(git_repo: GitTestRepo) -> None:
+    """Test that pushed down file name condition keeps commits of merged branch"""
+    _create_discarding_merge_repo(git_repo)
+
+    pushed_down_rows = _process_query(
+        git_repo.path,
+        'SHOW filename, commitcount, linecount FROM <path> WHERE filename == "src/f1.py"',
+    )
+    full_scan_rows = _process_query(
+        git_repo.path,
+        "SHOW filename, commitcount, linecount FROM <path> "
+        'WHERE filename == "src/f1.py" or commitcount > 100',
+    )
+
+    assert pushed_down_rows == full_scan_rows == [["src/f1.py", 2, 3]]
+
+
+def test_limit_on_reused_path(git_repo: GitTestRepo) -> None:
+    """Test that pushed down limit gives same rows as slice of all rows"""
+    _create_reused_path_repo(git_repo)
+    git_repo.git("checkout", "-q", "-b", "side")
+    git_repo.write_file("src/f2.py", "1\n2\n3\n")
+    git_repo.commit("side change")
+    git_repo.git("checkout", "-q", "main")
+    git_repo.write_file("a.py", "1\n")
+    git_repo.commit("main change")
+    git_repo.git("merge", "-q", "--no-edit", "-s", "ours", "side")
+
+    limited_rows = _process_query(
+        git_repo.path, "SHOW filename, commitcount FROM <path> LIMIT 2 OFFSET 1"
+    )
+    all_rows = _process_query(git_repo.path, "SHOW filename, commitcount FROM <path>")
+
+    assert limited_rows == all_rows[1:3] == [["src/f1.py", 1], ["src/f2.py", 2]]
+
+
+def test_interval_skips_results_db(git_repo: GitTestRepo) -> None:
+    """Test that rows of query with relative interval are not kept in results database"""
+    _create_reused_path_repo(git_repo)
+    results_db_path = Path.home() / ".git-gut" / "results"
+    query = (
+        "SHOW filename, commitcount FROM <path> "
+        "INTERVAL SINCE 2.weeks.ago ORDERBY filename ASC"
+    )
+
+    assert _process_query(git_repo.path, query, True) == _process_query(
+        git_repo.path, query
+    )
+    assert not results_db_path.exists()
+
+    assert _process_query(
+        git_repo.path,
+        "SHOW filename, commitcount FROM <path> ORDERBY filename ASC",
+        True,
+    ) == [["a.py", 1], ["src/f1.py", 1], ["src/f2.py", 1], ["y1.py", 3]]
+    assert results_db_path.exists()
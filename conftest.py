@@ -0,0 +1,87 @@
+"""Shared fixtures of tests"""
+
+import subprocess
+from pathlib import Path
+import pytest
+
+# Same timestamp for every commit, git log date order can not tell commits apart
+GIT_TEST_ENVIRONMENT = {
+    "GIT_CONFIG_NOSYSTEM": "1",
+    "GIT_AUTHOR_NAME": "author",
+    "GIT_AUTHOR_EMAIL": "author@example.com",
+    "GIT_COMMITTER_NAME": "author",
+    "GIT_COMMITTER_EMAIL": "author@example.com",
+    "GIT_AUTHOR_DATE": "2020-01-01T00:00:00",
+    "GIT_COMMITTER_DATE": "2020-01-01T00:00:00",
+}
+
+
+class GitTestRepo:
+    """Git repository of single test"""
+
+    def __init__(self, path: Path):
+        """
+        Constructor
+        :param path: Working directory of repository
+        """
+        self.path = path
+        self.git("init", "-q", "-b", "main")
+
+    def git(self, *arguments: str) -> str:
+        """Run git command in repository, return its output"""
+        return subprocess.run(
+            ["git", *arguments],
+            cwd=self.path,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+    def write_file(self, file_name: str, content: str | bytes) -> None:
+        """Write file, missing directories are created"""
+        file_path = self.path / file_name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            file_path.write_bytes(content)
+        else:
+            file_path.write_text(content, encoding="utf-8")
+
+    def append_lines(self, file_name: str, lines: int) -> None:
+        """Append numbered lines to file"""
+        (self.path / file_name).parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path / file_name, "a", encoding="utf-8") as file:
+            file.writelines(f"{line}\n" for line in range(lines))
+
+    def commit(self, message: str, author: str = "author") -> str:
+        """
+        Commit every change of working tree
+        :param message: Commit message
+        :param author: Author name of commit
+        :return: SHA of created commit
+        """
+        self.git("add", "-A")
+        self.git(
+            "commit",
+            "-q",
+            "--allow-empty",
+            f"--author={author} <author@example.com>",
+            "-m",
+            message,
+        )
+        return self.git("rev-parse", "HEAD").strip()
+
+
+@pytest.fixture(name="git_repo")
+def fixture_git_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> GitTestRepo:
+    """
+    Create empty repository. Home directory and git configuration are isolated
+    for the test and for code it runs, so user settings can not change results
+    """
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "gitconfig"))
+    for name, value in GIT_TEST_ENVIRONMENT.items():
+        monkeypatch.setenv(name, value)
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    return GitTestRepo(repo_path)
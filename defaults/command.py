@@ -1,5 +1,6 @@
 """Defaults for command options"""
 
+import os
 from enums.table import CliTableColumn, SortingDirection
 
 DEFAULT_COLUMNS = ",".join(
@@ -27,3 +28,9 @@ DEFAULT_COLORS = [
         {"green": (0, 0.5), "yellow": (0.5, 0.9), "red": (0.9,)},
     ),
 ]
+
+DEFAULT_JOBS = os.cpu_count() or 1
+
+DEFAULT_PATHNAME_LENGTH = 2
+
+DEFAULT_WATCH_INTERVAL = 1.0
@@ -17,3 +17,27 @@ class TableLibrary(Enum):
 
     PRETTY_TABLE = "pretty"
     RICH_TABLE = "rich"
+
+
+class CollectorBackend(Enum):
+    """Options for git stats collector"""
+
+    PER_FILE = "per-file"
+    HISTORY = "history"
+    PROCESS_POOL = "process"
+    ASYNC_SUBPROCESS = "async"
+    SHARDED_HISTORY = "sharded"
+
+
+class CalculatorBackend(Enum):
+    """Options for table data calculator"""
+
+    PYTHON = "python"
+    NUMPY = "numpy"
+
+
+class QueryBackend(Enum):
+    """Options for backend, which filters and sorts calculated rows"""
+
+    MEMORY = "memory"
+    SQLITE = "sqlite"
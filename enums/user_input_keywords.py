@@ -12,3 +12,5 @@ class QueryKeywords(StrEnum):
     ORDERBY = "ORDERBY"
     SINCE = "SINCE"
     UNTIL = "UNTIL"
+    LIMIT = "LIMIT"
+    OFFSET = "OFFSET"
@@ -0,0 +1,152 @@
+"""Functions to build and query summed up (aggregated) file stats"""
+
+from typing import List, Callable, Dict
+from app_types.dataclasses import (
+    FileCommitStats,
+    FileAggregate,
+    AuthorStats,
+    FileStatsColumns,
+)
+from utils.text import trim_side_quotes
+
+
+def add_commit_stats_to_aggregate(
+    aggregate: FileAggregate, added_lines: int, removed_lines: int, author: str
+) -> None:
+    """
+    Add single commit stats to aggregate. Commit must be older than already added ones
+    :param aggregate: File aggregate to mutate
+    :param added_lines: Lines added in the commit
+    :param removed_lines: Lines removed in the commit
+    :param author: Author of the commit
+    :return: None
+    """
+    aggregate.commit_count += 1
+    aggregate.added_lines += added_lines
+    aggregate.removed_lines += removed_lines
+    aggregate.ratio_sum += removed_lines / (added_lines if added_lines != 0 else 1)
+
+    author_stats = aggregate.authors.get(author)
+    if author_stats is None:
+        author_stats = aggregate.authors[author] = AuthorStats()
+    author_stats.commit_count += 1
+    author_stats.added_lines += added_lines
+    author_stats.removed_lines += removed_lines
+
+
+def aggregate_commit_stats(commit_stats: List[FileCommitStats]) -> FileAggregate:
+    """Sum up list of commit stats (newest commit first) into file aggregate"""
+    aggregate = FileAggregate()
+    for stat in commit_stats:
+        add_commit_stats_to_aggregate(
+            aggregate, stat.added_lines, stat.removed_lines, stat.author
+        )
+
+    return aggregate
+
+
+def accumulate_file_columns(
+    file_columns: FileStatsColumns, with_authors: bool = True
+) -> FileAggregate:
+    """
+    Sum up every metric of file stats columns (newest commit first) in single pass
+    :param file_columns: Stats columns of a file
+    :param with_authors: Whether per author tallies should be summed up as well
+    :return: File aggregate
+    """
+    added_sum = removed_sum = 0
+    ratio_sum = 0.0
+    author_tallies: Dict[int, List[int]] = {}
+    for added_lines, removed_lines, author_id in zip(
+        file_columns.added_lines, file_columns.removed_lines, file_columns.author_ids
+    ):
+        added_sum += added_lines
+        removed_sum += removed_lines
+        ratio_sum += removed_lines / (added_lines if added_lines != 0 else 1)
+        if with_authors:
+            tally = author_tallies.get(author_id)
+            if tally is None:
+                tally = author_tallies[author_id] = [0, 0, 0]
+            tally[0] += 1
+            tally[1] += added_lines
+            tally[2] += removed_lines
+
+    return FileAggregate(
+        commit_count=len(file_columns.added_lines),
+        added_lines=added_sum,
+        removed_lines=removed_sum,
+        ratio_sum=ratio_sum,
+        authors={
+            file_columns.authors[author_id]: AuthorStats(*tally)
+            for author_id, tally in author_tallies.items()
+        },
+    )
+
+
+def merge_file_aggregates(newer: FileAggregate, older: FileAggregate) -> FileAggregate:
+    """
+    Merge two aggregates of the same file into new one
+    :param newer: Aggregate of newer commits
+    :param older: Aggregate of older commits
+    :return: Merged aggregate
+    """
+    authors = {
+        author: AuthorStats(stats.commit_count, stats.added_lines, stats.removed_lines)
+        for author, stats in newer.authors.items()
+    }
+    for author, stats in older.authors.items():
+        author_stats = authors.setdefault(author, AuthorStats())
+        author_stats.commit_count += stats.commit_count
+        author_stats.added_lines += stats.added_lines
+        author_stats.removed_lines += stats.removed_lines
+
+    return FileAggregate(
+        commit_count=newer.commit_count + older.commit_count,
+        added_lines=newer.added_lines + older.added_lines,
+        removed_lines=newer.removed_lines + older.removed_lines,
+        ratio_sum=newer.ratio_sum + older.ratio_sum,
+        authors=authors,
+    )
+
+
+def calculate_aggregate_deleted_added_ratio(aggregate: FileAggregate) -> float:
+    """Calculates mean of ratios: deleted lines/added lines"""
+    if aggregate.commit_count == 0:
+        return 0
+
+    return aggregate.ratio_sum / aggregate.commit_count
+
+
+def calculate_aggregate_line_count(aggregate: FileAggregate) -> int:
+    """Calculates total lines of code in file, based on added and deleted lines"""
+    return aggregate.added_lines - aggregate.removed_lines
+
+
+def get_aggregate_most_frequent_author(aggregate: FileAggregate) -> str:
+    """Calculate the author with most commits in file"""
+    if len(aggregate.authors) == 0:
+        return "-"
+
+    top_author = max(
+        aggregate.authors, key=lambda author: aggregate.authors[author].commit_count
+    )
+    return trim_side_quotes(top_author)
+
+
+def get_aggregate_top_author_by_stat(
+    aggregate: FileAggregate, func: Callable[[AuthorStats], int]
+) -> str:
+    """
+    Calculates top author by summed up specific stat which is returned by provided function
+    :param aggregate: File aggregate
+    :param func: Function to be applied on author stats to extract specific property
+    :return: Top author and summed up stat
+    """
+    if len(aggregate.authors) == 0:
+        return "-"
+
+    top_author = max(
+        aggregate.authors, key=lambda author: func(aggregate.authors[author])
+    )
+
+    return f"{trim_side_quotes(top_author)} ({func(aggregate.authors[top_author])})"
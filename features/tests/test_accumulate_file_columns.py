@@ -0,0 +1,37 @@
+"""Test accumulate_file_columns"""
+
+from app_types.dataclasses import FileCommitStats, FileAggregate
+from collectors.commit_stats_store import create_commit_stats_store
+from features.file_aggregates import accumulate_file_columns, aggregate_commit_stats
+
+COMMIT_STATS = [
+    FileCommitStats(5, 1, "second"),
+    FileCommitStats(0, 3, "first"),
+    FileCommitStats(2, 0, "second"),
+]
+
+
+def test_empty_columns() -> None:
+    """Test file without stats"""
+    columns = create_commit_stats_store({"file": []}).get_file_columns("file")
+    assert accumulate_file_columns(columns) == FileAggregate()
+
+
+def test_same_as_aggregated_commit_stats() -> None:
+    """Test that every metric, including author order, matches aggregated commit stats"""
+    columns = create_commit_stats_store({"file": COMMIT_STATS}).get_file_columns("file")
+    aggregate = accumulate_file_columns(columns)
+    assert aggregate == aggregate_commit_stats(COMMIT_STATS)
+    assert list(aggregate.authors) == ["second", "first"]
+
+
+def test_without_authors() -> None:
+    """Test that author tallies are skipped, when they are not requested"""
+    columns = create_commit_stats_store({"file": COMMIT_STATS}).get_file_columns("file")
+    aggregate = accumulate_file_columns(columns, with_authors=False)
+    assert not aggregate.authors
+    assert (aggregate.commit_count, aggregate.added_lines, aggregate.removed_lines) == (
+        3,
+        7,
+        4,
+    )
@@ -0,0 +1,36 @@
+"""Test calculate_aggregate_line_count"""
+
+from app_types.dataclasses import FileCommitStats
+from features.file_aggregates import (
+    aggregate_commit_stats,
+    calculate_aggregate_line_count,
+)
+
+
+def test_empty_list() -> None:
+    """Test empty list - results in zero"""
+    assert calculate_aggregate_line_count(aggregate_commit_stats([])) == 0
+
+
+def test_more_lines_deleted() -> None:
+    """Test when more lines deleted"""
+    assert (
+        calculate_aggregate_line_count(
+            aggregate_commit_stats(
+                [FileCommitStats(10, 100, ""), FileCommitStats(10, 50, "")]
+            )
+        )
+        == -130
+    )
+
+
+def test_more_lines_added() -> None:
+    """Test when more lines deleted"""
+    assert (
+        calculate_aggregate_line_count(
+            aggregate_commit_stats(
+                [FileCommitStats(100, 5, ""), FileCommitStats(10, 5, "")]
+            )
+        )
+        == 100
+    )
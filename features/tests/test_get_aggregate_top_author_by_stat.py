@@ -0,0 +1,31 @@
+"""Test get_aggregate_top_author_by_stat"""
+
+from app_types.dataclasses import FileCommitStats, FileAggregate
+from features.file_aggregates import (
+    aggregate_commit_stats,
+    get_aggregate_top_author_by_stat,
+)
+
+
+def test_empty_aggregate() -> None:
+    """Test aggregate without authors"""
+    assert get_aggregate_top_author_by_stat(FileAggregate(), lambda x: 0) == "-"
+
+
+def test_tie_goes_to_newest_author() -> None:
+    """Test that top author is found, and newest author wins a tie"""
+    aggregate = aggregate_commit_stats(
+        [
+            FileCommitStats(5, 1, '"first"'),
+            FileCommitStats(2, 3, '"second"'),
+            FileCommitStats(3, 0, '"second"'),
+        ]
+    )
+    assert (
+        get_aggregate_top_author_by_stat(aggregate, lambda x: x.added_lines)
+        == "first (5)"
+    )
+    assert (
+        get_aggregate_top_author_by_stat(aggregate, lambda x: x.removed_lines)
+        == "second (3)"
+    )
@@ -0,0 +1,33 @@
+"""Test merge_file_aggregates"""
+
+from app_types.dataclasses import FileCommitStats
+from features.file_aggregates import aggregate_commit_stats, merge_file_aggregates
+
+
+def test_merge_equals_aggregate_of_whole_history() -> None:
+    """Test that merging newer and older aggregates equals aggregate of all commits"""
+    newer = [FileCommitStats(1, 2, "b"), FileCommitStats(3, 0, "a")]
+    older = [FileCommitStats(10, 5, "c"), FileCommitStats(0, 4, "a")]
+
+    assert merge_file_aggregates(
+        aggregate_commit_stats(newer), aggregate_commit_stats(older)
+    ) == aggregate_commit_stats(newer + older)
+
+
+def test_authors_keep_newest_first_order() -> None:
+    """Test that authors of newer aggregate come first"""
+    merged = merge_file_aggregates(
+        aggregate_commit_stats([FileCommitStats(1, 0, "new")]),
+        aggregate_commit_stats([FileCommitStats(1, 0, "old")]),
+    )
+    assert list(merged.authors) == ["new", "old"]
+
+
+def test_inputs_are_not_mutated() -> None:
+    """Test that merged aggregates are left untouched"""
+    newer = aggregate_commit_stats([FileCommitStats(1, 0, "a")])
+    older = aggregate_commit_stats([FileCommitStats(1, 0, "a")])
+    merge_file_aggregates(newer, older)
+
+    assert newer.authors["a"].commit_count == 1
+    assert older.authors["a"].commit_count == 1
@@ -1,16 +1,11 @@
 """Main file of application"""
 
-from typing import Optional, Tuple
+import os
+from typing import Optional, Tuple, List, TYPE_CHECKING
 import click
-from halo import Halo
 
-from app_types.dataclasses import SeparateOptionsAsQuery
-from command_interface.option_processors import (
-    process_execute_stored_query,
-    process_query,
-    process_save_query,
-    process_terminating_options,
-)
+from app_types.dataclasses import SeparateOptionsAsQuery, CollectionOptions
+
 from command_interface.options import (
     columns_option,
     since_option,
@@ -22,13 +17,77 @@ from command_interface.options import (
     table_option,
     save_query_option,
     execute_stored_query_option,
+    execute_stored_queries_option,
+    execute_all_stored_queries_option,
     show_stored_queries_option,
     remove_stored_query,
+    collector_option,
+    calculator_option,
+    query_backend_option,
+    cache_option,
+    results_db_option,
+    jobs_option,
+    profile_option,
+    profile_output_option,
+    serve_option,
+    socket_option,
+    watch_option,
+    watch_interval_option,
+)
+from command_interface.stored_query_processors import (
+    process_execute_stored_query,
+    process_execute_stored_queries,
+    process_save_query,
+)
+from command_interface.terminating_option_processors import (
+    process_terminating_options,
 )
-from utils.cli_table import draw_flat_tree_table, create_table_instance
-from utils.command_option_parser import parse_separate_options_into_query
-from utils.database import create_db_engine, create_tables
-from validators.command_option_validators import assert_correct_table_library
+from enums.table import CliTableColumn
+
+if TYPE_CHECKING:
+    from utils.profiler import QueryProfiler
+
+# Heavy libraries (GitPython, SQLAlchemy, table libraries, halo) are imported
+# only after terminating options are processed, to keep them and --help fast
+# pylint: disable = import-outside-toplevel
+
+
+def draw_query_result(
+    table: Optional[str],
+    column_names: List[CliTableColumn],
+    result_rows: List[List[str | float | int]],
+) -> None:
+    """Draw table of query result rows"""
+    from utils.cli_table import draw_flat_tree_table, create_table_instance
+    from validators.command_option_validators import assert_correct_table_library
+
+    table_lib_result = create_table_instance(table)
+    assert_correct_table_library(table_lib_result)
+    draw_flat_tree_table(column_names, result_rows, table_lib_result.value)
+    print(f"Total files: {len(result_rows)}")
+
+
+def get_input_query(
+    stored_query_name: Optional[str],
+    query: Optional[str],
+    separate_options: SeparateOptionsAsQuery,
+) -> str:
+    """Get query from stored query, query option or separate options, in this order"""
+    if (stored_query := process_execute_stored_query(stored_query_name)) is not None:
+        return stored_query
+    if query is not None and query.strip() != "":
+        return query
+
+    from utils.command_option_parser import parse_separate_options_into_query
+
+    return parse_separate_options_into_query(separate_options)
+
+
+def print_profile(profiler: "QueryProfiler") -> None:
+    """Print profile of processing stages and dump cProfile stats, if profiling is enabled"""
+    if profiler.enabled:
+        print(profiler.format_report())
+        profiler.dump_stats()
 
 
 @click.command()
@@ -41,8 +100,22 @@ from validators.command_option_validators import assert_correct_table_library
 @since_option
 @until_option
 @table_option
+@collector_option
+@calculator_option
+@query_backend_option
+@cache_option
+@results_db_option
+@jobs_option
+@profile_option
+@profile_output_option
+@serve_option
+@socket_option
+@watch_option
+@watch_interval_option
 @save_query_option
 @execute_stored_query_option
+@execute_stored_queries_option
+@execute_all_stored_queries_option
 @show_stored_queries_option
 @remove_stored_query
 # pylint: disable = too-many-arguments
@@ -58,8 +131,22 @@ def git_hot(
     since: Optional[str],
     until: Optional[str],
     table: Optional[str],
+    collector: str,
+    calculator: str,
+    query_backend: str,
+    cache: bool,
+    results_db: bool,
+    jobs: int,
+    profile: bool,
+    profile_output: Optional[str],
+    serve: bool,
+    socket: Optional[str],
+    watch: bool,
+    watch_interval: float,
     save_query: Optional[str],
     execute_query: Optional[str],
+    execute_queries: Optional[str],
+    execute_all_queries: bool,
     list_queries: Optional[bool],
     remove_query: Optional[str],
 ):
@@ -69,33 +156,100 @@ def git_hot(
     if process_terminating_options(
         file_path,
         list_queries=list_queries,
-        remove_queries=remove_query,
+        remove_query=remove_query,
         list_non_text=nontext,
     ):
         return
 
+    if serve:
+        from command_interface.query_server import serve_queries
+        from utils.filesystem import get_server_socket_file_path
+
+        serve_queries(socket or os.path.join(*get_server_socket_file_path()))
+        return
+
+    stored_queries = process_execute_stored_queries(
+        execute_queries, execute_all_queries
+    )
+    input_query = (
+        get_input_query(
+            execute_query,
+            query,
+            SeparateOptionsAsQuery(columns, file_path, sort, filters, since, until),
+        )
+        if stored_queries is None
+        else ""
+    )
+
+    if socket is not None:
+        from command_interface.query_client import send_query
+
+        for query_name, server_query in (stored_queries or {"": input_query}).items():
+            if stored_queries is not None:
+                print(f"Query {query_name}: {server_query}")
+            draw_query_result(table, *send_query(socket, server_query))
+        process_save_query(query, save_query)
+        return
+
+    if watch and stored_queries is None:
+        from command_interface.query_watcher import watch_query
+
+        watch_query(
+            input_query,
+            lambda column_names, rows: draw_query_result(table, column_names, rows),
+            watch_interval,
+        )
+        return
+
+    from halo import Halo
+    from collectors.collector_factory import create_stats_collector
+    from command_interface.option_processors import process_queries, process_query
+    from repositories.query_backend_factory import create_query_executor
+    from utils.calculator_factory import create_table_data_calculator
+    from utils.profiler import QueryProfiler
+    from validators.command_option_validators import (
+        assert_correct_collector,
+        assert_correct_calculator,
+        assert_correct_query_backend,
+    )
+
+    collector_result = create_stats_collector(collector)
+    assert_correct_collector(collector_result)
+    calculator_result = create_table_data_calculator(calculator)
+    assert_correct_calculator(calculator_result)
+    query_backend_result = create_query_executor(query_backend)
+    assert_correct_query_backend(query_backend_result)
+
     spinner = Halo(text="Initializing environment", spinner="dots")
     spinner.start()
-    engine = create_db_engine()
-    create_tables(engine)
-
-    input_query: str
-    if (stored_query := process_execute_stored_query(execute_query)) is not None:
-        input_query = stored_query
-    elif query is not None and query.strip() != "":
-        input_query = query
-    else:
-        input_query = parse_separate_options_into_query(
-            SeparateOptionsAsQuery(columns, file_path, sort, filters, since, until)
-        )
+    collection_options = CollectionOptions(
+        collector_result.value, calculator_result.value, cache, jobs, results_db
+    )
+    profiler = QueryProfiler(profile, profile_output)
     spinner.succeed("Environment initialized")
 
-    column_names, result_rows = process_query(input_query, engine, spinner)
+    if stored_queries is not None:
+        for query_name, (column_names, result_rows) in process_queries(
+            stored_queries,
+            spinner,
+            collection_options,
+            query_backend_result.value,
+            profiler,
+        ).items():
+            print(f"Query {query_name}: {stored_queries[query_name]}")
+            draw_query_result(table, column_names, result_rows)
+        print_profile(profiler)
+        return
 
-    table_lib_result = create_table_instance(table)
-    assert_correct_table_library(table_lib_result)
-    draw_flat_tree_table(column_names, result_rows, table_lib_result.value)
-    print(f"Total files: {len(result_rows)}")
+    column_names, result_rows = process_query(
+        input_query,
+        spinner,
+        collection_options,
+        query_backend_result.value,
+        profiler,
+    )
+    draw_query_result(table, column_names, result_rows)
+    print_profile(profiler)
 
     process_save_query(query, save_query)
 
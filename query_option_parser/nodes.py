@@ -68,6 +68,14 @@ class IntervalNode:
     until: Optional[str]
 
 
+@dataclass
+class LimitNode:
+    """Limit statement"""
+
+    limit: int
+    offset: int = 0
+
+
 @dataclass
 class StatementNode:
     """Root of show statements"""
@@ -77,3 +85,4 @@ class StatementNode:
     order_node: Optional[OrderNode]
     from_node: Optional[FromNode]
     interval_node: Optional[IntervalNode]
+    limit_node: Optional[LimitNode] = None
@@ -15,7 +15,9 @@ from query_option_parser.nodes import (
     SortRuleNode,
     FromNode,
     WhereNode,
+    LimitNode,
 )
+from query_option_parser.string_tokens import OFFSET_KEYWORD
 from query_option_parser.parser_utils import (
     split_sort_rule_string,
     extract_since_and_until_interval,
@@ -144,12 +146,42 @@ def parse_interval_statement(
     return ResultOk(IntervalNode(since, until))
 
 
+def parse_limit_statement(
+    limit_statement: Optional[str] = "",
+) -> ResultUnion[LimitNode, NodeValidationError]:
+    """Parse limit statement, with optional offset: LIMIT n [OFFSET m]"""
+    split_words = limit_statement.split() if limit_statement is not None else []
+    is_valid = (
+        len(split_words) in (1, 3)
+        and all(word.isdigit() for word in split_words[::2])
+        and (len(split_words) == 1 or split_words[1].upper() == OFFSET_KEYWORD)
+    )
+    if not is_valid:
+        return ResultValidationError(
+            limit_statement,
+            [
+                NodeValidationError(
+                    " ".join(split_words),
+                    "Please specify correct LIMIT - LIMIT n or LIMIT n OFFSET m",
+                    Severity.CRITICAL,
+                )
+            ],
+        )
+
+    return ResultOk(
+        LimitNode(
+            int(split_words[0]), int(split_words[2]) if len(split_words) == 3 else 0
+        )
+    )
+
+
 TOP_LEVEL_STATEMENT_PARSERS = {
     "SHOW": parse_show_statement,
     "FROM": parse_from_statement,
     "WHERE": parse_where_statement,
     "ORDERBY": parse_order_statement,
     "INTERVAL": parse_interval_statement,
+    "LIMIT": parse_limit_statement,
 }
 
 ROOT_NODE_KEYS = {
@@ -158,4 +190,5 @@ ROOT_NODE_KEYS = {
     "WHERE": "where_node",
     "ORDERBY": "order_node",
     "INTERVAL": "interval_node",
+    "LIMIT": "limit_node",
 }
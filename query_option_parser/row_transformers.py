@@ -0,0 +1,129 @@
+"""Transform nodes into plain Python predicates and sort keys over rows"""
+
+import ast
+import operator
+import sys
+from typing import List, Dict, Any, Callable, Sequence, Tuple, cast
+
+from enums.table import SortingDirection
+from query_option_parser.nodes import SortRuleNode
+
+RowPredicate = Callable[[Sequence[Any]], bool]
+RowSortKey = Callable[[Sequence[Any]], Tuple[bool, Any]]
+
+COMPARE_OPERATORS: Dict[type, Callable[[Any, Any], bool]] = {
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+
+
+def get_column_index(column_name: str, column_indexes: Dict[str, int]) -> int:
+    """Get index of column value inside of row"""
+    if column_name not in column_indexes:
+        print(f"Unsupported column has been provided: {column_name}")
+        sys.exit()
+
+    return column_indexes[column_name]
+
+
+def map_sign_to_predicate(
+    compare: ast.Compare, column_indexes: Dict[str, int]
+) -> RowPredicate:
+    """
+    Map condition to predicate, depending on sign.
+    Like in SQL, NULL and values of other type than literal never match
+    """
+    index = get_column_index(cast(ast.Name, compare.left).id, column_indexes)
+    literal = cast(ast.Constant, compare.comparators[0]).value
+    compare_values = COMPARE_OPERATORS.get(type(compare.ops[0]))
+    if compare_values is None:
+        print(f"Unsupported compare sign has been provided: {compare.ops[0]}")
+        sys.exit()
+
+    def predicate(row: Sequence[Any]) -> bool:
+        value = row[index]
+        if value is None:
+            return False
+        try:
+            return compare_values(value, literal)
+        except TypeError:
+            return False
+
+    return predicate
+
+
+def transform_ast_bool_op_to_row_predicate(
+    test_statement: ast.BoolOp | ast.Compare,
+    column_indexes: Dict[str, int],
+) -> RowPredicate:
+    """
+    Transform Python AST bool operation to predicate over rows
+    :param test_statement: Condition of where node
+    :param column_indexes: Index of each column value inside of row, by column name
+    :return: Predicate, which tells if row matches condition
+    """
+    if isinstance(test_statement, ast.Compare):
+        return map_sign_to_predicate(test_statement, column_indexes)
+
+    predicates = [
+        transform_ast_bool_op_to_row_predicate(single_value, column_indexes)
+        for single_value in test_statement.values
+        if isinstance(single_value, (ast.Compare, ast.BoolOp))
+    ]
+    match getattr(test_statement, "op", None):
+        case ast.And():
+            return lambda row: all(predicate(row) for predicate in predicates)
+        case ast.Or():
+            return lambda row: any(predicate(row) for predicate in predicates)
+
+    print("Filter bool operator is not supported")
+    sys.exit()
+
+
+def transform_sort_nodes_to_sort_keys(
+    sort_rule_nodes: List[SortRuleNode],
+    column_indexes: Dict[str, int],
+) -> List[Tuple[RowSortKey, bool]]:
+    """
+    Transform all sort rule nodes to sort keys over rows.
+    Like in SQLite, NULL values go first in ascending order
+    :param sort_rule_nodes: Sort rules of order node
+    :param column_indexes: Index of each column value inside of row, by column name
+    :return: Sort key and descending flag of each rule
+    """
+    sort_keys: List[Tuple[RowSortKey, bool]] = []
+    for rule_node in sort_rule_nodes:
+        index = get_column_index(rule_node.column_name.value, column_indexes)
+        sort_keys.append(
+            (
+                lambda row, index=index: (row[index] is not None, row[index]),
+                rule_node.sort_direction == SortingDirection.DESC,
+            )
+        )
+
+    return sort_keys
+
+
+def create_rows_comparator(
+    sort_keys: List[Tuple[RowSortKey, bool]],
+) -> Callable[[Sequence[Any], Sequence[Any]], int]:
+    """
+    Create comparator of two rows, which applies all sort keys at once
+    :param sort_keys: Sort key and descending flag of each rule
+    :return: Comparator, negative if first row goes before second one
+    """
+
+    def compare_rows(first_row: Sequence[Any], second_row: Sequence[Any]) -> int:
+        for sort_key, descending in sort_keys:
+            first_key, second_key = sort_key(first_row), sort_key(second_row)
+            if first_key != second_key:
+                is_less = first_key < second_key
+                return 1 if is_less == descending else -1
+
+        return 0
+
+    return compare_rows
@@ -3,4 +3,12 @@
 NUMBER_SIGNS = {">", "<", ">=", "<=", "==", "!="}
 TEXT_SIGNS = {"=="}
 ALLOWED_SIGNS = NUMBER_SIGNS.union(TEXT_SIGNS)
-TOP_LEVEL_STATEMENT_KEYWORDS = {"SHOW", "FROM", "WHERE", "ORDERBY", "INTERVAL"}
+TOP_LEVEL_STATEMENT_KEYWORDS = {
+    "SHOW",
+    "FROM",
+    "WHERE",
+    "ORDERBY",
+    "INTERVAL",
+    "LIMIT",
+}
+OFFSET_KEYWORD = "OFFSET"
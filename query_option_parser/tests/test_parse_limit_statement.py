@@ -0,0 +1,21 @@
+"""Test parse_limit_statement"""
+
+from app_types.result import ResultValidationError
+from query_option_parser.nodes import LimitNode
+from query_option_parser.parser import parse_limit_statement
+
+
+def test_only_limit() -> None:
+    """Check limit without offset"""
+    assert parse_limit_statement("20").value == LimitNode(20, 0)
+
+
+def test_limit_with_offset() -> None:
+    """Check limit with offset, keyword is case insensitive"""
+    assert parse_limit_statement("20 offset 5").value == LimitNode(20, 5)
+
+
+def test_invalid_limit() -> None:
+    """Check limits, which are not non negative integers or have wrong keyword"""
+    for statement in ["", "-1", "ten", "20 SKIP 5", "20 OFFSET", "1.5"]:
+        assert isinstance(parse_limit_statement(statement), ResultValidationError)
@@ -0,0 +1,38 @@
+"""Test transform_ast_bool_op_to_row_predicate"""
+
+from query_option_parser.parser import parse_where_statement
+from query_option_parser.row_transformers import transform_ast_bool_op_to_row_predicate
+
+COLUMN_INDEXES = {"linecount": 0, "daratio": 1, "mfauthor": 2}
+
+
+def test_single_condition() -> None:
+    """Test single compare condition"""
+    predicate = transform_ast_bool_op_to_row_predicate(
+        parse_where_statement("linecount > 100").value.condition_node, COLUMN_INDEXES
+    )
+    assert predicate([101, 0.0, "author"])
+    assert not predicate([100, 0.0, "author"])
+
+
+def test_nested_conditions() -> None:
+    """Test conditions joined by and/or"""
+    predicate = transform_ast_bool_op_to_row_predicate(
+        parse_where_statement(
+            'mfauthor == "author" and (linecount <= 10 or daratio != 0.5)'
+        ).value.condition_node,
+        COLUMN_INDEXES,
+    )
+    assert predicate([10, 0.5, "author"])
+    assert predicate([20, 0.1, "author"])
+    assert not predicate([20, 0.5, "author"])
+    assert not predicate([10, 0.1, "other"])
+
+
+def test_null_and_other_type_values_do_not_match() -> None:
+    """Test that NULL and values of other type than literal never match, like in SQL"""
+    predicate = transform_ast_bool_op_to_row_predicate(
+        parse_where_statement("linecount != 100 or daratio < 1").value.condition_node,
+        COLUMN_INDEXES,
+    )
+    assert not predicate([None, "0.5", "author"])
@@ -1,33 +1,34 @@
-"""Utilities to mutate, query GitStat orm"""
+"""Utilities to mutate, query GitStat table"""
 
-from typing import List, Any
-from sqlalchemy import select, Select, asc, desc
+from typing import List, Any, Dict
+from sqlalchemy import select, insert, Select, asc, desc
 from enums.table import CliTableColumn, SortingDirection
 from orm.git_stat import GitStat
 from app_types.dataclasses import SortingRule
-from query_option_parser.nodes import WhereNode, OrderNode, StatementNode, ShowNode
+from query_option_parser.nodes import (
+    WhereNode,
+    OrderNode,
+    StatementNode,
+    ShowNode,
+    LimitNode,
+)
 from query_option_parser.transformers import (
     transform_ast_bool_op_to_orm_filters,
     transform_sort_nodes_to_order_by,
     transform_show_node_to_select,
 )
+from utils.database import create_db_engine, create_tables
 
 
 def prepare_all_rows(
     column_names: List[CliTableColumn], rows: List[List[Any]]
-) -> List[GitStat]:
-    """Prepare rows into GitStat ORM"""
+) -> List[Dict[str, Any]]:
+    """Prepare rows into GitStat table values, for bulk insert"""
     if len(column_names) == 0:
         return []
 
-    git_stats = []
-    for row in rows:
-        data_for_git_stat = {}
-        for index, column_name in enumerate(column_names):
-            data_for_git_stat[column_name.value] = row[index]
-        git_stats.append(GitStat(**data_for_git_stat))
-
-    return git_stats
+    keys = [column_name.value for column_name in column_names]
+    return [dict(zip(keys, row)) for row in rows]
 
 
 COLUMN_TO_GIT_STAT_MAPPING = {
@@ -76,15 +77,24 @@ def prepare_where(where_node: WhereNode | None, select_statement: Select) -> Sel
 def prepare_order_by_from_node(
     orderby_node: OrderNode | None, select_statement: Select
 ) -> Select:
-    """Add sorting to select statement"""
+    """Add sorting to select statement, rows with equal values keep insertion order"""
     if orderby_node is not None and len(orderby_node.sort_rule_nodes) > 0:
         return select_statement.order_by(
-            *transform_sort_nodes_to_order_by(orderby_node.sort_rule_nodes)
+            *transform_sort_nodes_to_order_by(orderby_node.sort_rule_nodes),
+            asc(GitStat.id),
         )
 
     return select_statement
 
 
+def prepare_limit(limit_node: LimitNode | None, select_statement: Select) -> Select:
+    """Add limit and offset to select statement"""
+    if limit_node is not None:
+        return select_statement.limit(limit_node.limit).offset(limit_node.offset)
+
+    return select_statement
+
+
 def prepare_query_statement(root_node: StatementNode) -> Select:
     """Prepare query statement"""
     select_statement = prepare_select_from_node(root_node.show_node)
@@ -92,5 +102,29 @@ def prepare_query_statement(root_node: StatementNode) -> Select:
     select_statement = prepare_order_by_from_node(
         root_node.order_node, select_statement
     )
+    select_statement = prepare_limit(root_node.limit_node, select_statement)
 
     return select_statement
+
+
+def execute_query_in_sqlite(
+    root_node: StatementNode,
+    column_names: List[CliTableColumn],
+    rows: List[List[Any]],
+) -> List[List[Any]]:
+    """
+    Insert rows into in memory SQLite database and filter, sort, select them there
+    :param root_node: Parsed query
+    :param column_names: Columns, which values are contained in rows
+    :param rows: Calculated rows
+    :return: Rows with values of shown columns, which match where statement, sorted
+    """
+    engine = create_db_engine()
+    create_tables(engine)
+    with engine.begin() as connection:
+        git_stat_rows = prepare_all_rows(column_names, rows)
+        if len(git_stat_rows) > 0:
+            connection.execute(insert(GitStat), git_stat_rows)
+        return [
+            [*row] for row in connection.execute(prepare_query_statement(root_node))
+        ]
@@ -0,0 +1,45 @@
+"""Factory of query executors"""
+
+from typing import List, Any
+from app_types.protocols import QueryExecutor
+from app_types.result import ResultOk, ResultUnion, ResultValidationError
+from app_types.validation_errors import InvalidQueryBackendError
+from command_interface.help_text import AVAILABLE_QUERY_BACKENDS_TEXT
+from enums.application import QueryBackend, Severity
+from enums.table import CliTableColumn
+from query_option_parser.nodes import StatementNode
+from repositories.row_repo import execute_query_on_rows
+
+
+def execute_query_in_sqlite(
+    root_node: StatementNode,
+    column_names: List[CliTableColumn],
+    rows: List[List[Any]],
+) -> List[List[Any]]:
+    """Execute query in SQLite, SQLAlchemy is imported only when it is requested"""
+    # pylint: disable = import-outside-toplevel
+    from repositories import git_stat_repo
+
+    return git_stat_repo.execute_query_in_sqlite(root_node, column_names, rows)
+
+
+def create_query_executor(
+    query_backend_option: str,
+) -> ResultUnion[QueryExecutor, InvalidQueryBackendError]:
+    """Create requested query executor"""
+    match query_backend_option:
+        case QueryBackend.MEMORY.value:
+            return ResultOk(execute_query_on_rows)
+        case QueryBackend.SQLITE.value:
+            return ResultOk(execute_query_in_sqlite)
+
+    return ResultValidationError(
+        query_backend_option,
+        [
+            InvalidQueryBackendError(
+                query_backend_option,
+                f"Please specify correct query backend, one of: {AVAILABLE_QUERY_BACKENDS_TEXT}",
+                Severity.CRITICAL,
+            )
+        ],
+    )
@@ -0,0 +1,121 @@
+"""Utilities to save calculated GitStat rows into file database and query them later"""
+
+import os
+from pathlib import Path
+from typing import List, Any, Optional
+from sqlalchemy import (
+    MetaData,
+    Table,
+    Column,
+    Integer,
+    String,
+    select,
+    insert,
+    text,
+    exc,
+)
+from enums.table import CliTableColumn
+from orm.git_stat import GitStat
+from query_option_parser.nodes import StatementNode
+from repositories.git_stat_repo import prepare_all_rows, prepare_query_statement
+from utils.database import create_db_engine, create_tables
+
+RESULTS_DB_VERSION = 1
+
+snapshot_table = Table(
+    "Snapshot",
+    MetaData(),
+    Column("version", Integer(), nullable=False),
+    Column("head_commit", String(), nullable=False),
+)
+
+INDEXED_COLUMNS = [
+    CliTableColumn.COMMIT_AMOUNT,
+    CliTableColumn.DELETED_ADDED_RATIO,
+    CliTableColumn.LINE_COUNT,
+]
+
+
+def get_results_db_head_commit(file_path: str) -> Optional[str]:
+    """
+    Get HEAD commit, for which rows of results database were calculated
+    :param file_path: Path to results database
+    :return: Commit SHA, None if database is missing or outdated
+    """
+    if not os.path.isfile(file_path):
+        return None
+
+    engine = create_db_engine(file_path)
+    try:
+        with engine.connect() as connection:
+            snapshot = connection.execute(select(snapshot_table)).first()
+    except exc.DatabaseError:
+        return None
+    finally:
+        engine.dispose()
+
+    if snapshot is None or snapshot.version != RESULTS_DB_VERSION:
+        return None
+
+    return snapshot.head_commit
+
+
+def save_results_db(
+    file_path: str,
+    head_commit: str,
+    column_names: List[CliTableColumn],
+    rows: List[List[Any]],
+) -> None:
+    """
+    Save calculated rows into results database, replacing previous ones.
+    Database is written into temporary file, indexes are built after rows are inserted
+    :param file_path: Path to results database
+    :param head_commit: HEAD commit, for which rows were calculated
+    :param column_names: Columns, which values are contained in rows
+    :param rows: Calculated rows
+    """
+    Path.mkdir(Path(os.path.dirname(file_path)), exist_ok=True, parents=True)
+    temporary_file = f"{file_path}.tmp"
+    if os.path.exists(temporary_file):
+        os.remove(temporary_file)
+
+    engine = create_db_engine(temporary_file)
+    create_tables(engine)
+    snapshot_table.create(engine)
+    with engine.begin() as connection:
+        git_stat_rows = prepare_all_rows(column_names, rows)
+        if len(git_stat_rows) > 0:
+            connection.execute(insert(GitStat), git_stat_rows)
+        # Indexes are not part of GitStat metadata, in memory tables do not need them
+        for column_name in INDEXED_COLUMNS:
+            connection.execute(
+                text(
+                    f"CREATE INDEX ix_{column_name.value} "
+                    f"ON {GitStat.__tablename__} ({column_name.value})"
+                )
+            )
+        connection.execute(
+            insert(snapshot_table),
+            {"version": RESULTS_DB_VERSION, "head_commit": head_commit},
+        )
+    engine.dispose()
+    os.replace(temporary_file, file_path)
+
+
+def execute_query_in_results_db(
+    file_path: str, root_node: StatementNode
+) -> List[List[Any]]:
+    """
+    Filter, sort and select rows of results database
+    :param file_path: Path to results database
+    :param root_node: Parsed query
+    :return: Rows with values of shown columns, which match where statement, sorted
+    """
+    engine = create_db_engine(file_path)
+    try:
+        with engine.connect() as connection:
+            return [
+                [*row] for row in connection.execute(prepare_query_statement(root_node))
+            ]
+    finally:
+        engine.dispose()
@@ -0,0 +1,66 @@
+"""Utilities to filter, sort and select calculated rows in memory, without ORM"""
+
+import heapq
+from functools import cmp_to_key
+from itertools import islice
+from typing import List, Any, Iterable
+from enums.table import CliTableColumn
+from query_option_parser.nodes import StatementNode
+from query_option_parser.row_transformers import (
+    transform_ast_bool_op_to_row_predicate,
+    transform_sort_nodes_to_sort_keys,
+    create_rows_comparator,
+)
+
+
+def execute_query_on_rows(
+    root_node: StatementNode,
+    column_names: List[CliTableColumn],
+    rows: List[List[Any]],
+) -> List[List[Any]]:
+    """
+    Filter, sort, limit and select rows in memory.
+    With limit, only limit + offset best rows are kept in bounded heap
+    :param root_node: Parsed query
+    :param column_names: Columns, which values are contained in rows
+    :param rows: Calculated rows, numeric values are numbers
+    :return: Rows with values of shown columns, which match where statement, sorted
+    """
+    column_indexes = {
+        column_name.value: index for index, column_name in enumerate(column_names)
+    }
+    result_rows: Iterable[List[Any]] = rows
+
+    where_node = root_node.where_node
+    if where_node is not None and where_node.condition_node is not None:
+        predicate = transform_ast_bool_op_to_row_predicate(
+            where_node.condition_node, column_indexes
+        )
+        result_rows = (row for row in result_rows if predicate(row))
+
+    limit_node = root_node.limit_node
+    if root_node.order_node is not None:
+        sort_keys = transform_sort_nodes_to_sort_keys(
+            root_node.order_node.sort_rule_nodes, column_indexes
+        )
+        if limit_node is not None:
+            result_rows = heapq.nsmallest(
+                limit_node.offset + limit_node.limit,
+                result_rows,
+                key=cmp_to_key(create_rows_comparator(sort_keys)),
+            )[limit_node.offset :]
+        else:
+            result_rows = list(result_rows)
+            # Stable sorts from the least significant rule give multi-column ordering
+            for sort_key, descending in reversed(sort_keys):
+                result_rows.sort(key=sort_key, reverse=descending)
+    elif limit_node is not None:
+        result_rows = islice(
+            result_rows, limit_node.offset, limit_node.offset + limit_node.limit
+        )
+
+    shown_indexes = [
+        column_indexes[column_name.value]
+        for column_name in root_node.show_node.column_names
+    ]
+    return [[row[index] for index in shown_indexes] for row in result_rows]
@@ -0,0 +1,74 @@
+"""Test execute_query_on_rows"""
+
+from enums.table import CliTableColumn
+from repositories.row_repo import execute_query_on_rows
+from utils.command_option_parser import parse_option_query
+
+COLUMN_NAMES = [
+    CliTableColumn.FILE_NAME,
+    CliTableColumn.LINE_COUNT,
+    CliTableColumn.MOST_FREQUENT_AUTHOR,
+]
+ROWS = [
+    ["a.py", 30, "Bob"],
+    ["b.py", 5, "Alice"],
+    ["c.py", 30, "Alice"],
+    ["d.py", 100, None],
+]
+
+
+def test_only_shown_columns_selected() -> None:
+    """Test that only shown columns of matching rows are returned"""
+    rows = execute_query_on_rows(
+        parse_option_query("SHOW linecount FROM ./ WHERE linecount > 10").value,
+        COLUMN_NAMES,
+        ROWS,
+    )
+    assert rows == [[30], [30], [100]]
+
+
+def test_multiple_sort_rules() -> None:
+    """Test that later sort rules order rows with equal values of earlier ones"""
+    rows = execute_query_on_rows(
+        parse_option_query(
+            "SHOW filename FROM ./ ORDERBY linecount DESC and mfauthor ASC"
+        ).value,
+        COLUMN_NAMES,
+        ROWS,
+    )
+    assert rows == [["d.py"], ["c.py"], ["a.py"], ["b.py"]]
+
+
+def test_null_values_sorted_first_in_ascending_order() -> None:
+    """Test that NULL values are sorted like in SQLite"""
+    rows = execute_query_on_rows(
+        parse_option_query("SHOW filename FROM ./ ORDERBY mfauthor ASC").value,
+        COLUMN_NAMES,
+        ROWS,
+    )
+    assert rows == [["d.py"], ["b.py"], ["c.py"], ["a.py"]]
+
+
+def test_limit_of_sorted_rows() -> None:
+    """Test that limit and offset are applied after sorting"""
+    rows = execute_query_on_rows(
+        parse_option_query(
+            "SHOW filename FROM ./ ORDERBY linecount DESC and mfauthor ASC"
+            " LIMIT 2 OFFSET 1"
+        ).value,
+        COLUMN_NAMES,
+        ROWS,
+    )
+    assert rows == [["c.py"], ["a.py"]]
+
+
+def test_limit_of_filtered_rows() -> None:
+    """Test that limit keeps order of rows, when there is no sorting"""
+    rows = execute_query_on_rows(
+        parse_option_query(
+            "SHOW filename FROM ./ WHERE linecount >= 30 LIMIT 5 OFFSET 1"
+        ).value,
+        COLUMN_NAMES,
+        ROWS,
+    )
+    assert rows == [["c.py"], ["d.py"]]
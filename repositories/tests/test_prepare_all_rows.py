@@ -26,4 +26,4 @@ def test_populated_columns_and_rows() -> None:
         [["author", 10]],
     )
 
-    assert rows[0].maauthor == "author" and rows[0].commitcount == 10
+    assert rows == [{"maauthor": "author", "commitcount": 10}]
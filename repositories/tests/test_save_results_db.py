@@ -0,0 +1,51 @@
+"""Test save_results_db"""
+
+import os
+from enums.table import CliTableColumn
+from repositories.results_db_repo import (
+    save_results_db,
+    get_results_db_head_commit,
+    execute_query_in_results_db,
+)
+from utils.command_option_parser import parse_option_query
+
+
+def test_saved_rows_are_queried(tmp_path) -> None:
+    """Test that saved rows can be filtered and sorted, and HEAD commit is kept"""
+    file_path = os.path.join(tmp_path, "results", "repo.db")
+    save_results_db(
+        file_path,
+        "abc",
+        [CliTableColumn.FILE_NAME, CliTableColumn.LINE_COUNT],
+        [["a.py", 10], ["b.py", 30], ["c.py", 20]],
+    )
+
+    assert get_results_db_head_commit(file_path) == "abc"
+    assert execute_query_in_results_db(
+        file_path,
+        parse_option_query(
+            "SHOW filename FROM ./ WHERE linecount > 10 ORDERBY linecount DESC"
+        ).value,
+    ) == [["b.py"], ["c.py"]]
+
+
+def test_previous_rows_are_replaced(tmp_path) -> None:
+    """Test that saving rows of new HEAD commit replaces previous database"""
+    file_path = os.path.join(tmp_path, "repo.db")
+    save_results_db(file_path, "abc", [CliTableColumn.FILE_NAME], [["a.py"]])
+    save_results_db(file_path, "def", [CliTableColumn.FILE_NAME], [["b.py"]])
+
+    assert get_results_db_head_commit(file_path) == "def"
+    assert execute_query_in_results_db(
+        file_path, parse_option_query("SHOW filename FROM ./").value
+    ) == [["b.py"]]
+
+
+def test_missing_or_invalid_database(tmp_path) -> None:
+    """Test that missing or not a database file has no HEAD commit"""
+    file_path = os.path.join(tmp_path, "repo.db")
+    assert get_results_db_head_commit(file_path) is None
+
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write("not a database")
+    assert get_results_db_head_commit(file_path) is None
@@ -0,0 +1,44 @@
+"""Factory of table data calculators"""
+
+from typing import Type
+from app_types.result import ResultOk, ResultUnion, ResultValidationError
+from app_types.validation_errors import InvalidCalculatorError
+from command_interface.help_text import AVAILABLE_CALCULATORS_TEXT
+from enums.application import CalculatorBackend, Severity
+from utils.table_data_calculator import TableDataCalculator
+
+
+def create_table_data_calculator(
+    calculator_option: str,
+) -> ResultUnion[Type[TableDataCalculator], InvalidCalculatorError]:
+    """Create requested table data calculator class"""
+    match calculator_option:
+        case CalculatorBackend.PYTHON.value:
+            return ResultOk(TableDataCalculator)
+        case CalculatorBackend.NUMPY.value:
+            try:
+                # pylint: disable = import-outside-toplevel
+                from utils.numpy_table_data_calculator import NumpyTableDataCalculator
+            except ImportError:
+                return ResultValidationError(
+                    calculator_option,
+                    [
+                        InvalidCalculatorError(
+                            calculator_option,
+                            "NumPy calculator requires numpy package to be installed",
+                            Severity.CRITICAL,
+                        )
+                    ],
+                )
+            return ResultOk(NumpyTableDataCalculator)
+
+    return ResultValidationError(
+        calculator_option,
+        [
+            InvalidCalculatorError(
+                calculator_option,
+                f"Please specify correct calculator, one of: {AVAILABLE_CALCULATORS_TEXT}",
+                Severity.CRITICAL,
+            )
+        ],
+    )
@@ -2,8 +2,6 @@
 
 from typing import Optional, List, Any, Tuple
 
-from adapters.pretty_table_adapter import PrettyTableAdapter
-from adapters.rich_table_adapters import RichTableAdapter
 from app_types.protocols import CliTable
 from app_types.result import ResultOk, ResultUnion, ResultValidationError
 from app_types.validation_errors import InvalidTableLibraryError
@@ -39,7 +37,7 @@ def draw_flat_tree_table(
     colors_with_indexes: List[Tuple[CliTableColumn, ColorRanges, int]] = [
         (column_name, color, column_technical_names.index(column_name))
         for column_name, color in DEFAULT_COLORS
-        if column_technical_names.index(column_name) > 0
+        if column_name in column_technical_names
     ]
 
     for unique_key, row in zip(unique_keys, rows):
@@ -60,11 +58,16 @@ def draw_flat_tree_table(
 def create_table_instance(
     table_option: str,
 ) -> ResultUnion[CliTable, InvalidTableLibraryError]:
-    """Create requested library instance"""
+    """Create requested library instance, only library of requested table is imported"""
+    # pylint: disable = import-outside-toplevel
     match table_option:
         case TableLibrary.PRETTY_TABLE.value:
+            from adapters.pretty_table_adapter import PrettyTableAdapter
+
             return ResultOk(PrettyTableAdapter())
         case TableLibrary.RICH_TABLE.value:
+            from adapters.rich_table_adapters import RichTableAdapter
+
             return ResultOk(RichTableAdapter())
 
     return ResultValidationError(
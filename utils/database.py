@@ -1,12 +1,31 @@
 """Utils for database"""
 
-from sqlalchemy import create_engine, Engine
+from typing import Optional
+from sqlalchemy import create_engine, Engine, event
 from orm.git_stat import Base
 
+# Database lives only for single query or is written to temporary file and
+# moved into place afterwards, so durability is not needed
+SQLITE_PRAGMAS = [
+    "PRAGMA journal_mode = OFF",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+]
 
-def create_db_engine() -> Engine:
-    """Create sqlite in memory database"""
-    return create_engine("sqlite:///:memory:")
+
+def set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Set pragmas for each new sqlite connection"""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def create_db_engine(file_path: Optional[str] = None) -> Engine:
+    """Create sqlite database, in memory if file path is omitted"""
+    engine = create_engine(f"sqlite:///{file_path or ':memory:'}")
+    event.listen(engine, "connect", set_sqlite_pragmas)
+    return engine
 
 
 def create_tables(engine: Engine) -> None:
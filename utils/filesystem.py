@@ -1,10 +1,11 @@
 """Utils for file names and directories"""
 
+import hashlib
 import json
 import os
 import sys
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Any, Optional
 import re
 
 
@@ -45,15 +46,44 @@ def is_linux() -> bool:
     return sys.platform == "linux"
 
 
+def get_application_directory() -> str:
+    """Get directory where application stores its files"""
+    if is_macos() or is_linux():
+        return os.path.join(os.path.expanduser("~"), ".git-gut")
+
+    return os.path.dirname(os.path.abspath(__file__))
+
+
 def get_stored_queries_file_path() -> Tuple[str, str]:
     """Get file path of file which contains saved queries"""
-    if is_macos() or is_linux():
-        return (
-            os.path.join(os.path.expanduser("~"), ".git-gut"),
-            "stored-queries.json",
-        )
+    return get_application_directory(), "stored-queries.json"
+
+
+def get_server_socket_file_path() -> Tuple[str, str]:
+    """Get file path of Unix socket, where query server listens by default"""
+    return get_application_directory(), "serve.sock"
+
+
+def get_stats_cache_file_path(repo_path: str) -> Tuple[str, str]:
+    """Get file path of file which contains cached stats of repository"""
+    repo_hash = hashlib.sha1(os.path.abspath(repo_path).encode("utf-8")).hexdigest()
+    return os.path.join(get_application_directory(), "cache"), f"{repo_hash}.json"
+
 
-    return os.path.dirname(os.path.abspath(__file__)), "stored-queries.json"
+def get_non_text_cache_file_path(repo_path: str) -> Tuple[str, str]:
+    """Get file path of file which contains cached binary checks of repository blobs"""
+    repo_hash = hashlib.sha1(os.path.abspath(repo_path).encode("utf-8")).hexdigest()
+    return os.path.join(get_application_directory(), "nontext"), f"{repo_hash}.json"
+
+
+def get_results_db_file_path(repo_path: str, from_path: str) -> Tuple[str, str]:
+    """Get file path of database which contains calculated rows of repository path"""
+    results_hash = hashlib.sha1(
+        json.dumps([os.path.abspath(repo_path), os.path.abspath(from_path)]).encode(
+            "utf-8"
+        )
+    ).hexdigest()
+    return os.path.join(get_application_directory(), "results"), f"{results_hash}.db"
 
 
 def get_stored_queries_from_file() -> Dict[str, str]:
@@ -75,3 +105,58 @@ def save_queries_to_file(queries: Dict[str, str]) -> None:
     with open(os.path.join(file_path[0], file_path[1]), "w", encoding="utf-8") as file:
         # noinspection PyTypeChecker
         json.dump(queries, file)
+
+
+def get_stats_cache_from_file(repo_path: str) -> Optional[Dict[str, Any]]:
+    """Get cached stats of repository"""
+    file_path = get_stats_cache_file_path(repo_path)
+    try:
+        with open(
+            os.path.join(file_path[0], file_path[1]), "r", encoding="utf-8"
+        ) as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def save_stats_cache_to_file(repo_path: str, stats_cache: Dict[str, Any]) -> None:
+    """Saves cached stats of repository to file"""
+    file_path = get_stats_cache_file_path(repo_path)
+    Path.mkdir(Path(file_path[0]), exist_ok=True, parents=True)
+    temporary_file = os.path.join(file_path[0], f"{file_path[1]}.tmp")
+    with open(temporary_file, "w", encoding="utf-8") as file:
+        # noinspection PyTypeChecker
+        json.dump(stats_cache, file)
+    os.replace(temporary_file, os.path.join(file_path[0], file_path[1]))
+
+
+def get_non_text_cache_from_file(
+    repo_path: str, attributes_state: str
+) -> Dict[str, bool]:
+    """
+    Get cached binary checks of repository blobs,
+    empty if they were made with other gitattributes
+    """
+    file_path = get_non_text_cache_file_path(repo_path)
+    try:
+        with open(
+            os.path.join(file_path[0], file_path[1]), "r", encoding="utf-8"
+        ) as file:
+            non_text_cache = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+    if non_text_cache.get("attributes") != attributes_state:
+        return {}
+    return non_text_cache["blobs"]
+
+
+def save_non_text_cache_to_file(
+    repo_path: str, attributes_state: str, blobs_cache: Dict[str, bool]
+) -> None:
+    """Saves cached binary checks of repository blobs to file"""
+    file_path = get_non_text_cache_file_path(repo_path)
+    Path.mkdir(Path(file_path[0]), exist_ok=True, parents=True)
+    with open(os.path.join(file_path[0], file_path[1]), "w", encoding="utf-8") as file:
+        # noinspection PyTypeChecker
+        json.dump({"attributes": attributes_state, "blobs": blobs_cache}, file)
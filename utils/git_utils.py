@@ -1,17 +1,42 @@
 """Git utils"""
 
 import asyncio
+import hashlib
 import os
-from typing import List, Callable, Dict, cast, Optional
-from statistics import mode
+from typing import (
+    List,
+    Callable,
+    Dict,
+    cast,
+    Optional,
+    Sequence,
+    Iterable,
+    Iterator,
+    Set,
+    Tuple,
+)
+from pathlib import PurePath
 from git import Tree, Git, Repo, exc
 from app_types.dataclasses import FileCommitStats, GitLogOptions
 from app_types.result import ResultUnion, ResultOk, ResultException
-from utils.numbers import is_number
-from utils.text import trim_side_quotes
-
-
-CONCURRENT_CONSUMER_AMOUNT = 4
+from collectors.numstat_parser import (
+    is_stat_trackable,
+    iter_numstat_commits,
+    PATH_ENCODING,
+    PATH_ERRORS,
+    READ_CHUNK_SIZE,
+    read_numstat_log,
+    spread_numstat_commits,
+)
+from collectors.commit_stats_store import CommitStatsStore, CommitStatsStoreBuilder
+from collectors.rename_graph import build_rename_graph, get_files_history_names
+from defaults.command import DEFAULT_JOBS
+from utils.profiler import record_git_process, record_git_output
+
+# Tree without files, numstat against it reports every file of the other tree
+EMPTY_TREE_SHA = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
+# Pathspecs of single git call are limited, to stay below command line length limit
+PATHSPEC_CHUNK_SIZE = 1000
 
 
 # pylint: disable = too-few-public-methods
@@ -22,18 +47,21 @@ class _QueueEnd:
     """
 
 
-async def _file_name_producer(queue: asyncio.Queue, file_names: List[str]) -> None:
+async def _file_name_producer(
+    queue: asyncio.Queue, file_names: List[str], consumer_amount: int
+) -> None:
     """
     Producer for collecting files git stats
     This function should not be called directly
     :param queue: asyncio.Queue
     :param file_names: List of all file names
+    :param consumer_amount: Amount of consumers to notify about queue end
     :return: Explicitly return None
     """
     for name in file_names:
         await queue.put(name)
 
-    for _ in range(0, CONCURRENT_CONSUMER_AMOUNT):
+    for _ in range(0, consumer_amount):
         await queue.put(_QueueEnd())
 
     return None
@@ -43,15 +71,19 @@ async def _file_name_consumer(
     queue: asyncio.Queue,
     git_instance: Git,
     log_options: GitLogOptions,
-) -> Dict[str, List[FileCommitStats]]:
+    history_names: Dict[str, List[str]],
+    builder: CommitStatsStoreBuilder,
+) -> None:
     """
     Consumer function for collecting files git stats
     This function should not be called directly
     :param queue: asyncio.Queue
     :param git_instance: Git instance
-    :return: Returns dictionary, with portion of files and corresponding list of file stats
+    :param log_options: Git log options
+    :param history_names: Historical names of each file
+    :param builder: Commit stats store builder, which receives stats of each file
+    :return: Explicitly return None
     """
-    result_data: Dict[str, List[FileCommitStats]] = {}
     while True:
         file_name: str | _QueueEnd = await queue.get()
         if isinstance(file_name, _QueueEnd):
@@ -60,238 +92,435 @@ async def _file_name_consumer(
 
         res = await asyncio.to_thread(
             lambda: (
-                get_file_stats(git_instance, file_name, log_options)
+                get_file_stats(
+                    git_instance, file_name, log_options, history_names[file_name]
+                )
                 if isinstance(file_name, str)
                 else []
             )
         )
-        result_data[file_name] = res
+        builder.add_file_stats(file_name, res)
         queue.task_done()
-    return result_data
+    return None
 
 
 async def _collect_stats_all_files(
-    git_instance: Git, file_names: List[str], log_options: GitLogOptions
+    git_instance: Git, file_names: List[str], log_options: GitLogOptions, jobs: int
 ):
     """
     Collect git stats for each file
     This function should not be called directly
     :param git_instance: Instance of Git
     :param file_names: List of all file names
+    :param jobs: Amount of concurrent consumers
     """
     queue = asyncio.Queue(maxsize=32)
-    task_result = await asyncio.gather(
-        _file_name_producer(queue, file_names),
+    history_names = get_files_history_names(
+        build_rename_graph(git_instance), file_names
+    )
+    builder = CommitStatsStoreBuilder()
+    await asyncio.gather(
+        _file_name_producer(queue, file_names, jobs),
         *(
-            _file_name_consumer(queue, git_instance, log_options)
-            for _ in range(0, CONCURRENT_CONSUMER_AMOUNT)
+            _file_name_consumer(
+                queue, git_instance, log_options, history_names, builder
+            )
+            for _ in range(0, jobs)
         ),
         return_exceptions=True,
     )
-    map_result: Dict[str, List[FileCommitStats]] = {}
-    for entry in task_result:
-        if entry is not None and not isinstance(entry, BaseException):
-            map_result |= entry
 
-    return map_result
+    return builder.build()
 
 
 def get_all_files_stats(
     file_names: List[str],
     git: Git,
     log_options: GitLogOptions,
-) -> Dict[str, List[FileCommitStats]]:
+    jobs: int = DEFAULT_JOBS,
+) -> CommitStatsStore:
     """
     Return git stats for all specified files
     :param file_names: All specified file names for which we need to collect stats
     :param git: Git instance
     :param log_options: Git log options
-    :return: List of git stats for each file
+    :param jobs: Amount of concurrent git processes
+    :return: Commit stats store of all files
+    """
+    return asyncio.run(_collect_stats_all_files(git, file_names, log_options, jobs))
+
+
+def iter_tree_entries(
+    git_instance: Git, tree_ish: str, pathspecs: Sequence[str] = ()
+) -> Iterator[Tuple[str, str, str]]:
+    """
+    Stream entries of tree and its subtrees from single git ls-tree process
+    :param git_instance: Instance of git.Git, paths are relative to its working directory
+    :param tree_ish: Tree, commit or other reference of tree
+    :param pathspecs: Optional pathspecs, which limit listed entries
+    :return: Iterator of object type, object SHA and path of each entry
+    """
+    process = git_instance.ls_tree(
+        "-r", "-z", tree_ish, "--", *pathspecs, as_process=True
+    )
+    record_git_process()
+    remainder = b""
+    while chunk := process.stdout.read(READ_CHUNK_SIZE):
+        record_git_output(len(chunk))
+        # Entries are decoded together, only the last incomplete one waits for next chunk
+        entries, _, remainder = (remainder + chunk).rpartition(b"\0")
+        if entries == b"":
+            continue
+        for entry in entries.decode(PATH_ENCODING, PATH_ERRORS).split("\0"):
+            object_info, _, path = entry.partition("\t")
+            _, object_type, object_sha = object_info.split(" ")
+            yield object_type, object_sha, path
+    process.wait()
+
+
+def get_repo_relative_path(tree: Tree, path: str) -> Optional[str]:
+    """
+    Get path relative to working tree of repository, which tree belongs to
+    :param tree: Instance of git.Tree
+    :param path: Path relative to current directory, or absolute path
+    :return: Relative path in git format, None if path is outside of repository
     """
-    return asyncio.run(_collect_stats_all_files(git, file_names, log_options))
+    relative_path = os.path.relpath(
+        os.path.abspath(path), cast(str, tree.repo.working_tree_dir)
+    )
+    if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+        return None
+
+    return PurePath(relative_path).as_posix()
 
 
-def get_flat_file_tree(tree: Tree, specific_path: Optional[str] = None) -> List[str]:
+def get_flat_file_tree(
+    tree: Tree,
+    specific_path: Optional[str] = None,
+    file_filter: Optional[Callable[[str], bool]] = None,
+) -> List[str]:
     """
-    Iterate through the whole git file tree.
+    Get files of the whole git file tree, of its directory, or specific file.
     :param tree: Instance of git.Tree
     :param specific_path: Optional parameter to specify directory, specific file, omit if whole repo
+    :param file_filter: Optional filter of file paths, omit to keep all files
     :return: Flat representation of file tree.
     """
     if specific_path is not None and os.path.isdir(specific_path):
-        return get_sub_directory_file_list(tree, specific_path)
+        return get_sub_directory_file_list(tree, specific_path, file_filter)
 
     if specific_path is not None and os.path.isfile(specific_path):
-        return get_specific_file_as_list(tree, specific_path)
+        return get_specific_file_as_list(tree, specific_path, file_filter)
 
-    return get_tree_file_list(tree)
+    return get_tree_file_list(tree, file_filter)
 
 
-def get_specific_file_as_list(tree: Tree, specific_path: str) -> List[str]:
+def get_specific_file_as_list(
+    tree: Tree,
+    specific_path: str,
+    file_filter: Optional[Callable[[str], bool]] = None,
+) -> List[str]:
     """
-    Make sure specified file path exists in git tree and return in a list
+    Make sure specified file path exists in git tree and return in a list.
+    Only trees on the way to the file are read.
     :param tree: Instance of git.Tree
     :param specific_path: File path
-    :return: Single file name inside of list
+    :param file_filter: Optional filter of file paths, omit to keep all files
+    :return: Single file name, relative to repository, inside of list
     """
-    generated_list: List[str] = []
-    abs_specific_path = os.path.abspath(specific_path)
+    relative_path = get_repo_relative_path(tree, specific_path)
+    if relative_path is None:
+        return []
 
-    for entry in tree:
-        if entry.type == "blob" and entry.abspath == abs_specific_path:
-            return [specific_path]
-        if entry.type == "tree":
-            generated_list.extend(
-                get_specific_file_as_list(cast(Tree, entry), specific_path)
-            )
+    try:
+        entry = tree.join(relative_path)
+    except KeyError:
+        return []
 
-    return generated_list
+    if entry.type != "blob" or (
+        file_filter is not None and not file_filter(relative_path)
+    ):
+        return []
 
+    return [relative_path]
 
-def get_sub_directory_file_list(tree: Tree, specific_path: str) -> List[str]:
+
+def get_sub_directory_file_list(
+    tree: Tree,
+    specific_path: str,
+    file_filter: Optional[Callable[[str], bool]] = None,
+) -> List[str]:
     """
     Return subdirectory of repo as flat structure
     :param tree: Instance of git.Tree
     :param specific_path: Sub directory to return as flat file tree
+    :param file_filter: Optional filter of file paths, omit to keep all files
     :return: Flat representation of file tree of subdirectory in repo
     """
-    generated_list: List[str] = []
-    abs_specific_path = os.path.abspath(specific_path)
-
-    if tree.abspath == abs_specific_path:
-        return get_tree_file_list(tree)
-
-    for entry in tree:
-        if entry.abspath == abs_specific_path:
-            return get_tree_file_list(cast(Tree, entry))
-        if entry.type == "tree":
-            generated_list.extend(
-                get_sub_directory_file_list(cast(Tree, entry), specific_path)
-            )
-
-    return generated_list
+    relative_path = get_repo_relative_path(tree, specific_path)
+    if relative_path is None:
+        return []
+
+    return get_tree_file_list(
+        tree,
+        file_filter,
+        [] if relative_path == os.curdir else get_literal_pathspecs([relative_path]),
+    )
 
 
-def get_tree_file_list(tree: Tree) -> List[str]:
+def get_tree_file_list(
+    tree: Tree,
+    file_filter: Optional[Callable[[str], bool]] = None,
+    pathspecs: Sequence[str] = (),
+) -> List[str]:
     """
-    Iterate through the whole git file tree.
+    List files of the whole git file tree with single git call.
     :param tree: Instance of git.Tree
+    :param file_filter: Optional filter of file paths, omit to keep all files
+    :param pathspecs: Optional pathspecs, which limit listed files
     :return: Flat representation of file tree.
     """
-    generated_list: List[str] = []
+    return [
+        path
+        for object_type, _, path in iter_tree_entries(
+            tree.repo.git, tree.hexsha, pathspecs
+        )
+        if object_type == "blob" and (file_filter is None or file_filter(path))
+    ]
 
-    for entry in tree:
-        if entry.type == "blob":
-            generated_list.append(cast(str, entry.path))
-        if entry.type == "tree":
-            generated_list.extend(get_flat_file_tree(entry))
 
-    return generated_list
+def get_log_interval_options(log_options: GitLogOptions) -> List[str]:
+    """
+    Transform git log options into git log command line arguments
+    :param log_options: Git log options
+    :return: List of git log arguments
+    """
+    options = []
+    if log_options.since is not None:
+        options.append(f'--since="{log_options.since}"')
+    if log_options.until is not None:
+        options.append(f'--until="{log_options.until}"')
 
+    return options
 
-def is_stat_trackable(split_stat: List[str]) -> bool:
-    """Check if commit stats can be tracked, that is - they are integers"""
-    return (
-        len(split_stat) >= 2 and is_number(split_stat[0]) and is_number(split_stat[1])
-    )
+
+def get_renamed_file_log_arguments(
+    log_options: GitLogOptions, history_names: List[str]
+) -> List[str]:
+    """
+    Prepare git log arguments to collect number stats of file under all its names
+    :param log_options: Git log options
+    :param history_names: All names file had in history
+    :return: List of git log arguments, which are added to numstat log arguments
+    """
+    return [
+        "-M",
+        # Without it, commits of merged branches, whose change merge discarded, are skipped
+        "--full-history",
+        *get_log_interval_options(log_options),
+        "--",
+        *history_names,
+    ]
+
+
+def get_literal_pathspecs(paths: Iterable[str]) -> List[str]:
+    """Transform paths into git pathspecs, which match exactly these paths"""
+    return [f":(literal){path}" for path in paths]
 
 
 def get_file_stats(
-    git_instance: Git, filepath: str, log_options: GitLogOptions
+    git_instance: Git,
+    filepath: str,
+    log_options: GitLogOptions,
+    history_names: Optional[List[str]] = None,
 ) -> List[FileCommitStats]:
     """
     Collect number stats about single file from git.
     :param git_instance: Instance of git.Git
     :param filepath: Path to the file
     :param log_options: Git log options
+    :param history_names: All names file had in history (from rename graph),
+        omit to let git follow renames of the file
     :return: Return list of stats.
     """
-    options = []
-    if log_options.since is not None:
-        options.append(f'--since="{log_options.since}"')
-    if log_options.until is not None:
-        options.append(f'--until="{log_options.until}"')
-
-    raw_result: str = git_instance.log(
-        "--follow", "--numstat", '--format="%an"', *options, "--", filepath
+    if history_names is not None:
+        return spread_numstat_commits(
+            iter_numstat_commits(
+                read_numstat_log(
+                    git_instance,
+                    *get_renamed_file_log_arguments(log_options, history_names),
+                    line_counts=log_options.line_counts,
+                    authors=log_options.authors,
+                ),
+                log_options.line_counts,
+            ),
+            {filepath},
+        ).get_file_stats(filepath)
+
+    commits = iter_numstat_commits(
+        read_numstat_log(
+            git_instance,
+            "--follow",
+            *get_log_interval_options(log_options),
+            "--",
+            filepath,
+            line_counts=log_options.line_counts,
+            authors=log_options.authors,
+        ),
+        log_options.line_counts,
     )
-    separate_lines = list(filter(lambda x: x != "", raw_result.splitlines()))
-    commit_list = list(zip(separate_lines[::2], separate_lines[1::2]))
-
-    result = []
-    for commit_info in commit_list:
-        split_stat = commit_info[1].split()
-
-        if is_stat_trackable(split_stat):
-            result.append(
-                FileCommitStats(
-                    added_lines=int(split_stat[0]),
-                    removed_lines=int(split_stat[1]),
-                    author=commit_info[0],
-                )
-            )
-
-    return result
+    return [
+        FileCommitStats(
+            added_lines=entry.added_lines or 0,
+            removed_lines=entry.removed_lines or 0,
+            author=commit.author,
+        )
+        for commit in commits
+        for entry in commit.entries
+    ]
 
 
-def get_most_frequent_author(file_stats: List[FileCommitStats]) -> str:
+def get_head_blobs(git_instance: Git) -> Dict[str, str]:
     """
-    Calculate the author of the most code in file
-    :param file_stats: Git stats of a file
-    :return: Author name
+    Get blob of every file at HEAD commit, under working directory of git instance
+    :param git_instance: Instance of git.Git
+    :return: Blob SHA by file name
     """
-    authors = [info.author for info in file_stats]
-    return trim_side_quotes(mode(authors)) if len(authors) > 0 else "-"
+    return {
+        path: object_sha
+        for object_type, object_sha, path in iter_tree_entries(git_instance, "HEAD")
+        if object_type == "blob"
+    }
 
 
-def get_top_author_by_stat(
-    file_stats: List[FileCommitStats],
-    func: Callable[[FileCommitStats], int],
-) -> str:
+def get_non_text_file_names(git_instance: Git, file_names: List[str]) -> Set[str]:
     """
-    Functions calculates top author,
-    by summing up specific stat which is returned by provided function
-    :param file_stats: Git stats of a file
-    :param func: Function to be applied on file commit stats to extract specific property
-    :return: Top author and summed up stat
+    Find binary files with numstat of HEAD tree against empty tree,
+    git reports "-" instead of line counts for them, according to its attributes
+    :param git_instance: Instance of git.Git
+    :param file_names: Files to check, all files are checked when it is empty
+    :return: Names of binary files
     """
-    authors_data = {}
-    for stat in file_stats:
-        authors_data[stat.author] = authors_data.get(stat.author, 0) + func(stat)
-
-    top_author = max(authors_data, key=authors_data.get)
-    author_total_sum = authors_data[top_author]
+    pathspec_chunks = [
+        get_literal_pathspecs(file_names[start : start + PATHSPEC_CHUNK_SIZE])
+        for start in range(0, len(file_names), PATHSPEC_CHUNK_SIZE)
+    ] or [[]]
+    result: Set[str] = set()
+    for pathspecs in pathspec_chunks:
+        raw_result: str = git_instance.diff(
+            "--numstat",
+            "-z",
+            "--no-renames",
+            "--relative",
+            EMPTY_TREE_SHA,
+            "HEAD",
+            "--",
+            *pathspecs,
+        )
+        record_git_process()
+        record_git_output(len(raw_result.encode()))
+        for entry in raw_result.split("\0"):
+            split_stat = entry.split("\t", 2)
+            if len(split_stat) == 3 and not is_stat_trackable(split_stat):
+                result.add(split_stat[2])
 
-    return f"{trim_side_quotes(top_author)} ({author_total_sum})"
+    return result
 
 
-def get_non_text_files(git_instance: Git) -> List[str]:
+def get_attributes_files(git_instance: Git) -> List[str]:
     """
-    Get GIT tracked files which are non text (binary).
+    Get paths of files, which gitattributes of diff are read from:
+    every .gitattributes of working tree, info/attributes and core.attributesFile
     :param git_instance: Instance of git.Git
-    :return: List of file names.
+    :return: Absolute file paths, some of them may not exist
     """
-    existing_files: List[str] = git_instance.ls_files().split()
-    result: List[str] = []
-
-    for existing_file in existing_files:
-        log_result: str = git_instance.log(
-            "--follow", "--numstat", '--format="%an"', "-n 1", "--", existing_file
+    top_level: str = git_instance.rev_parse("--show-toplevel")
+    record_git_process()
+    tracked_attributes: str = git_instance.ls_files(
+        "-z",
+        "--full-name",
+        "--cached",
+        "--others",
+        "--exclude-standard",
+        "--",
+        ":(top,glob)**/.gitattributes",
+    )
+    record_git_process()
+    info_attributes: str = git_instance.rev_parse("--git-path", "info/attributes")
+    record_git_process()
+    try:
+        global_attributes: str = git_instance.config(
+            "--path", "--get", "core.attributesFile"
         )
-        separate_lines = list(
-            filter(
-                lambda x: x != "" and not x.startswith('"'),
-                log_result.splitlines(),
-            )
+    except exc.GitCommandError:
+        global_attributes = os.path.join(
+            os.environ.get("XDG_CONFIG_HOME", os.path.expanduser("~/.config")),
+            "git",
+            "attributes",
         )
+    record_git_process()
+    return [
+        *(
+            os.path.join(top_level, name)
+            for name in dict.fromkeys(tracked_attributes.split("\0"))
+            if name != ""
+        ),
+        os.path.join(str(git_instance.working_dir), info_attributes),
+        global_attributes,
+    ]
 
-        for commit_info in separate_lines:
-            split_stat = commit_info.split()
-
-            if not is_stat_trackable(split_stat):
-                result.append(existing_file)
 
-    return result
+def get_attributes_state(git_instance: Git) -> str:
+    """
+    Get fingerprint of gitattributes, binary checks of blobs are valid only for it
+    :param git_instance: Instance of git.Git
+    :return: SHA1 of names and contents of attributes files
+    """
+    attributes_hash = hashlib.sha1()
+    for file_path in get_attributes_files(git_instance):
+        attributes_hash.update(file_path.encode(PATH_ENCODING, PATH_ERRORS) + b"\0")
+        try:
+            with open(file_path, "rb") as file:
+                attributes_hash.update(file.read())
+        except OSError:
+            attributes_hash.update(b"\0")
+        attributes_hash.update(b"\0")
+
+    return attributes_hash.hexdigest()
+
+
+def get_non_text_files(
+    git_instance: Git, blobs_cache: Dict[str, bool]
+) -> Tuple[List[str], Dict[str, bool]]:
+    """
+    Get GIT tracked files which are non text (binary).
+    Only blobs, which are missing in cache, are checked by git.
+    :param git_instance: Instance of git.Git
+    :param blobs_cache: Whether blob is binary, by blob SHA
+    :return: List of file names and cache of blobs at HEAD commit
+    """
+    head_blobs = get_head_blobs(git_instance)
+    unknown_files = [
+        file_name
+        for file_name, blob_sha in head_blobs.items()
+        if blob_sha not in blobs_cache
+    ]
+    if len(unknown_files) > 0:
+        non_text_file_names = get_non_text_file_names(
+            git_instance,
+            [] if len(unknown_files) == len(head_blobs) else unknown_files,
+        )
+        blobs_cache = {
+            **blobs_cache,
+            **{
+                head_blobs[file_name]: file_name in non_text_file_names
+                for file_name in unknown_files
+            },
+        }
+
+    return [
+        file_name for file_name, blob_sha in head_blobs.items() if blobs_cache[blob_sha]
+    ], {blob_sha: blobs_cache[blob_sha] for blob_sha in head_blobs.values()}
 
 
 def get_repo_instance(
@@ -0,0 +1,178 @@
+"""
+Builder for table, which calculates each column for all files at once with NumPy.
+NumPy is optional, so this module is imported only when numpy calculator is chosen
+"""
+
+from functools import cached_property
+from typing import List, Unpack, Tuple
+import numpy as np  # pylint: disable = import-error
+from app_types.utils import ColumnBuilderKwargs
+from collectors.commit_stats_store import CommitStatsStore
+from utils.table_data_calculator import TableDataCalculator, shorten_ratio
+from utils.text import trim_side_quotes
+
+
+# pylint: disable = too-few-public-methods
+class NumpyTableDataCalculator(TableDataCalculator):
+    """
+    Calculator for table data, which computes every column of all files
+    in few grouped operations over flat columns of commit stats store
+    """
+
+    def __init__(
+        self,
+        flat_file_tree: List[str],
+        files_stats: CommitStatsStore,
+        **kwargs: Unpack[ColumnBuilderKwargs],
+    ):
+        """Initialize calculator"""
+        super().__init__(flat_file_tree, files_stats, **kwargs)
+        offsets = np.frombuffer(files_stats.offsets, dtype=np.uint64)
+        added_lines, removed_lines, author_ids = files_stats.columns
+        self._file_amount = len(files_stats)
+        self._commit_counts = np.diff(offsets).astype(np.int64)
+        self._file_indexes = np.repeat(
+            np.arange(self._file_amount, dtype=np.int64), self._commit_counts
+        )
+        self._added_lines = np.frombuffer(added_lines, dtype=np.uint32).astype(np.int64)
+        self._removed_lines = np.frombuffer(removed_lines, dtype=np.uint32).astype(
+            np.int64
+        )
+        self._author_ids = np.frombuffer(author_ids, dtype=np.uint32).astype(np.int64)
+
+    def _sum_per_file(self, values: np.ndarray) -> np.ndarray:
+        """Sum up values of each file"""
+        return np.bincount(
+            self._file_indexes, weights=values, minlength=self._file_amount
+        )
+
+    @cached_property
+    def _commit_amounts(self) -> List[int]:
+        """Commit amount of each file"""
+        return self._commit_counts.tolist()
+
+    @cached_property
+    def _line_counts(self) -> List[int]:
+        """Line count of each file"""
+        return (
+            np.rint(self._sum_per_file(self._added_lines - self._removed_lines))
+            .astype(np.int64)
+            .tolist()
+        )
+
+    @cached_property
+    def _ratios(self) -> List[float]:
+        """Mean of deleted/added ratios of each file"""
+        ratio_sums = self._sum_per_file(
+            self._removed_lines / np.where(self._added_lines != 0, self._added_lines, 1)
+        )
+        return np.divide(
+            ratio_sums,
+            self._commit_counts,
+            out=np.zeros(self._file_amount),
+            where=self._commit_counts != 0,
+        ).tolist()
+
+    @cached_property
+    def _file_authors(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Group commits by file and author pairs
+        :return: File index, author id and inverse index of each pair,
+            pairs are ordered by first appearance in file (newest commit first)
+        """
+        author_amount = max(len(self._files_stats.authors), 1)
+        pairs, first_positions, inverse = np.unique(
+            self._file_indexes * author_amount + self._author_ids,
+            return_index=True,
+            return_inverse=True,
+        )
+        order = np.argsort(first_positions, kind="stable")
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        pairs = pairs[order]
+        return pairs // author_amount, pairs % author_amount, rank[inverse]
+
+    def _get_top_authors(self, values: np.ndarray) -> Tuple[List[int], List[int]]:
+        """
+        Find author with highest summed up value of each file,
+        ties are won by the author who appears first
+        :param values: Value of each commit
+        :return: Top author id and its summed up value of each file, -1 if file has no stats
+        """
+        pair_files, pair_authors, inverse = self._file_authors
+        pair_values = np.rint(
+            np.bincount(inverse, weights=values, minlength=len(pair_files))
+        ).astype(np.int64)
+        order = np.lexsort((np.arange(len(pair_files)), -pair_values, pair_files))
+        is_first = np.ones(len(order), dtype=bool)
+        is_first[1:] = pair_files[order][1:] != pair_files[order][:-1]
+        top_pairs = order[is_first]
+
+        top_authors = np.full(self._file_amount, -1, dtype=np.int64)
+        top_values = np.zeros(self._file_amount, dtype=np.int64)
+        top_authors[pair_files[top_pairs]] = pair_authors[top_pairs]
+        top_values[pair_files[top_pairs]] = pair_values[top_pairs]
+        return top_authors.tolist(), top_values.tolist()
+
+    @cached_property
+    def _most_frequent_authors(self) -> Tuple[List[int], List[int]]:
+        """Author with most commits of each file"""
+        return self._get_top_authors(np.ones(len(self._author_ids)))
+
+    @cached_property
+    def _most_added_authors(self) -> Tuple[List[int], List[int]]:
+        """Author with most added lines of each file"""
+        return self._get_top_authors(self._added_lines)
+
+    @cached_property
+    def _most_deleted_authors(self) -> Tuple[List[int], List[int]]:
+        """Author with most deleted lines of each file"""
+        return self._get_top_authors(self._removed_lines)
+
+    def _get_author_name(self, author_id: int) -> str:
+        """Get author name by its id"""
+        return trim_side_quotes(self._files_stats.authors[author_id])
+
+    def _add_commit_amount(self, file_name: str) -> int:
+        """Calculate commit amount column"""
+        index = self._files_stats.get_file_index(file_name)
+        return self._commit_amounts[index] if index is not None else 0
+
+    def _add_author(self, file_name: str) -> str:
+        """Calculate author column"""
+        index = self._files_stats.get_file_index(file_name)
+        top_authors = self._most_frequent_authors[0]
+        if index is None or top_authors[index] == -1:
+            return "-"
+
+        return self._get_author_name(top_authors[index])
+
+    def _add_top_author(
+        self, file_name: str, top_authors: Tuple[List[int], List[int]]
+    ) -> str:
+        """Calculate top author by summed up stat column"""
+        index = self._files_stats.get_file_index(file_name)
+        if index is None or top_authors[0][index] == -1:
+            return "-"
+
+        return (
+            f"{self._get_author_name(top_authors[0][index])} ({top_authors[1][index]})"
+        )
+
+    def _add_most_added_lines_author(self, file_name: str) -> str:
+        """Calculate author of most added lines of code column"""
+        return self._add_top_author(file_name, self._most_added_authors)
+
+    def _add_most_deleted_lines_author(self, file_name: str) -> str:
+        """Calculate author of most deleted lines of code column"""
+        return self._add_top_author(file_name, self._most_deleted_authors)
+
+    def _add_delete_add_ratio(self, file_name: str) -> float:
+        """Calculate deleted/added ratio column"""
+        index = self._files_stats.get_file_index(file_name)
+        return shorten_ratio(self._ratios[index] if index is not None else 0)
+
+    def _add_line_count(self, file_name: str) -> int:
+        """Calculate line amount in file (from git history) column"""
+        index = self._files_stats.get_file_index(file_name)
+        return self._line_counts[index] if index is not None else 0
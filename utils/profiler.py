@@ -0,0 +1,153 @@
+"""Per stage profile of query processing: time, git usage, rows and memory"""
+
+import cProfile
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Iterator
+from utils.filesystem import is_macos
+
+
+@dataclass
+class GitIoCounters:
+    """Dataclass for amount of git processes spawned and bytes read from their output"""
+
+    processes: int = 0
+    bytes_read: int = 0
+
+
+@dataclass
+class StageProfile:
+    """Dataclass for resources used by single stage of query processing"""
+
+    name: str
+    wall_time: float = 0
+    cpu_time: float = 0
+    git_io: GitIoCounters = field(default_factory=GitIoCounters)
+    rows: int = 0
+    peak_rss_kib: Optional[int] = None
+
+
+_git_io_counters = GitIoCounters()
+
+
+def record_git_process() -> None:
+    """Count git process, which was spawned by current process"""
+    _git_io_counters.processes += 1
+
+
+def record_git_output(size: int) -> None:
+    """Count bytes, which were read from git process output"""
+    _git_io_counters.bytes_read += size
+
+
+def add_git_io_counters(counters: GitIoCounters) -> None:
+    """Count git usage of other process, for example worker of process pool"""
+    _git_io_counters.processes += counters.processes
+    _git_io_counters.bytes_read += counters.bytes_read
+
+
+def get_git_io_counters() -> GitIoCounters:
+    """Get copy of git usage of current process"""
+    return replace(_git_io_counters)
+
+
+def get_git_io_counters_since(counters_before: GitIoCounters) -> GitIoCounters:
+    """Get git usage of current process since counters were taken"""
+    return GitIoCounters(
+        _git_io_counters.processes - counters_before.processes,
+        _git_io_counters.bytes_read - counters_before.bytes_read,
+    )
+
+
+def get_cpu_time() -> float:
+    """CPU time of current process and its finished child processes (git)"""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def get_peak_rss_kib() -> Optional[int]:
+    """Peak resident set size of current process or its largest child, None if unknown"""
+    try:
+        # pylint: disable = import-outside-toplevel
+        import resource
+    except ImportError:
+        return None
+
+    peak_rss = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return peak_rss // 1024 if is_macos() else peak_rss
+
+
+class QueryProfiler:
+    """Profiler of query processing stages, does nothing when disabled"""
+
+    def __init__(self, enabled: bool = False, output_path: Optional[str] = None):
+        """
+        Constructor
+        :param enabled: Whether stages are measured
+        :param output_path: Optional path, where cProfile stats of all stages are dumped
+        """
+        self.enabled = enabled
+        self.stages: List[StageProfile] = []
+        self._output_path = output_path
+        self._profile = (
+            cProfile.Profile() if enabled and output_path is not None else None
+        )
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageProfile]:
+        """
+        Measure single stage, caller can set amount of rows stage has produced
+        :param name: Stage name
+        :return: Profile of the stage, filled in when stage ends
+        """
+        stage_profile = StageProfile(name)
+        if not self.enabled:
+            yield stage_profile
+            return
+
+        git_io_before = get_git_io_counters()
+        cpu_time_before = get_cpu_time()
+        wall_time_before = time.perf_counter()
+        if self._profile is not None:
+            self._profile.enable()
+        try:
+            yield stage_profile
+        finally:
+            if self._profile is not None:
+                self._profile.disable()
+            stage_profile.wall_time = time.perf_counter() - wall_time_before
+            stage_profile.cpu_time = get_cpu_time() - cpu_time_before
+            stage_profile.git_io = get_git_io_counters_since(git_io_before)
+            stage_profile.peak_rss_kib = get_peak_rss_kib()
+            self.stages.append(stage_profile)
+
+    def dump_stats(self) -> None:
+        """Write cProfile stats to output path, if it was requested"""
+        if self._profile is not None and self._output_path is not None:
+            self._profile.dump_stats(self._output_path)
+
+    def format_report(self) -> str:
+        """Format measured stages as text table"""
+        lines = [
+            f"{'Stage':<40}{'Wall s':>10}{'CPU s':>10}{'Git procs':>11}"
+            f"{'Git KiB':>11}{'Rows':>10}{'Peak RSS MiB':>14}"
+        ]
+        for stage_profile in self.stages:
+            peak_rss = (
+                f"{stage_profile.peak_rss_kib / 1024:.1f}"
+                if stage_profile.peak_rss_kib is not None
+                else "-"
+            )
+            lines.append(
+                f"{stage_profile.name:<40}{stage_profile.wall_time:>10.3f}"
+                f"{stage_profile.cpu_time:>10.3f}{stage_profile.git_io.processes:>11}"
+                f"{stage_profile.git_io.bytes_read / 1024:>11.1f}"
+                f"{stage_profile.rows:>10}{peak_rss:>14}"
+            )
+
+        return "\n".join(lines)
@@ -0,0 +1,228 @@
+"""Planner of columns and raw git data, which are needed to execute query"""
+
+import ast
+from typing import List, Dict, Callable, Optional, Tuple
+from app_types.dataclasses import CollectionRequirements, QueryPlan
+from enums.table import CliTableColumn
+from query_option_parser.nodes import StatementNode, WhereNode, OrderNode, LimitNode
+from query_option_parser.row_transformers import transform_ast_bool_op_to_row_predicate
+from utils.filesystem import trim_directories
+
+# Longer git command lines could exceed argument length limits
+MAX_PATHSPECS = 1000
+
+COLUMN_REQUIREMENTS: Dict[CliTableColumn, CollectionRequirements] = {
+    CliTableColumn.FILE_NAME: CollectionRequirements(),
+    CliTableColumn.COMMIT_AMOUNT: CollectionRequirements(commits=True),
+    CliTableColumn.MOST_FREQUENT_AUTHOR: CollectionRequirements(
+        commits=True, authors=True
+    ),
+    CliTableColumn.MOST_ADDED_AUTHOR: CollectionRequirements(
+        commits=True, line_counts=True, authors=True
+    ),
+    CliTableColumn.MOST_DELETED_AUTHOR: CollectionRequirements(
+        commits=True, line_counts=True, authors=True
+    ),
+    CliTableColumn.DELETED_ADDED_RATIO: CollectionRequirements(
+        commits=True, line_counts=True
+    ),
+    CliTableColumn.LINE_COUNT: CollectionRequirements(commits=True, line_counts=True),
+}
+
+
+def get_where_columns(where_node: WhereNode | None) -> List[CliTableColumn]:
+    """Get columns, which are referenced by where clause conditions"""
+    if where_node is None or where_node.condition_node is None:
+        return []
+
+    column_values = {column.value for column in COLUMN_REQUIREMENTS}
+    return [
+        CliTableColumn(node.id)
+        for node in ast.walk(where_node.condition_node)
+        if isinstance(node, ast.Name) and node.id in column_values
+    ]
+
+
+def is_file_name_condition(condition: ast.expr) -> bool:
+    """Check if condition refers to file name column only"""
+    return isinstance(condition, (ast.Compare, ast.BoolOp)) and all(
+        node.id == CliTableColumn.FILE_NAME.value
+        for node in ast.walk(condition)
+        if isinstance(node, ast.Name)
+    )
+
+
+def join_conditions(conditions: List[ast.expr]) -> Optional[ast.expr]:
+    """Join conditions with and, None if there are no conditions"""
+    if len(conditions) == 0:
+        return None
+    if len(conditions) == 1:
+        return conditions[0]
+
+    return ast.BoolOp(op=ast.And(), values=conditions)
+
+
+def split_file_name_condition(
+    where_node: WhereNode | None,
+) -> Tuple[Optional[ast.expr], WhereNode]:
+    """
+    Take conditions on file name only out of where clause,
+    if they are joined with the rest of conditions by and
+    :param where_node: Where node of query
+    :return: File name condition and where node with remaining conditions
+    """
+    if where_node is None or where_node.condition_node is None:
+        return None, WhereNode(None)
+
+    condition = where_node.condition_node
+    conditions = (
+        condition.values
+        if isinstance(condition, ast.BoolOp) and isinstance(condition.op, ast.And)
+        else [condition]
+    )
+    return (
+        join_conditions([item for item in conditions if is_file_name_condition(item)]),
+        WhereNode(
+            join_conditions(
+                [item for item in conditions if not is_file_name_condition(item)]
+            )
+        ),
+    )
+
+
+def create_file_name_filter(
+    file_name_condition: ast.expr, pathname_length: int
+) -> Callable[[str], bool]:
+    """
+    Create filter of file paths out of file name condition
+    :param file_name_condition: Condition on file name column only
+    :param pathname_length: Amount of directories, which are left in file name column
+    :return: Filter, which tells if file path matches condition
+    """
+    predicate = transform_ast_bool_op_to_row_predicate(
+        file_name_condition, {CliTableColumn.FILE_NAME.value: 0}
+    )
+    return lambda path: predicate([trim_directories(path, pathname_length)])
+
+
+def get_order_columns(order_node: OrderNode | None) -> List[CliTableColumn]:
+    """Get columns, which are referenced by sort rules"""
+    if order_node is None:
+        return []
+
+    return [rule_node.column_name for rule_node in order_node.sort_rule_nodes]
+
+
+def merge_collection_requirements(
+    requirements: List[CollectionRequirements],
+) -> CollectionRequirements:
+    """Merge requirements, so that raw data needed by any of them is collected"""
+    return CollectionRequirements(
+        commits=any(requirement.commits for requirement in requirements),
+        line_counts=any(requirement.line_counts for requirement in requirements),
+        authors=any(requirement.authors for requirement in requirements),
+    )
+
+
+def get_file_limit(
+    where_node: WhereNode, order_node: OrderNode | None, limit_node: LimitNode | None
+) -> Optional[int]:
+    """
+    Get amount of files, which can reach the result.
+    Without filtering and sorting, limit is reached by first files of the list
+    """
+    if limit_node is None or where_node.condition_node is not None:
+        return None
+    if order_node is not None and len(order_node.sort_rule_nodes) > 0:
+        return None
+
+    return limit_node.offset + limit_node.limit
+
+
+def get_query_columns(
+    root_node: StatementNode, where_node: WhereNode | None
+) -> List[CliTableColumn]:
+    """Get columns referenced by SHOW, WHERE and ORDERBY clauses, without duplicates"""
+    columns: List[CliTableColumn] = []
+    for column in [
+        *(root_node.show_node.column_names if root_node.show_node is not None else []),
+        *get_where_columns(where_node),
+        *get_order_columns(root_node.order_node),
+    ]:
+        if column in COLUMN_REQUIREMENTS and column not in columns:
+            columns.append(column)
+
+    return columns
+
+
+def plan_query(root_node: StatementNode) -> QueryPlan:
+    """
+    Work out columns referenced by SHOW, WHERE and ORDERBY clauses
+    and raw git data needed to calculate them.
+    Conditions on file name only and limit of unsorted results are pushed down to file list
+    :param root_node: Parsed query
+    :return: Shown columns followed by columns used only for filtering/sorting,
+        with requirements for collector
+    """
+    file_name_condition, where_node = split_file_name_condition(root_node.where_node)
+    columns = get_query_columns(root_node, where_node)
+
+    return QueryPlan(
+        columns,
+        merge_collection_requirements(
+            [COLUMN_REQUIREMENTS[column] for column in columns]
+        ),
+        where_node,
+        file_name_condition,
+        get_file_limit(where_node, root_node.order_node, root_node.limit_node),
+    )
+
+
+def get_pushed_down_pathspecs(
+    query_plan: QueryPlan, file_names: List[str]
+) -> Optional[List[str]]:
+    """
+    Get files, which history scan can be limited to
+    :param query_plan: Query plan
+    :param file_names: Files, which passed file name condition and file limit of plan
+    :return: File names, None if files are not narrowed down or there are too many of them
+    """
+    is_narrowed = (
+        query_plan.file_name_condition is not None or query_plan.file_limit is not None
+    )
+    if not is_narrowed or len(file_names) > MAX_PATHSPECS:
+        return None
+
+    return file_names
+
+
+def plan_all_columns() -> QueryPlan:
+    """Plan calculation of every column for every file, so any query can be executed"""
+    columns = list(COLUMN_REQUIREMENTS)
+    return QueryPlan(
+        columns,
+        merge_collection_requirements(
+            [COLUMN_REQUIREMENTS[column] for column in columns]
+        ),
+        WhereNode(None),
+    )
+
+
+def plan_queries(root_nodes: List[StatementNode]) -> QueryPlan:
+    """
+    Plan columns and raw git data, which are shared by several queries over same files.
+    Nothing is pushed down, as every query needs its own files
+    """
+    columns: List[CliTableColumn] = []
+    for root_node in root_nodes:
+        for column in get_query_columns(root_node, root_node.where_node):
+            if column not in columns:
+                columns.append(column)
+
+    return QueryPlan(
+        columns,
+        merge_collection_requirements(
+            [COLUMN_REQUIREMENTS[column] for column in columns]
+        ),
+        WhereNode(None),
+    )
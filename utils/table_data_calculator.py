@@ -1,29 +1,55 @@
 """Builder for table"""
 
-from typing import List, Dict, Unpack, Callable
-from app_types.dataclasses import FileCommitStats
+from typing import List, Dict, Unpack, Callable, Optional
+from app_types.dataclasses import FileAggregate
 from app_types.utils import ColumnBuilderKwargs
+from collectors.commit_stats_store import CommitStatsStore, CommitStatsStoreBuilder
 from enums.table import CliTableColumn
-from features.technical_debt import calculate_deleted_added_ratio, calculate_line_count
+from features.file_aggregates import (
+    accumulate_file_columns,
+    calculate_aggregate_deleted_added_ratio,
+    calculate_aggregate_line_count,
+    get_aggregate_most_frequent_author,
+    get_aggregate_top_author_by_stat,
+)
 from utils.filesystem import trim_directories
-from utils.git_utils import get_most_frequent_author, get_top_author_by_stat
+
+
+def shorten_ratio(number: float) -> float:
+    """Shorten the float precision of ratio"""
+    return round(number, 4)
+
+
+AUTHOR_COLUMNS = {
+    CliTableColumn.MOST_FREQUENT_AUTHOR,
+    CliTableColumn.MOST_ADDED_AUTHOR,
+    CliTableColumn.MOST_DELETED_AUTHOR,
+}
 
 
 # pylint: disable = too-few-public-methods
 class TableDataCalculator:
-    """Calculator for table data"""
+    """
+    Calculator for table data.
+    Commits of each file are walked once, filling every requested metric at the same time
+    """
 
     def __init__(
         self,
         flat_file_tree: List[str],
-        files_stats: Dict[str, List[FileCommitStats]],
+        files_stats: CommitStatsStore,
         **kwargs: Unpack[ColumnBuilderKwargs],
     ):
         """Initialize calculator"""
         self._flat_file_tree = flat_file_tree
         self._files_stats = files_stats
         self._pathname_length = kwargs.get("pathname_length", 2)
-        self._stat_generators: Dict[CliTableColumn, Callable[[str], str]] = {
+        self._with_authors = True
+        self._aggregate_file_name: Optional[str] = None
+        self._aggregate = FileAggregate()
+        self._stat_generators: Dict[
+            CliTableColumn, Callable[[str], str | int | float]
+        ] = {
             CliTableColumn.FILE_NAME: self._add_file_name,
             CliTableColumn.COMMIT_AMOUNT: self._add_commit_amount,
             CliTableColumn.MOST_FREQUENT_AUTHOR: self._add_author,
@@ -33,8 +59,12 @@ class TableDataCalculator:
             CliTableColumn.LINE_COUNT: self._add_line_count,
         }
 
-    def calculate_data(self, column_names: List[CliTableColumn]) -> List[List[str]]:
-        """Calculate table's data"""
+    def calculate_data(
+        self, column_names: List[CliTableColumn]
+    ) -> List[List[str | int | float]]:
+        """Calculate table's data, numeric columns are calculated as numbers"""
+        self._with_authors = not AUTHOR_COLUMNS.isdisjoint(column_names)
+        self._aggregate_file_name = None
         rows = []
         for file_name in self._flat_file_tree:
             row = []
@@ -44,43 +74,64 @@ class TableDataCalculator:
 
         return rows
 
+    def _get_aggregate(self, file_name: str) -> FileAggregate:
+        """Get all metrics of file, they are summed up once per file"""
+        if self._aggregate_file_name != file_name:
+            self._aggregate = accumulate_file_columns(
+                self._files_stats.get_file_columns(file_name), self._with_authors
+            )
+            self._aggregate_file_name = file_name
+
+        return self._aggregate
+
     def _add_file_name(self, file_name: str) -> str:
         """Calculate file name column"""
         return trim_directories(file_name, self._pathname_length)
 
-    def _add_commit_amount(self, file_name: str) -> str:
+    def _add_commit_amount(self, file_name: str) -> int:
         """Calculate commit amount column"""
-        return str(len(self._files_stats.get(file_name, [])))
+        return self._get_aggregate(file_name).commit_count
 
     def _add_author(self, file_name: str) -> str:
         """Calculate author column"""
-        return get_most_frequent_author(self._files_stats.get(file_name, []))
+        return get_aggregate_most_frequent_author(self._get_aggregate(file_name))
 
     def _add_most_added_lines_author(self, file_name: str) -> str:
         """Calculate author of most added lines of code column"""
-        return get_top_author_by_stat(
-            self._files_stats.get(file_name, []),
-            lambda x: int(x.added_lines),
+        return get_aggregate_top_author_by_stat(
+            self._get_aggregate(file_name), lambda x: x.added_lines
         )
 
     def _add_most_deleted_lines_author(self, file_name: str) -> str:
         """Calculate author of most deleted lines of code column"""
-        return get_top_author_by_stat(
-            self._files_stats.get(file_name, []),
-            lambda x: int(x.removed_lines),
+        return get_aggregate_top_author_by_stat(
+            self._get_aggregate(file_name), lambda x: x.removed_lines
         )
 
-    def _add_delete_add_ratio(self, file_name: str) -> str:
+    def _add_delete_add_ratio(self, file_name: str) -> float:
         """Calculate deleted/added ratio column"""
-
-        def shorten_ratio(number: float) -> str:
-            """Local function to shorten the float precision"""
-            return f"{number:.4f}"
-
         return shorten_ratio(
-            calculate_deleted_added_ratio(self._files_stats.get(file_name, []))
+            calculate_aggregate_deleted_added_ratio(self._get_aggregate(file_name))
         )
 
-    def _add_line_count(self, file_name: str) -> str:
+    def _add_line_count(self, file_name: str) -> int:
         """Calculate line amount in file (from git history) column"""
-        return str(calculate_line_count(self._files_stats.get(file_name, [])))
+        return calculate_aggregate_line_count(self._get_aggregate(file_name))
+
+
+class AggregateTableDataCalculator(TableDataCalculator):
+    """Calculator for table data, which uses already summed up file stats"""
+
+    def __init__(
+        self,
+        flat_file_tree: List[str],
+        files_aggregates: Dict[str, FileAggregate],
+        **kwargs: Unpack[ColumnBuilderKwargs],
+    ):
+        """Initialize calculator"""
+        super().__init__(flat_file_tree, CommitStatsStoreBuilder().build(), **kwargs)
+        self._files_aggregates = files_aggregates
+
+    def _get_aggregate(self, file_name: str) -> FileAggregate:
+        """Get aggregate of file, empty one if file has no stats"""
+        return self._files_aggregates.get(file_name, FileAggregate())
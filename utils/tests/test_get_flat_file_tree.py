@@ -0,0 +1,66 @@
+"""Test get_flat_file_tree"""
+
+from pathlib import Path
+import pytest
+from git import Repo
+from utils.git_utils import get_flat_file_tree
+from conftest import GitTestRepo
+
+FILE_NAMES = ["README.md", "src/main.py", "src/utils/text.py", "src/utils/data.bin"]
+
+
+def _create_repo(git_repo: GitTestRepo) -> Repo:
+    """Create repository with files in nested directories and single commit"""
+    for file_name in FILE_NAMES:
+        git_repo.write_file(file_name, file_name)
+    git_repo.commit("files")
+    return Repo(git_repo.path)
+
+
+def test_whole_tree(git_repo: GitTestRepo) -> None:
+    """Test that every file is listed, when path is omitted"""
+    repo = _create_repo(git_repo)
+
+    assert get_flat_file_tree(repo.head.commit.tree) == sorted(FILE_NAMES)
+
+
+def test_sub_directory(git_repo: GitTestRepo) -> None:
+    """Test that only files of directory are listed, relative to repository"""
+    repo = _create_repo(git_repo)
+
+    assert get_flat_file_tree(
+        repo.head.commit.tree, str(Path(repo.working_dir) / "src" / "utils")
+    ) == ["src/utils/data.bin", "src/utils/text.py"]
+
+
+def test_specific_file_relative_to_current_directory(
+    git_repo: GitTestRepo, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that specific file is found from current directory"""
+    repo = _create_repo(git_repo)
+
+    monkeypatch.chdir(Path(repo.working_dir) / "src")
+
+    assert get_flat_file_tree(repo.head.commit.tree, "./main.py") == ["src/main.py"]
+
+
+def test_untracked_file(git_repo: GitTestRepo) -> None:
+    """Test that file, which exists only in working tree, is not listed"""
+    repo = _create_repo(git_repo)
+
+    (Path(repo.working_dir) / "src" / "new.py").write_text("", encoding="utf-8")
+
+    assert not get_flat_file_tree(
+        repo.head.commit.tree, str(Path(repo.working_dir) / "src" / "new.py")
+    )
+
+
+def test_file_filter(git_repo: GitTestRepo) -> None:
+    """Test that file filter is applied to repository relative paths"""
+    repo = _create_repo(git_repo)
+
+    assert get_flat_file_tree(
+        repo.head.commit.tree,
+        repo.working_dir,
+        lambda file_name: file_name.endswith(".py"),
+    ) == ["src/main.py", "src/utils/text.py"]
@@ -0,0 +1,39 @@
+"""Test get_non_text_files"""
+
+from git import Git
+from utils.git_utils import get_non_text_files, get_head_blobs
+from conftest import GitTestRepo
+
+
+def _create_repo(git_repo: GitTestRepo) -> Git:
+    """Create repository with text and binary files in single commit"""
+    git_repo.write_file("text.txt", "1\n2\n")
+    git_repo.write_file("assets/image.bin", b"\x00\x01\x02")
+    git_repo.write_file("assets/notes.md", "notes\n")
+    git_repo.commit("files")
+    return Git(git_repo.path)
+
+
+def test_binary_files_are_found(git_repo: GitTestRepo) -> None:
+    """Test that only binary files are returned and every HEAD blob is cached"""
+    git = _create_repo(git_repo)
+
+    non_text_files, blobs_cache = get_non_text_files(git, {})
+
+    assert non_text_files == ["assets/image.bin"]
+    assert blobs_cache == {
+        blob_sha: file_name == "assets/image.bin"
+        for file_name, blob_sha in get_head_blobs(git).items()
+    }
+
+
+def test_cached_blobs_are_not_checked(git_repo: GitTestRepo) -> None:
+    """Test that cached result is used for known blobs, only unknown are checked"""
+    git = _create_repo(git_repo)
+    head_blobs = get_head_blobs(git)
+    stale_blob_cache = {"0" * 40: True, head_blobs["text.txt"]: True}
+
+    non_text_files, blobs_cache = get_non_text_files(git, stale_blob_cache)
+
+    assert non_text_files == ["assets/image.bin", "text.txt"]
+    assert set(blobs_cache) == set(head_blobs.values())
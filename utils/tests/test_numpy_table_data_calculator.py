@@ -0,0 +1,56 @@
+"""Test NumpyTableDataCalculator"""
+
+import pytest
+from app_types.dataclasses import FileCommitStats
+from collectors.commit_stats_store import create_commit_stats_store
+from enums.table import CliTableColumn
+from utils.table_data_calculator import TableDataCalculator
+
+numpy_table_data_calculator = pytest.importorskip(
+    "utils.numpy_table_data_calculator", exc_type=ImportError
+)
+
+ALL_COLUMNS = [
+    CliTableColumn.FILE_NAME,
+    CliTableColumn.COMMIT_AMOUNT,
+    CliTableColumn.LINE_COUNT,
+    CliTableColumn.DELETED_ADDED_RATIO,
+    CliTableColumn.MOST_FREQUENT_AUTHOR,
+    CliTableColumn.MOST_ADDED_AUTHOR,
+    CliTableColumn.MOST_DELETED_AUTHOR,
+]
+
+
+def test_same_data_as_python_calculator() -> None:
+    """Test that every column, including author ties, matches python calculator"""
+    store = create_commit_stats_store(
+        {
+            "dir/a.py": [
+                FileCommitStats(5, 1, '"second"'),
+                FileCommitStats(0, 3, '"first"'),
+                FileCommitStats(2, 0, '"first"'),
+                FileCommitStats(3, 4, '"second"'),
+            ],
+            "dir/b.py": [],
+            "dir/c.py": [FileCommitStats(10, 0, '"third"'), FileCommitStats(1, 1, "x")],
+            "dir/d.py": [FileCommitStats(0, 0, "x"), FileCommitStats(0, 0, '"first"')],
+        }
+    )
+    flat_file_tree = ["dir/a.py", "dir/b.py", "dir/c.py", "dir/d.py", "dir/e.py"]
+
+    numpy_calculator = numpy_table_data_calculator.NumpyTableDataCalculator(
+        flat_file_tree, store, pathname_length=2
+    )
+    python_calculator = TableDataCalculator(flat_file_tree, store, pathname_length=2)
+
+    assert numpy_calculator.calculate_data(
+        ALL_COLUMNS
+    ) == python_calculator.calculate_data(ALL_COLUMNS)
+
+
+def test_empty_store() -> None:
+    """Test files without any stats"""
+    store = create_commit_stats_store({})
+    assert numpy_table_data_calculator.NumpyTableDataCalculator(
+        ["a.py"], store, pathname_length=2
+    ).calculate_data(ALL_COLUMNS) == [["a.py", 0, 0, 0.0, "-", "-", "-"]]
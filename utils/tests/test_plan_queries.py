@@ -0,0 +1,25 @@
+"""Test plan_queries"""
+
+from app_types.dataclasses import CollectionRequirements
+from enums.table import CliTableColumn
+from utils.command_option_parser import parse_option_query
+from utils.query_planner import plan_queries
+
+
+def test_columns_of_all_queries_are_merged() -> None:
+    """Test that columns and requirements of every query are planned once"""
+    plan = plan_queries(
+        [
+            parse_option_query("SHOW filename, commitcount FROM ./").value,
+            parse_option_query(
+                'SHOW commitcount FROM ./ WHERE filename == "a.py" ORDERBY daratio ASC'
+            ).value,
+        ]
+    )
+    assert plan.columns == [
+        CliTableColumn.FILE_NAME,
+        CliTableColumn.COMMIT_AMOUNT,
+        CliTableColumn.DELETED_ADDED_RATIO,
+    ]
+    assert plan.requirements == CollectionRequirements(commits=True, line_counts=True)
+    assert plan.file_name_condition is None
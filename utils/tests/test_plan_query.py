@@ -0,0 +1,65 @@
+"""Test plan_query"""
+
+from app_types.dataclasses import CollectionRequirements
+from enums.table import CliTableColumn
+from utils.command_option_parser import parse_option_query
+from utils.query_planner import plan_query
+
+
+def test_only_file_names() -> None:
+    """Test that file names do not need any git data"""
+    plan = plan_query(parse_option_query("SHOW filename FROM ./").value)
+    assert plan.columns == [CliTableColumn.FILE_NAME]
+    assert plan.requirements == CollectionRequirements()
+
+
+def test_commit_count_needs_no_line_counts() -> None:
+    """Test that commit count is collected without numstat"""
+    plan = plan_query(parse_option_query("SHOW filename, commitcount FROM ./").value)
+    assert plan.requirements == CollectionRequirements(commits=True)
+
+
+def test_filtered_and_sorted_columns_are_planned() -> None:
+    """Test that columns used only in WHERE and ORDERBY are calculated as well"""
+    plan = plan_query(
+        parse_option_query(
+            "SHOW filename FROM ./ WHERE daratio > 0.5 ORDERBY mfauthor ASC"
+        ).value
+    )
+    assert plan.columns == [
+        CliTableColumn.FILE_NAME,
+        CliTableColumn.DELETED_ADDED_RATIO,
+        CliTableColumn.MOST_FREQUENT_AUTHOR,
+    ]
+    assert plan.requirements == CollectionRequirements(
+        commits=True, line_counts=True, authors=True
+    )
+
+
+def test_file_name_condition_needs_no_git_data() -> None:
+    """Test that file name condition is pushed down and needs no git data"""
+    plan = plan_query(
+        parse_option_query('SHOW commitcount FROM ./ WHERE filename == "a.py"').value
+    )
+    assert plan.columns == [CliTableColumn.COMMIT_AMOUNT]
+    assert plan.requirements == CollectionRequirements(commits=True)
+    assert plan.file_name_condition is not None
+    assert plan.where_node.condition_node is None
+
+
+def test_limit_without_sorting_limits_files() -> None:
+    """Test that only first files are needed, when limit is not preceded by sorting"""
+    assert (
+        plan_query(
+            parse_option_query("SHOW filename FROM ./ LIMIT 10 OFFSET 5").value
+        ).file_limit
+        == 15
+    )
+    assert (
+        plan_query(
+            parse_option_query(
+                "SHOW filename FROM ./ ORDERBY linecount ASC LIMIT 10"
+            ).value
+        ).file_limit
+        is None
+    )
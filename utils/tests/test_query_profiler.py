@@ -0,0 +1,61 @@
+"""Test QueryProfiler"""
+
+import os
+import pstats
+from utils.profiler import QueryProfiler, record_git_process, record_git_output
+
+
+def test_disabled_profiler() -> None:
+    """Disabled profiler does not measure stages."""
+    profiler = QueryProfiler()
+    with profiler.stage("Calculating data") as stage_profile:
+        record_git_process()
+        stage_profile.rows = 10
+
+    assert not profiler.stages
+
+
+def test_stage_git_usage_and_rows() -> None:
+    """Only git usage inside of stage is counted."""
+    record_git_process()
+    profiler = QueryProfiler(enabled=True)
+    with profiler.stage("Gathering Git information") as stage_profile:
+        record_git_process()
+        record_git_output(100)
+        record_git_output(28)
+        stage_profile.rows = 3
+    with profiler.stage("Calculating data"):
+        pass
+
+    assert [stage.name for stage in profiler.stages] == [
+        "Gathering Git information",
+        "Calculating data",
+    ]
+    assert profiler.stages[0].git_io.processes == 1
+    assert profiler.stages[0].git_io.bytes_read == 128
+    assert profiler.stages[0].rows == 3
+    assert profiler.stages[1].git_io.processes == 0
+    assert all(
+        stage.wall_time >= 0 and stage.cpu_time >= 0 for stage in profiler.stages
+    )
+
+
+def test_report_has_row_per_stage() -> None:
+    """Report has header and line for every stage."""
+    profiler = QueryProfiler(enabled=True)
+    with profiler.stage("Calculating data"):
+        pass
+
+    lines = profiler.format_report().splitlines()
+    assert len(lines) == 2 and lines[1].startswith("Calculating data")
+
+
+def test_dump_stats(tmp_path) -> None:
+    """cProfile stats are written to output path and can be loaded."""
+    output_path = os.path.join(tmp_path, "profile.pstats")
+    profiler = QueryProfiler(enabled=True, output_path=output_path)
+    with profiler.stage("Calculating data"):
+        sorted(range(1000), reverse=True)
+    profiler.dump_stats()
+
+    assert pstats.Stats(output_path).total_calls > 0
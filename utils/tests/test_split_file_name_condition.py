@@ -0,0 +1,39 @@
+"""Test split_file_name_condition"""
+
+import ast
+from query_option_parser.parser import parse_where_statement
+from utils.query_planner import split_file_name_condition
+
+
+def test_file_name_conditions_taken_out_of_and() -> None:
+    """Test that file name conditions joined by and are separated from the rest"""
+    file_name_condition, where_node = split_file_name_condition(
+        parse_where_statement(
+            'filename == "a.py" and linecount > 10 and '
+            '(filename == "b.py" or filename == "c.py")'
+        ).value
+    )
+    assert ast.unparse(file_name_condition) == (
+        "filename == 'a.py' and (filename == 'b.py' or filename == 'c.py')"
+    )
+    assert ast.unparse(where_node.condition_node) == "linecount > 10"
+
+
+def test_file_name_condition_mixed_by_or_is_kept() -> None:
+    """Test that file name condition joined by or with other columns is not taken out"""
+    file_name_condition, where_node = split_file_name_condition(
+        parse_where_statement('filename == "a.py" or linecount > 10').value
+    )
+    assert file_name_condition is None
+    assert ast.unparse(where_node.condition_node) == (
+        "filename == 'a.py' or linecount > 10"
+    )
+
+
+def test_only_file_name_condition() -> None:
+    """Test that where node is left empty, when all conditions are on file name"""
+    file_name_condition, where_node = split_file_name_condition(
+        parse_where_statement('filename != "a.py"').value
+    )
+    assert ast.unparse(file_name_condition) == "filename != 'a.py'"
+    assert where_node.condition_node is None
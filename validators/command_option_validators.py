@@ -1,16 +1,23 @@
 """Command option validators"""
 
 import sys
-from typing import Dict, List
-from pydash import is_empty
+from typing import Dict, List, Type, TYPE_CHECKING
 
-from app_types.protocols import CliTable
 from app_types.result import ResultValidationError, ResultUnion
-from app_types.validation_errors import InvalidTableLibraryError
+from app_types.validation_errors import (
+    InvalidTableLibraryError,
+    InvalidCollectorError,
+    InvalidCalculatorError,
+    InvalidQueryBackendError,
+)
+
+if TYPE_CHECKING:
+    from app_types.protocols import CliTable, StatsCollector, QueryExecutor
+    from utils.table_data_calculator import TableDataCalculator
 
 
 def assert_correct_table_library(
-    table_lib_result: ResultUnion[CliTable, InvalidTableLibraryError]
+    table_lib_result: ResultUnion["CliTable", InvalidTableLibraryError]
 ) -> None:
     """Assert that table list result is successful"""
     match table_lib_result:
@@ -20,6 +27,39 @@ def assert_correct_table_library(
             sys.exit()
 
 
+def assert_correct_collector(
+    collector_result: ResultUnion["StatsCollector", InvalidCollectorError]
+) -> None:
+    """Assert that collector result is successful"""
+    match collector_result:
+        case ResultValidationError():
+            for error in collector_result.validation_error:
+                print(error.message)
+            sys.exit()
+
+
+def assert_correct_calculator(
+    calculator_result: ResultUnion[Type["TableDataCalculator"], InvalidCalculatorError]
+) -> None:
+    """Assert that calculator result is successful"""
+    match calculator_result:
+        case ResultValidationError():
+            for error in calculator_result.validation_error:
+                print(error.message)
+            sys.exit()
+
+
+def assert_correct_query_backend(
+    query_backend_result: ResultUnion["QueryExecutor", InvalidQueryBackendError]
+) -> None:
+    """Assert that query backend result is successful"""
+    match query_backend_result:
+        case ResultValidationError():
+            for error in query_backend_result.validation_error:
+                print(error.message)
+            sys.exit()
+
+
 def assert_query_exists_for_execution(query_name: str, queries: Dict[str, str]) -> None:
     """Assert that query exists for execution"""
     if query_name not in queries:
@@ -36,7 +76,7 @@ def assert_only_single_terminating_option_provided(
         validation_messages.append("List all non-text files.")
     if kwargs.get("list_queries", False):
         validation_messages.append("List all stored queries.")
-    if not is_empty(kwargs.get("remove_query", None)):
+    if kwargs.get("remove_query", None):
         validation_messages.append("Remove the stored query.")
 
     if len(validation_messages) > 1: